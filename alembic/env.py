@@ -32,6 +32,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -40,18 +41,42 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # One transaction per revision: migrations that build indexes CONCURRENTLY
+    # use op.get_context().autocommit_block(), which commits the current
+    # transaction — that must be this revision's, not the whole upgrade run.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
+def _migration_server_settings() -> dict[str, str]:
+    """Session settings for index builds and table rewrites.
+
+    Set once on the migration connection, so revisions that copy a table or
+    build indexes don't each hard-code their own values.
+    """
+    server_settings: dict[str, str] = {}
+    if settings.migration_maintenance_work_mem:
+        server_settings["maintenance_work_mem"] = settings.migration_maintenance_work_mem
+    if settings.migration_max_parallel_maintenance_workers is not None:
+        server_settings["max_parallel_maintenance_workers"] = str(
+            settings.migration_max_parallel_maintenance_workers
+        )
+    return server_settings
+
+
 async def run_async_migrations() -> None:
     """Run migrations in async mode."""
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args={"server_settings": _migration_server_settings()},
     )
 
     async with connectable.connect() as connection:
@@ -241,7 +241,7 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_table("contact_email_links")
-    op.drop_table("contact_updates")
-    op.drop_table("contacts")
-    op.drop_table("companies")
+    op.execute("DROP TABLE IF EXISTS contact_email_links CASCADE")
+    op.execute("DROP TABLE IF EXISTS contact_updates CASCADE")
+    op.execute("DROP TABLE IF EXISTS contacts CASCADE")
+    op.execute("DROP TABLE IF EXISTS companies CASCADE")
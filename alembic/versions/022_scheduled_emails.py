@@ -102,8 +102,4 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_index("ix_scheduled_emails_scheduled_at_status", table_name="scheduled_emails")
-    op.drop_index("ix_scheduled_emails_scheduled_at", table_name="scheduled_emails")
-    op.drop_index("ix_scheduled_emails_mail_account_id", table_name="scheduled_emails")
-    op.drop_index("ix_scheduled_emails_tenant_id", table_name="scheduled_emails")
-    op.drop_table("scheduled_emails")
+    op.execute("DROP TABLE IF EXISTS scheduled_emails CASCADE")
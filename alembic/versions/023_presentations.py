@@ -339,28 +339,10 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    # Drop in reverse dependency order
-    op.drop_index("ix_genruns_slide", table_name="presentation_generation_runs")
-    op.drop_index("ix_genruns_tenant_created", table_name="presentation_generation_runs")
-    op.drop_index("ix_genruns_pres", table_name="presentation_generation_runs")
-    op.drop_table("presentation_generation_runs")
-
-    op.drop_index("ix_pexports_pres_id", table_name="presentation_exports")
-    op.drop_index("ix_pexports_tenant_id", table_name="presentation_exports")
-    op.drop_table("presentation_exports")
-
-    op.drop_index("ix_passets_tenant_checksum", table_name="presentation_assets")
-    op.drop_index("ix_passets_tenant_kind", table_name="presentation_assets")
-    op.drop_index("ix_passets_pres", table_name="presentation_assets")
-    op.drop_table("presentation_assets")
-
-    op.drop_index("ix_pslides_pres_pos", table_name="presentation_slides")
-    op.drop_table("presentation_slides")
-
-    op.drop_index("ix_presentations_tenant_updated", table_name="presentations")
-    op.drop_index("ix_presentations_status", table_name="presentations")
-    op.drop_index("ix_presentations_tenant_id", table_name="presentations")
-    op.drop_table("presentations")
-
-    op.drop_index("ix_presentation_themes_tenant_id", table_name="presentation_themes")
-    op.drop_table("presentation_themes")
+    # Indexes go with their tables; IF EXISTS lets a partial downgrade be re-run
+    op.execute("DROP TABLE IF EXISTS presentation_generation_runs CASCADE")
+    op.execute("DROP TABLE IF EXISTS presentation_exports CASCADE")
+    op.execute("DROP TABLE IF EXISTS presentation_assets CASCADE")
+    op.execute("DROP TABLE IF EXISTS presentation_slides CASCADE")
+    op.execute("DROP TABLE IF EXISTS presentations CASCADE")
+    op.execute("DROP TABLE IF EXISTS presentation_themes CASCADE")
@@ -0,0 +1,150 @@
+"""Replace standalone tenant_id indexes with tenant-leading composites.
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-03-09
+
+Tables created in 015–018 each carry a single-column ix_*_tenant_id. Every
+hot query on them also filters or orders on a second column, so the planner
+ends up combining two bitmaps (or seq-scanning large tenants). Each index is
+rebuilt as a composite whose leading column is tenant_id, which still serves
+tenant-only lookups and ON DELETE CASCADE from tenants.
+
+Where a unique constraint already leads with tenant_id (user_memories,
+assistant_memories, conversation_contexts) the standalone index is dropped.
+
+All builds and drops run CONCURRENTLY in an autocommit block, so populated
+tables keep serving reads and writes while the indexes are swapped.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "036"
+down_revision: Union[str, None] = "035"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # --- mail_drafts: draft list is ordered by updated_at ---
+        op.drop_index(
+            "ix_mail_drafts_tenant_id",
+            table_name="mail_drafts",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_mail_drafts_tenant_updated",
+            "mail_drafts",
+            ["tenant_id", sa.text("updated_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+        # --- folders: list_folders orders by updated_at ---
+        op.drop_index("ix_folders_tenant_id", table_name="folders", postgresql_concurrently=True)
+        op.create_index(
+            "ix_folders_tenant_updated",
+            "folders",
+            ["tenant_id", sa.text("updated_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+        # --- memories / contexts: covered by the (tenant_id, ...) unique constraints ---
+        op.drop_index(
+            "ix_user_memories_tenant_id",
+            table_name="user_memories",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_assistant_memories_tenant_id",
+            table_name="assistant_memories",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_conversation_contexts_tenant_id",
+            table_name="conversation_contexts",
+            postgresql_concurrently=True,
+        )
+
+        # --- agent_runs: list_runs / stats filter by tenant and created_at, optionally status ---
+        op.drop_index("ix_agent_runs_status", table_name="agent_runs", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_agent_runs_tenant_id",
+            table_name="agent_runs",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_agent_runs_status",
+            "agent_runs",
+            ["tenant_id", "status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_agent_runs_tenant_created",
+            "agent_runs",
+            ["tenant_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+        # --- audit_logs / llm_traces: time-range reads are always tenant-scoped ---
+        op.drop_index(
+            "ix_audit_logs_created_at",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_tenant_id",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_tenant_created",
+            "audit_logs",
+            ["tenant_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+        op.drop_index(
+            "ix_llm_traces_created_at",
+            table_name="llm_traces",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_llm_traces_tenant_id",
+            table_name="llm_traces",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_llm_traces_tenant_created",
+            "llm_traces",
+            ["tenant_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_traces_tenant_created", table_name="llm_traces")
+    op.create_index("ix_llm_traces_tenant_id", "llm_traces", ["tenant_id"])
+    op.create_index("ix_llm_traces_created_at", "llm_traces", ["created_at"])
+
+    op.drop_index("ix_audit_logs_tenant_created", table_name="audit_logs")
+    op.create_index("ix_audit_logs_tenant_id", "audit_logs", ["tenant_id"])
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+
+    op.drop_index("ix_agent_runs_tenant_created", table_name="agent_runs")
+    op.drop_index("ix_agent_runs_status", table_name="agent_runs")
+    op.create_index("ix_agent_runs_tenant_id", "agent_runs", ["tenant_id"])
+    op.create_index("ix_agent_runs_status", "agent_runs", ["status"])
+
+    op.create_index("ix_conversation_contexts_tenant_id", "conversation_contexts", ["tenant_id"])
+    op.create_index("ix_assistant_memories_tenant_id", "assistant_memories", ["tenant_id"])
+    op.create_index("ix_user_memories_tenant_id", "user_memories", ["tenant_id"])
+
+    op.drop_index("ix_folders_tenant_updated", table_name="folders")
+    op.create_index("ix_folders_tenant_id", "folders", ["tenant_id"])
+
+    op.drop_index("ix_mail_drafts_tenant_updated", table_name="mail_drafts")
+    op.create_index("ix_mail_drafts_tenant_id", "mail_drafts", ["tenant_id"])
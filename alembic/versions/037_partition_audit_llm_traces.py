@@ -0,0 +1,149 @@
+"""Convert audit_logs and llm_traces to monthly RANGE partitions on created_at.
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-03-10
+
+Both tables are append-only and grow without bound. Partitioning by month
+lets retention detach/drop a whole partition instead of running large
+DELETEs, and time-bounded reads only touch the matching children.
+
+- The partition key must be part of the primary key: PK becomes (id, created_at).
+- ensure_monthly_partitions(parent, months_ahead, since) creates any missing
+  monthly children; the worker calls it daily (ensure_log_partitions cron).
+- Existing rows are copied into the new partitioned tables, then the legacy
+  tables are dropped. Indexes are declared on the parent after the copy and
+  cascade to every partition, current and future.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "037"
+down_revision: Union[str, None] = "036"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+ENSURE_PARTITIONS_FN = """
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent text,
+    months_ahead integer DEFAULT 3,
+    since timestamptz DEFAULT NULL
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    month_start date := date_trunc('month', coalesce(since, now()) AT TIME ZONE 'UTC')::date;
+    last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                        + make_interval(months => months_ahead))::date;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYY_MM'),
+            parent,
+            month_start::timestamp AT TIME ZONE 'UTC',
+            (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+END;
+$$
+"""
+
+AUDIT_LOGS_COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    tenant_id uuid,
+    run_id uuid,
+    user_id uuid,
+    action varchar(100) NOT NULL,
+    entity_type varchar(50),
+    entity_id uuid,
+    detail jsonb,
+    level varchar(10) NOT NULL DEFAULT 'info',
+    message text,
+    created_at timestamptz NOT NULL DEFAULT now()
+"""
+
+LLM_TRACES_COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    tenant_id uuid,
+    run_id uuid,
+    model varchar(100) NOT NULL,
+    provider varchar(50) NOT NULL,
+    prompt_tokens integer NOT NULL DEFAULT 0,
+    completion_tokens integer NOT NULL DEFAULT 0,
+    total_tokens integer NOT NULL DEFAULT 0,
+    latency_ms integer,
+    status varchar(20) NOT NULL DEFAULT 'success',
+    error_message text,
+    request_metadata jsonb,
+    created_at timestamptz NOT NULL DEFAULT now()
+"""
+
+AUDIT_LOGS_FIELDS = (
+    "id, tenant_id, run_id, user_id, action, entity_type, entity_id, detail, level, message"
+)
+LLM_TRACES_FIELDS = (
+    "id, tenant_id, run_id, model, provider, prompt_tokens, completion_tokens, "
+    "total_tokens, latency_ms, status, error_message, request_metadata"
+)
+
+
+def _partition(table: str, columns: str, fields: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+    op.execute(f"ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey")
+    op.execute(
+        f"CREATE TABLE {table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at))"
+        " PARTITION BY RANGE (created_at)"
+    )
+    op.execute(
+        f"SELECT ensure_monthly_partitions('{table}', {MONTHS_AHEAD}, "
+        f"(SELECT min(created_at) FROM {table}_legacy))"
+    )
+    op.execute(
+        f"INSERT INTO {table} ({fields}, created_at) "
+        f"SELECT {fields}, coalesce(created_at, now()) FROM {table}_legacy"
+    )
+    op.execute(f"DROP TABLE {table}_legacy")
+
+
+def _unpartition(table: str, columns: str, fields: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+    op.execute(
+        f"ALTER TABLE {table}_partitioned RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey"
+    )
+    op.execute(f"CREATE TABLE {table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id))")
+    op.execute(
+        f"INSERT INTO {table} ({fields}, created_at) "
+        f"SELECT {fields}, created_at FROM {table}_partitioned"
+    )
+    op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_PARTITIONS_FN)
+
+    _partition("audit_logs", AUDIT_LOGS_COLUMNS, AUDIT_LOGS_FIELDS)
+    op.create_index("ix_audit_logs_tenant_created", "audit_logs", ["tenant_id", sa.text("created_at DESC")])
+    op.create_index("ix_audit_logs_run_id", "audit_logs", ["run_id"])
+    op.create_index("ix_audit_logs_action", "audit_logs", ["action"])
+
+    _partition("llm_traces", LLM_TRACES_COLUMNS, LLM_TRACES_FIELDS)
+    op.create_index("ix_llm_traces_tenant_created", "llm_traces", ["tenant_id", sa.text("created_at DESC")])
+    op.create_index("ix_llm_traces_run_id", "llm_traces", ["run_id"])
+
+
+def downgrade() -> None:
+    _unpartition("llm_traces", LLM_TRACES_COLUMNS, LLM_TRACES_FIELDS)
+    op.create_index("ix_llm_traces_tenant_created", "llm_traces", ["tenant_id", sa.text("created_at DESC")])
+    op.create_index("ix_llm_traces_run_id", "llm_traces", ["run_id"])
+
+    _unpartition("audit_logs", AUDIT_LOGS_COLUMNS, AUDIT_LOGS_FIELDS)
+    op.create_index("ix_audit_logs_tenant_created", "audit_logs", ["tenant_id", sa.text("created_at DESC")])
+    op.create_index("ix_audit_logs_run_id", "audit_logs", ["run_id"])
+    op.create_index("ix_audit_logs_action", "audit_logs", ["action"])
+
+    op.execute("DROP FUNCTION IF EXISTS ensure_monthly_partitions(text, integer, timestamptz)")
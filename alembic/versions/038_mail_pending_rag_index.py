@@ -0,0 +1,48 @@
+"""Replace ix_mail_messages_not_indexed with a partial index keyed for the RAG worker.
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-03-10
+
+The old partial index only stored is_indexed, which is constant under its own
+predicate. index_unindexed_emails() filters by account, skips drafts and
+walks newest-first with a LIMIT, so the new index is keyed on
+(mail_account_id, date DESC) under the same predicate: the batch becomes a
+bounded index range read and the index only holds the pending backlog.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "038"
+down_revision: Union[str, None] = "037"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_mail_messages_not_indexed",
+            table_name="mail_messages",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_mail_messages_pending_rag",
+            "mail_messages",
+            ["mail_account_id", sa.text("date DESC")],
+            postgresql_where=sa.text("is_indexed = false AND is_draft = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mail_messages_pending_rag", table_name="mail_messages")
+    op.create_index(
+        "ix_mail_messages_not_indexed",
+        "mail_messages",
+        ["is_indexed"],
+        postgresql_where=sa.text("is_indexed = false"),
+    )
@@ -0,0 +1,90 @@
+"""Hash-partition web_cache on query_hash.
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-03-11
+
+Every cache miss inserts into the (query_hash, provider) unique index, and
+expiry cleanup has to sweep the whole table. With 16 hash partitions each
+lookup is pruned to a single child with a small index, and expired rows can
+be purged one partition at a time (see purge_expired_web_cache).
+
+The partition key must be part of the primary key: PK becomes (id, query_hash).
+Only non-expired rows are carried over; the rest would be refetched anyway.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "039"
+down_revision: Union[str, None] = "038"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    query_hash varchar(64) NOT NULL,
+    query text NOT NULL,
+    provider varchar(32) NOT NULL,
+    results_json jsonb NOT NULL,
+    result_count integer NOT NULL DEFAULT 0,
+    fetched_at timestamptz NOT NULL DEFAULT now(),
+    expires_at timestamptz NOT NULL
+"""
+
+FIELDS = "id, query_hash, query, provider, results_json, result_count, fetched_at, expires_at"
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE web_cache RENAME TO web_cache_legacy")
+    op.execute("ALTER TABLE web_cache_legacy RENAME CONSTRAINT web_cache_pkey TO web_cache_legacy_pkey")
+    op.drop_index("ix_web_cache_lookup", table_name="web_cache_legacy")
+    op.drop_index("ix_web_cache_expires_at", table_name="web_cache_legacy")
+
+    op.execute(
+        f"CREATE TABLE web_cache ({COLUMNS}, CONSTRAINT web_cache_pkey PRIMARY KEY (id, query_hash))"
+        " PARTITION BY HASH (query_hash)"
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE web_cache_p{remainder} PARTITION OF web_cache "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    op.execute(
+        f"INSERT INTO web_cache ({FIELDS}) "
+        f"SELECT {FIELDS} FROM web_cache_legacy WHERE expires_at > now()"
+    )
+    op.execute("DROP TABLE web_cache_legacy")
+
+    op.create_index(
+        "ix_web_cache_lookup",
+        "web_cache",
+        ["query_hash", "provider"],
+        unique=True,
+    )
+    op.create_index("ix_web_cache_expires_at", "web_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE web_cache RENAME TO web_cache_partitioned")
+    op.execute(
+        "ALTER TABLE web_cache_partitioned RENAME CONSTRAINT web_cache_pkey TO web_cache_partitioned_pkey"
+    )
+    op.drop_index("ix_web_cache_lookup", table_name="web_cache_partitioned")
+    op.drop_index("ix_web_cache_expires_at", table_name="web_cache_partitioned")
+
+    op.execute(f"CREATE TABLE web_cache ({COLUMNS}, CONSTRAINT web_cache_pkey PRIMARY KEY (id))")
+    op.execute(f"INSERT INTO web_cache ({FIELDS}) SELECT {FIELDS} FROM web_cache_partitioned")
+    op.execute("DROP TABLE web_cache_partitioned")
+
+    op.create_index(
+        "ix_web_cache_lookup",
+        "web_cache",
+        ["query_hash", "provider"],
+        unique=True,
+    )
+    op.create_index("ix_web_cache_expires_at", "web_cache", ["expires_at"])
@@ -0,0 +1,46 @@
+"""Lead ix_folder_items_item with item_id; drop the redundant folder_id index.
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-03-11
+
+"Which folders contain this item?" filters on item_id (item_type has a
+handful of values), so the selective column now leads. folder_id lookups and
+the ON DELETE CASCADE from folders are already served by the leading column
+of uq_folder_items_folder_type_id.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "040"
+down_revision: Union[str, None] = "039"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_folder_items_item",
+            table_name="folder_items",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_folder_items_item",
+            "folder_items",
+            ["item_id", "item_type"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_folder_items_folder_id",
+            table_name="folder_items",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_folder_items_folder_id", "folder_items", ["folder_id"])
+    op.drop_index("ix_folder_items_item", table_name="folder_items")
+    op.create_index("ix_folder_items_item", "folder_items", ["item_type", "item_id"])
@@ -0,0 +1,39 @@
+"""Drop standalone assistant_id indexes on assistant_memories / conversation_contexts.
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-03-12
+
+Every read of these tables is tenant-scoped and goes through the
+(tenant_id, assistant_id) / (tenant_id, conversation_id) unique constraints.
+The assistant_id indexes only added write cost; the one remaining user is
+ON DELETE CASCADE from assistants, a rare operation on small tables.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "041"
+down_revision: Union[str, None] = "040"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_assistant_memories_assistant_id",
+            table_name="assistant_memories",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_conversation_contexts_assistant_id",
+            table_name="conversation_contexts",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_conversation_contexts_assistant_id", "conversation_contexts", ["assistant_id"])
+    op.create_index("ix_assistant_memories_assistant_id", "assistant_memories", ["assistant_id"])
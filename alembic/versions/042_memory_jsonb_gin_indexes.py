@@ -0,0 +1,49 @@
+"""GIN indexes on memory / conversation-context JSONB columns.
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-03-12
+
+Containment lookups (@>) on memory shards are always tenant-scoped, so each
+index is a multi-column GIN over (tenant_id, <jsonb> jsonb_path_ops).
+btree_gin provides the GIN operator class for the uuid column; jsonb_path_ops
+is roughly half the size of the default jsonb_ops and answers @> in one probe.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "042"
+down_revision: Union[str, None] = "041"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GIN_INDEXES = [
+    ("ix_user_memories_raw_gin", "user_memories", "raw_json"),
+    ("ix_assistant_memories_raw_gin", "assistant_memories", "raw_json"),
+    ("ix_conversation_contexts_constraints_gin", "conversation_contexts", "constraints"),
+    ("ix_conversation_contexts_decisions_gin", "conversation_contexts", "decisions"),
+    ("ix_conversation_contexts_open_questions_gin", "conversation_contexts", "open_questions"),
+    ("ix_conversation_contexts_facts_gin", "conversation_contexts", "facts"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        for name, table, column in GIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["tenant_id", column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
+    # btree_gin is left installed: other objects may depend on it.
@@ -0,0 +1,76 @@
+"""Store web_cache.query_hash as raw 32-byte SHA-256 (bytea) instead of hex text.
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-03-13
+
+Halves the key width in the lookup index and in every comparison. query_hash
+is the HASH partition key, whose type cannot be altered in place, so the
+partitioned table is rebuilt and live rows are copied with decode(..., 'hex').
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "043"
+down_revision: Union[str, None] = "042"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    query_hash {hash_type} NOT NULL,
+    query text NOT NULL,
+    provider varchar(32) NOT NULL,
+    results_json jsonb NOT NULL,
+    result_count integer NOT NULL DEFAULT 0,
+    fetched_at timestamptz NOT NULL DEFAULT now(),
+    expires_at timestamptz NOT NULL
+"""
+
+FIELDS = "id, query, provider, results_json, result_count, fetched_at, expires_at"
+
+
+def _rebuild(hash_type: str, hash_expr: str) -> None:
+    op.execute("ALTER TABLE web_cache RENAME TO web_cache_old")
+    op.execute("ALTER TABLE web_cache_old RENAME CONSTRAINT web_cache_pkey TO web_cache_old_pkey")
+    for remainder in range(PARTITIONS):
+        op.execute(f"ALTER TABLE web_cache_p{remainder} RENAME TO web_cache_old_p{remainder}")
+    op.drop_index("ix_web_cache_lookup", table_name="web_cache_old")
+    op.drop_index("ix_web_cache_expires_at", table_name="web_cache_old")
+
+    columns = COLUMNS.format(hash_type=hash_type)
+    op.execute(
+        f"CREATE TABLE web_cache ({columns}, CONSTRAINT web_cache_pkey PRIMARY KEY (id, query_hash))"
+        " PARTITION BY HASH (query_hash)"
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE web_cache_p{remainder} PARTITION OF web_cache "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    op.execute(
+        f"INSERT INTO web_cache (query_hash, {FIELDS}) "
+        f"SELECT {hash_expr}, {FIELDS} FROM web_cache_old WHERE expires_at > now()"
+    )
+    op.execute("DROP TABLE web_cache_old")
+
+    op.create_index(
+        "ix_web_cache_lookup",
+        "web_cache",
+        ["query_hash", "provider"],
+        unique=True,
+    )
+    op.create_index("ix_web_cache_expires_at", "web_cache", ["expires_at"])
+
+
+def upgrade() -> None:
+    _rebuild("bytea", "decode(query_hash, 'hex')")
+
+
+def downgrade() -> None:
+    _rebuild("varchar(64)", "encode(query_hash, 'hex')")
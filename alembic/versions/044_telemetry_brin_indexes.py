@@ -0,0 +1,55 @@
+"""BRIN indexes on created_at for append-only telemetry tables.
+
+Revision ID: 044
+Revises: 043
+Create Date: 2026-03-13
+
+audit_logs, llm_traces and agent_runs are inserted in created_at order, so
+physical position tracks created_at closely. A BRIN index stays a few dozen
+kilobytes regardless of row count and gives cross-tenant range scans (stats
+jobs, cleanup) coarse block pruning; the tenant-scoped (tenant_id, created_at)
+B-trees from 036/037 remain the primary access path for user-facing reads.
+
+pages_per_range=16 keeps pruning tight on the small recent partitions, and
+autosummarize lets autovacuum summarize newly filled ranges as they close
+instead of leaving the tail unsummarized (always scanned) until VACUUM.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "044"
+down_revision: Union[str, None] = "043"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BRIN_TABLES = ("audit_logs", "llm_traces", "agent_runs")
+# CREATE INDEX CONCURRENTLY is not supported on partitioned parents (037).
+PARTITIONED_TABLES = ("audit_logs", "llm_traces")
+
+
+def _create_brin(table: str, *, concurrently: bool = False) -> None:
+    op.create_index(
+        f"ix_{table}_created_at_brin",
+        table,
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        postgresql_concurrently=concurrently,
+    )
+
+
+def upgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        _create_brin(table)
+
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            if table not in PARTITIONED_TABLES:
+                _create_brin(table, concurrently=True)
+
+
+def downgrade() -> None:
+    for table in reversed(BRIN_TABLES):
+        op.drop_index(f"ix_{table}_created_at_brin", table_name=table)
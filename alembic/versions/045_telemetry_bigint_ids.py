@@ -0,0 +1,46 @@
+"""Switch audit_logs / llm_traces primary keys from UUID v4 to sequential bigint.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-03-14
+
+Random UUIDs scatter every insert across the primary-key B-tree. Neither
+table's id is referenced anywhere else, so both move to a bigint fed by a
+sequence: inserts append to the right-most leaf and the key is half the size.
+
+A sequence default is used rather than GENERATED AS IDENTITY because adding
+an identity column to a partitioned table is only supported from PG 17.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "045"
+down_revision: Union[str, None] = "044"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("audit_logs", "llm_traces")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"CREATE SEQUENCE {table}_id_seq AS bigint")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN id")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN id bigint NOT NULL DEFAULT nextval('{table}_id_seq')"
+        )
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN id")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN id uuid NOT NULL DEFAULT gen_random_uuid()"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)")
@@ -0,0 +1,86 @@
+"""Fold conversation_contexts list columns into a single structured JSONB document.
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-03-16
+
+constraints / decisions / open_questions / facts were four JSONB columns that
+are always read together and rewritten together by the memory worker. One
+document means one TOAST pointer and one detoast per read, and a single GIN
+index instead of four.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "046"
+down_revision: Union[str, None] = "045"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FIELDS = ("constraints", "decisions", "open_questions", "facts")
+
+EMPTY_STRUCTURED = (
+    "'{\"constraints\": [], \"decisions\": [], \"open_questions\": [], \"facts\": []}'::jsonb"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "conversation_contexts",
+        sa.Column(
+            "structured",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text(EMPTY_STRUCTURED),
+        ),
+    )
+    op.execute(
+        "UPDATE conversation_contexts SET structured = jsonb_build_object("
+        + ", ".join(f"'{f}', coalesce({f}, '[]'::jsonb)" for f in FIELDS)
+        + ")"
+    )
+
+    for field in FIELDS:
+        op.drop_index(f"ix_conversation_contexts_{field}_gin", table_name="conversation_contexts")
+        op.drop_column("conversation_contexts", field)
+
+    op.create_index(
+        "ix_conversation_contexts_structured_gin",
+        "conversation_contexts",
+        ["tenant_id", "structured"],
+        postgresql_using="gin",
+        postgresql_ops={"structured": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conversation_contexts_structured_gin", table_name="conversation_contexts")
+
+    for field in FIELDS:
+        op.add_column(
+            "conversation_contexts",
+            sa.Column(
+                field,
+                postgresql.JSONB(),
+                nullable=True,
+                server_default=sa.text("'[]'::jsonb"),
+            ),
+        )
+    op.execute(
+        "UPDATE conversation_contexts SET "
+        + ", ".join(f"{f} = coalesce(structured -> '{f}', '[]'::jsonb)" for f in FIELDS)
+    )
+    for field in FIELDS:
+        op.create_index(
+            f"ix_conversation_contexts_{field}_gin",
+            "conversation_contexts",
+            ["tenant_id", field],
+            postgresql_using="gin",
+            postgresql_ops={field: "jsonb_path_ops"},
+        )
+
+    op.drop_column("conversation_contexts", "structured")
@@ -0,0 +1,54 @@
+"""Covering columns on ix_agent_runs_status; partial index for in-flight runs.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-03-16
+
+- ix_agent_runs_status keeps its (tenant_id, status, created_at DESC) key and
+  INCLUDEs the columns dashboards read, so "runs in status X for this tenant"
+  is answered by an index-only scan.
+- ix_agent_runs_in_flight only holds pending/running rows; the stuck-run
+  watchdog (find_stuck_runs: status = 'running' AND started_at < ?) scans it
+  instead of the whole table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "047"
+down_revision: Union[str, None] = "046"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_INCLUDE = ["assistant_id", "conversation_id", "tokens_input", "tokens_output", "started_at"]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_agent_runs_status", table_name="agent_runs", postgresql_concurrently=True)
+        op.create_index(
+            "ix_agent_runs_status",
+            "agent_runs",
+            ["tenant_id", "status", sa.text("created_at DESC")],
+            postgresql_include=STATUS_INCLUDE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_agent_runs_in_flight",
+            "agent_runs",
+            ["started_at"],
+            postgresql_where=sa.text("status IN ('pending', 'running')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agent_runs_in_flight", table_name="agent_runs")
+    op.drop_index("ix_agent_runs_status", table_name="agent_runs")
+    op.create_index(
+        "ix_agent_runs_status",
+        "agent_runs",
+        ["tenant_id", "status", sa.text("created_at DESC")],
+    )
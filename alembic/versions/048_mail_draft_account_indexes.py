@@ -0,0 +1,68 @@
+"""Fold mail_drafts / email_draft_bundles FK indexes into query-shaped composites.
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-03-16
+
+- mail_drafts: ix_mail_drafts_mail_account_id and ix_mail_drafts_updated_at
+  (mail_account_id, updated_at) become one (mail_account_id, updated_at DESC)
+  index. It backs the mail_accounts ON DELETE CASCADE and the composer's
+  draft list (account + tenant, newest first); tenant-wide listing and the
+  tenant cascade stay on ix_mail_drafts_tenant_updated from 036.
+- email_draft_bundles: ix_email_draft_bundles_tenant_id becomes
+  (tenant_id, conversation_id, created_at DESC) for per-conversation lookups.
+
+folder_items.folder_id needs nothing here: uq_folder_items_folder_type_id
+leads with it (040 already dropped the redundant standalone index).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "048"
+down_revision: Union[str, None] = "047"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_mail_drafts_account_updated",
+            "mail_drafts",
+            ["mail_account_id", sa.text("updated_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_mail_drafts_updated_at",
+            table_name="mail_drafts",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_mail_drafts_mail_account_id",
+            table_name="mail_drafts",
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            "ix_email_draft_bundles_conversation",
+            "email_draft_bundles",
+            ["tenant_id", "conversation_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_email_draft_bundles_tenant_id",
+            table_name="email_draft_bundles",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_email_draft_bundles_tenant_id", "email_draft_bundles", ["tenant_id"])
+    op.drop_index("ix_email_draft_bundles_conversation", table_name="email_draft_bundles")
+
+    op.create_index("ix_mail_drafts_mail_account_id", "mail_drafts", ["mail_account_id"])
+    op.create_index("ix_mail_drafts_updated_at", "mail_drafts", ["mail_account_id", "updated_at"])
+    op.drop_index("ix_mail_drafts_account_updated", table_name="mail_drafts")
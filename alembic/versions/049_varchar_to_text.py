@@ -0,0 +1,71 @@
+"""Convert length-capped VARCHAR columns from 015–020 to TEXT.
+
+Revision ID: 049
+Revises: 048
+Create Date: 2026-03-17
+
+None of these caps is a domain rule (where one matters, e.g. folder names,
+the Pydantic schemas already enforce it). Postgres stores varchar(n) and text
+identically, so the only effect of the cap is a length check on every write
+and an ALTER the day a value outgrows it. varchar -> text is binary-coercible, so each ALTER is a catalog-only
+change (no table rewrite, no index rebuild).
+
+Closed sets (status, level, item_type, profile, provider) also become TEXT;
+like conversations.scope they are constrained with CHECKs rather than native
+ENUMs, which need ALTER TYPE to grow. folders.color keeps varchar(7): that
+length is the #RRGGBB format.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "049"
+down_revision: Union[str, None] = "048"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, previous length, nullable)
+COLUMNS = [
+    ("mail_drafts", "subject", 1000, True),
+    ("folders", "name", 255, False),
+    ("folder_items", "item_type", 20, False),
+    ("folder_items", "item_id", 255, False),
+    ("email_draft_bundles", "subject", 1000, True),
+    ("email_draft_bundles", "tone", 50, True),
+    ("assistants", "agent_profile", 20, False),
+    ("agent_runs", "profile", 20, False),
+    ("agent_runs", "status", 20, False),
+    ("agent_runs", "error_code", 50, True),
+    ("audit_logs", "action", 100, False),
+    ("audit_logs", "entity_type", 50, True),
+    ("audit_logs", "level", 10, False),
+    ("llm_traces", "model", 100, False),
+    ("llm_traces", "provider", 50, False),
+    ("llm_traces", "status", 20, False),
+    ("web_cache", "provider", 32, False),
+    ("chunks", "source_type", 20, True),
+]
+
+
+def upgrade() -> None:
+    for table, column, length, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=sa.String(length),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    for table, column, length, nullable in reversed(COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length),
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+        )
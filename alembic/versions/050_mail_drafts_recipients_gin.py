@@ -0,0 +1,38 @@
+"""GIN index for recipient containment lookups on mail_drafts.
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-03-18
+
+to_recipients stays JSONB: each entry carries a display name next to the
+address ([{"name": "...", "email": "..."}]) and the composer round-trips both,
+so a flat TEXT[] of addresses would lose data. A (tenant_id, to_recipients
+jsonb_path_ops) GIN answers
+    tenant_id = :t AND to_recipients @> '[{"email": "alice@x.com"}]'
+in one probe, same layout as the memory indexes in 042 (btree_gin).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "050"
+down_revision: Union[str, None] = "049"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_mail_drafts_recipients_gin",
+            "mail_drafts",
+            ["tenant_id", "to_recipients"],
+            postgresql_using="gin",
+            postgresql_ops={"to_recipients": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mail_drafts_recipients_gin", table_name="mail_drafts")
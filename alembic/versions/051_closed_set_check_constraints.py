@@ -0,0 +1,75 @@
+"""CHECK constraints on closed-set TEXT columns.
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-03-19
+
+agent_runs.status, folder_items.item_type, audit_logs.level and
+web_cache.provider only ever hold a handful of values (AgentRunStatus, the
+folder item Literal, the audit levels, web_search._PROVIDERS). Declaring the
+domain rejects typos at write time and gives the planner constant-folding for
+predicates outside it.
+
+On the plain tables the constraint is added NOT VALID and validated in a
+separate autocommit statement, so the full-table check runs under SHARE
+UPDATE EXCLUSIVE instead of blocking writes. audit_logs and web_cache are partitioned and take
+the constraint directly. ANALYZE refreshes statistics afterwards.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "051"
+down_revision: Union[str, None] = "050"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, condition, partitioned)
+CHECKS = [
+    (
+        "ck_agent_runs_status",
+        "agent_runs",
+        "status IN ('pending', 'running', 'completed', 'failed', 'aborted', 'timeout')",
+        False,
+    ),
+    (
+        "ck_folder_items_item_type",
+        "folder_items",
+        "item_type IN ('conversation', 'document', 'email_thread', 'presentation', 'upload')",
+        False,
+    ),
+    (
+        "ck_audit_logs_level",
+        "audit_logs",
+        "level IN ('debug', 'info', 'warn', 'error')",
+        True,
+    ),
+    (
+        "ck_web_cache_provider",
+        "web_cache",
+        "provider IN ('brave', 'serper', 'tavily')",
+        True,
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, condition, partitioned in CHECKS:
+        if partitioned:
+            op.create_check_constraint(name, table, condition)
+
+    # Autocommit so the ADD's ACCESS EXCLUSIVE lock is released before the scan
+    with op.get_context().autocommit_block():
+        for name, table, condition, partitioned in CHECKS:
+            if not partitioned:
+                op.create_check_constraint(name, table, condition, postgresql_not_valid=True)
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+        for _name, table, _condition, _partitioned in CHECKS:
+            op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    for name, table, _condition, _partitioned in reversed(CHECKS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,51 @@
+"""Extended statistics on correlated filter columns.
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-03-20
+
+The planner multiplies per-column selectivities, which underestimates rows
+when columns are correlated:
+- folder_items(folder_id, item_type): folders are mostly single-type.
+- agent_runs(tenant_id, assistant_id, status): assistant_id implies
+  tenant_id, and most tenants run one or two assistants.
+
+Functional dependencies correct the combined WHERE estimates (list_runs'
+tenant + status filter, folder contents by type); ndistinct corrects
+grouping cardinalities over the same columns. agent_runs gets a larger
+statistics target since (tenant, assistant) has high cardinality.
+Autovacuum's ANALYZE keeps both objects current.
+
+web_cache(query_hash, provider) is left out: query_hash is near-unique, so
+there is no correlation to capture, and autovacuum never analyzes the
+partitioned parent.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "052"
+down_revision: Union[str, None] = "051"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE STATISTICS IF NOT EXISTS stx_folder_items_folder_type (dependencies, ndistinct) "
+        "ON folder_id, item_type FROM folder_items"
+    )
+    op.execute(
+        "CREATE STATISTICS IF NOT EXISTS stx_agent_runs_tenant_assistant_status "
+        "(dependencies, ndistinct) ON tenant_id, assistant_id, status FROM agent_runs"
+    )
+    op.execute("ALTER STATISTICS stx_agent_runs_tenant_assistant_status SET STATISTICS 1000")
+
+    op.execute("ANALYZE folder_items")
+    op.execute("ANALYZE agent_runs")
+
+
+def downgrade() -> None:
+    op.execute("DROP STATISTICS IF EXISTS stx_agent_runs_tenant_assistant_status")
+    op.execute("DROP STATISTICS IF EXISTS stx_folder_items_folder_type")
@@ -0,0 +1,40 @@
+"""Drop gen_random_uuid() defaults where the models now generate UUIDv7 ids.
+
+Revision ID: 053
+Revises: 052
+Create Date: 2026-03-21
+
+mail_drafts, email_draft_bundles, folders, folder_items, agent_runs and
+web_cache ids now come from app.database.uuid7(): time-ordered, so new rows
+append to the right edge of the primary-key B-tree instead of landing on a
+random leaf. Removing the server default makes a missing id fail loudly
+rather than silently reintroducing random v4 keys. Existing ids are kept.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "053"
+down_revision: Union[str, None] = "052"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "mail_drafts",
+    "email_draft_bundles",
+    "folders",
+    "folder_items",
+    "agent_runs",
+    "web_cache",
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
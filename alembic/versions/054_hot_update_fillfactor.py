@@ -0,0 +1,41 @@
+"""fillfactor=70 on memory / conversation-context tables.
+
+Revision ID: 054
+Revises: 053
+Create Date: 2026-03-22
+
+These rows are rewritten in place far more often than they are inserted:
+compression passes set compressed_text / compressed_token_count, and every
+turn bumps conversation_contexts.message_count or summary_text. None of
+those columns is indexed, so with free space on the page the new version is
+a heap-only tuple and no index is touched.
+
+agent_runs and mail_drafts are left at 100: every agent_runs update changes
+status (leading column of ix_agent_runs_status) and every draft save
+changes updated_at (in both draft list indexes), so their updates can never
+be HOT and the reserved space would only bloat the heap.
+
+The setting applies to newly written pages; existing pages pick it up as
+they are rewritten.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "054"
+down_revision: Union[str, None] = "053"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("user_memories", "assistant_memories", "conversation_contexts")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,32 @@
+"""Drop ix_scheduled_emails_scheduled_at (prefix of the composite).
+
+Revision ID: 055
+Revises: 054
+Create Date: 2026-03-23
+
+ix_scheduled_emails_scheduled_at_status (scheduled_at, status) from 022
+leads with scheduled_at, so it already serves every scan the single-column
+index could. Dropping it removes one index write per insert/status update.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "055"
+down_revision: Union[str, None] = "054"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_scheduled_emails_scheduled_at",
+            table_name="scheduled_emails",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_scheduled_emails_scheduled_at", "scheduled_emails", ["scheduled_at"])
@@ -0,0 +1,47 @@
+"""Partial index on pending scheduled emails.
+
+Revision ID: 056
+Revises: 055
+Create Date: 2026-03-24
+
+send_scheduled_emails scans status = 'pending' AND scheduled_at <= now()
+ORDER BY scheduled_at. Sent, failed and cancelled rows accumulate forever
+while only a handful are pending, so ix_scheduled_emails_scheduled_at_status
+(scheduled_at, status) keeps growing with rows the dispatcher never wants.
+ix_scheduled_emails_due indexes scheduled_at for pending rows only.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "056"
+down_revision: Union[str, None] = "055"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_scheduled_emails_due",
+            "scheduled_emails",
+            ["scheduled_at"],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_scheduled_emails_scheduled_at_status",
+            table_name="scheduled_emails",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_scheduled_emails_scheduled_at_status",
+        "scheduled_emails",
+        ["scheduled_at", "status"],
+    )
+    op.drop_index("ix_scheduled_emails_due", table_name="scheduled_emails")
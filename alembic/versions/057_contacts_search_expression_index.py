@@ -0,0 +1,72 @@
+"""Replace the stored contacts.search_vector column with an expression index.
+
+Revision ID: 057
+Revises: 056
+Create Date: 2026-03-25
+
+search_vector was a GENERATED ... STORED tsvector: every contact row carried
+its full-text document in the heap, roughly doubling row width for scans
+that never search. ix_contacts_search indexes the same weighted expression
+directly; ContactService queries it through contact_search_vector, which
+must stay identical to the indexed expression for the planner to use it.
+
+The index is built with french_unaccent, a copy of the french configuration
+that folds accents first, so "helene" finds "Hélène" and vice versa.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "057"
+down_revision: Union[str, None] = "056"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _search_document(config: str) -> str:
+    return (
+        f"setweight(to_tsvector('{config}', COALESCE(first_name, '')), 'A') || "
+        f"setweight(to_tsvector('{config}', COALESCE(last_name, '')), 'A') || "
+        "setweight(to_tsvector('simple', COALESCE(primary_email, '')), 'B') || "
+        f"setweight(to_tsvector('{config}', COALESCE(notes, '')), 'C')"
+    )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("CREATE TEXT SEARCH CONFIGURATION french_unaccent (COPY = french)")
+    op.execute(
+        "ALTER TEXT SEARCH CONFIGURATION french_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, french_stem"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_contacts_search "
+            f"ON contacts USING gin (({_search_document('french_unaccent')}))"
+        )
+        op.drop_index(
+            "ix_contacts_search_vector",
+            table_name="contacts",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("contacts", "search_vector")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "contacts",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_search_document("french"), persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_contacts_search_vector", "contacts", ["search_vector"], postgresql_using="gin"
+    )
+    op.drop_index("ix_contacts_search", table_name="contacts")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS french_unaccent")
@@ -0,0 +1,38 @@
+"""Trigram indexes for contact email and company name substring search.
+
+Revision ID: 058
+Revises: 057
+Create Date: 2026-03-26
+
+uq_contacts_tenant_email and uq_companies_tenant_name only serve exact
+LOWER() lookups, and the contacts tsvector splits emails on "@" and ".", so
+"contains 'acme'" searches fell back to sequential scans. gin_trgm_ops
+indexes on the same LOWER() expressions serve LIKE '%...%' patterns.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "058"
+down_revision: Union[str, None] = "057"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_contacts_email_trgm "
+            "ON contacts USING gin (LOWER(primary_email) gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_companies_name_trgm "
+            "ON companies USING gin (LOWER(company_name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_companies_name_trgm", table_name="companies")
+    op.drop_index("ix_contacts_email_trgm", table_name="contacts")
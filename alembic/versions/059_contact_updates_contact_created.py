@@ -0,0 +1,51 @@
+"""Composite (contact_id, created_at DESC) index on contact_updates.
+
+Revision ID: 059
+Revises: 058
+Create Date: 2026-03-27
+
+The contact audit trail is read per contact, newest first. With separate
+contact_id and created_at indexes that meant a contact_id scan plus a sort,
+or a walk of the global timeline filtered by contact. The composite serves
+both the filter and the order and replaces the two single-column indexes.
+ix_contact_updates_tenant_id stays: nothing reads a tenant-wide timeline,
+but it keeps the tenants ON DELETE CASCADE from scanning the whole table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "059"
+down_revision: Union[str, None] = "058"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contact_updates_contact_created",
+            "contact_updates",
+            ["contact_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_contact_updates_contact_id",
+            table_name="contact_updates",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_contact_updates_created_at",
+            table_name="contact_updates",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_contact_updates_created_at", "contact_updates", [sa.text("created_at DESC")]
+    )
+    op.create_index("ix_contact_updates_contact_id", "contact_updates", ["contact_id"])
+    op.drop_index("ix_contact_updates_contact_created", table_name="contact_updates")
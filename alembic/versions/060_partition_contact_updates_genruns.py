@@ -0,0 +1,138 @@
+"""Convert contact_updates and presentation_generation_runs to monthly partitions.
+
+Revision ID: 060
+Revises: 059
+Create Date: 2026-03-28
+
+Both tables are append-only event logs (one row per contact field change,
+one per presentation LLM call) read per contact / presentation or over a
+recent window. Same layout as audit_logs and llm_traces in 037: RANGE
+partitions on created_at, PK (id, created_at), children created by
+ensure_monthly_partitions() and kept ahead by the ensure_log_partitions cron.
+Existing rows are copied over and the parent indexes are built after the copy.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "060"
+down_revision: Union[str, None] = "059"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+CONTACT_UPDATES_COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    tenant_id uuid NOT NULL REFERENCES tenants (id) ON DELETE CASCADE,
+    contact_id uuid NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    update_type varchar(50) NOT NULL,
+    source varchar(100),
+    field_name varchar(100),
+    old_value text,
+    new_value text,
+    confidence numeric(3, 2),
+    evidence jsonb,
+    user_id uuid REFERENCES users (id) ON DELETE SET NULL,
+    run_id uuid REFERENCES agent_runs (id) ON DELETE SET NULL,
+    created_at timestamptz NOT NULL DEFAULT now()
+"""
+
+GENRUNS_COLUMNS = """
+    id uuid NOT NULL DEFAULT gen_random_uuid(),
+    tenant_id uuid NOT NULL,
+    presentation_id uuid NOT NULL REFERENCES presentations (id) ON DELETE CASCADE,
+    slide_id uuid REFERENCES presentation_slides (id) ON DELETE SET NULL,
+    purpose varchar(20) NOT NULL,
+    model varchar(100) NOT NULL,
+    input_hash varchar(64),
+    request_payload jsonb,
+    response_excerpt text,
+    tokens_in integer DEFAULT 0,
+    tokens_out integer DEFAULT 0,
+    status varchar(20) NOT NULL DEFAULT 'pending',
+    error text,
+    repair_attempts integer DEFAULT 0,
+    duration_ms integer,
+    created_at timestamptz NOT NULL DEFAULT now()
+"""
+
+CONTACT_UPDATES_FIELDS = (
+    "id, tenant_id, contact_id, update_type, source, field_name, old_value, new_value, "
+    "confidence, evidence, user_id, run_id"
+)
+GENRUNS_FIELDS = (
+    "id, tenant_id, presentation_id, slide_id, purpose, model, input_hash, request_payload, "
+    "response_excerpt, tokens_in, tokens_out, status, error, repair_attempts, duration_ms"
+)
+
+
+def _partition(table: str, columns: str, fields: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+    op.execute(f"ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey")
+    op.execute(
+        f"CREATE TABLE {table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at))"
+        " PARTITION BY RANGE (created_at)"
+    )
+    op.execute(
+        f"SELECT ensure_monthly_partitions('{table}', {MONTHS_AHEAD}, "
+        f"(SELECT min(created_at) FROM {table}_legacy))"
+    )
+    op.execute(
+        f"INSERT INTO {table} ({fields}, created_at) "
+        f"SELECT {fields}, coalesce(created_at, now()) FROM {table}_legacy"
+    )
+    op.execute(f"DROP TABLE {table}_legacy")
+
+
+def _unpartition(table: str, columns: str, fields: str) -> None:
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+    op.execute(
+        f"ALTER TABLE {table}_partitioned RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey"
+    )
+    op.execute(f"CREATE TABLE {table} ({columns}, CONSTRAINT {table}_pkey PRIMARY KEY (id))")
+    op.execute(
+        f"INSERT INTO {table} ({fields}, created_at) "
+        f"SELECT {fields}, created_at FROM {table}_partitioned"
+    )
+    op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+
+
+def _create_contact_updates_indexes() -> None:
+    op.create_index("ix_contact_updates_tenant_id", "contact_updates", ["tenant_id"])
+    op.create_index(
+        "ix_contact_updates_contact_created",
+        "contact_updates",
+        ["contact_id", sa.text("created_at DESC")],
+    )
+
+
+def _create_genruns_indexes() -> None:
+    op.create_index("ix_genruns_pres", "presentation_generation_runs", ["presentation_id"])
+    op.create_index(
+        "ix_genruns_tenant_created", "presentation_generation_runs", ["tenant_id", "created_at"]
+    )
+    op.create_index(
+        "ix_genruns_slide",
+        "presentation_generation_runs",
+        ["slide_id"],
+        postgresql_where=sa.text("slide_id IS NOT NULL"),
+    )
+
+
+def upgrade() -> None:
+    _partition("contact_updates", CONTACT_UPDATES_COLUMNS, CONTACT_UPDATES_FIELDS)
+    _create_contact_updates_indexes()
+
+    _partition("presentation_generation_runs", GENRUNS_COLUMNS, GENRUNS_FIELDS)
+    _create_genruns_indexes()
+
+
+def downgrade() -> None:
+    _unpartition("presentation_generation_runs", GENRUNS_COLUMNS, GENRUNS_FIELDS)
+    _create_genruns_indexes()
+
+    _unpartition("contact_updates", CONTACT_UPDATES_COLUMNS, CONTACT_UPDATES_FIELDS)
+    _create_contact_updates_indexes()
@@ -0,0 +1,62 @@
+"""CHECK constraints on scheduled email and presentation status/kind columns.
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-03-29
+
+Same treatment as 051: scheduled_emails.status, presentations.status and
+presentation_assets.kind/status only hold the values of their Python enums
+(or the documented scheduled email lifecycle), so the domain is declared
+as a CHECK rather than a native ENUM type, which could not be extended
+without an ALTER TYPE outside the migration transaction.
+
+presentation_generation_runs.purpose/status are left unconstrained: the
+purpose column already holds values outside RunPurpose.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "061"
+down_revision: Union[str, None] = "060"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, condition)
+CHECKS = [
+    (
+        "ck_scheduled_emails_status",
+        "scheduled_emails",
+        "status IN ('pending', 'sent', 'failed', 'cancelled')",
+    ),
+    (
+        "ck_presentations_status",
+        "presentations",
+        "status IN ('draft', 'generating_outline', 'outline_ready', 'generating_slides', "
+        "'ready', 'exporting', 'error')",
+    ),
+    (
+        "ck_presentation_assets_kind",
+        "presentation_assets",
+        "kind IN ('image', 'svg', 'font', 'bg')",
+    ),
+    (
+        "ck_presentation_assets_status",
+        "presentation_assets",
+        "status IN ('pending', 'ready', 'error')",
+    ),
+]
+
+
+def upgrade() -> None:
+    # Autocommit so the ADD's ACCESS EXCLUSIVE lock is released before the scan
+    with op.get_context().autocommit_block():
+        for name, table, condition in CHECKS:
+            op.create_check_constraint(name, table, condition, postgresql_not_valid=True)
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name, table, _condition in reversed(CHECKS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,55 @@
+"""Store contacts.tags as text[] instead of a JSONB array.
+
+Revision ID: 062
+Revises: 061
+Create Date: 2026-03-30
+
+Tags are a flat list of strings (ContactCreate.tags: list[str]). A text[]
+drops the JSON framing from every value and the tag filter becomes a plain
+array containment (tags @> ARRAY[...]) served by the default GIN array_ops.
+
+ALTER COLUMN ... USING cannot contain a subquery, so a throwaway function
+unpacks the JSONB array during the rewrite.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "062"
+down_revision: Union[str, None] = "061"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSONB_TO_TEXT_ARRAY_FN = """
+CREATE FUNCTION _contacts_tags_to_text_array(tags jsonb) RETURNS text[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN jsonb_typeof(tags) = 'array'
+            THEN ARRAY(SELECT jsonb_array_elements_text(tags))
+    END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute(JSONB_TO_TEXT_ARRAY_FN)
+
+    op.drop_index("ix_contacts_tags", table_name="contacts")
+    op.execute("ALTER TABLE contacts ALTER COLUMN tags DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE contacts ALTER COLUMN tags TYPE text[] "
+        "USING _contacts_tags_to_text_array(tags)"
+    )
+    op.execute("ALTER TABLE contacts ALTER COLUMN tags SET DEFAULT '{}'::text[]")
+    op.create_index("ix_contacts_tags", "contacts", ["tags"], postgresql_using="gin")
+
+    op.execute("DROP FUNCTION _contacts_tags_to_text_array(jsonb)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_tags", table_name="contacts")
+    op.execute("ALTER TABLE contacts ALTER COLUMN tags DROP DEFAULT")
+    op.execute("ALTER TABLE contacts ALTER COLUMN tags TYPE jsonb USING to_jsonb(tags)")
+    op.execute("ALTER TABLE contacts ALTER COLUMN tags SET DEFAULT '[]'::jsonb")
+    op.create_index("ix_contacts_tags", "contacts", ["tags"], postgresql_using="gin")
@@ -0,0 +1,37 @@
+"""Compress long presentation asset/export URL columns with lz4.
+
+Revision ID: 063
+Revises: 062
+Create Date: 2026-03-31
+
+source_url and s3_key are declared varchar(2000). The keys the app writes
+are short and stay inline, and source_url is currently always NULL, so there
+is no hot-row bloat to move into a side table today. If long (signed) URLs
+do land here, lz4 makes the compressed/TOASTed values cheap to read back.
+SET COMPRESSION is catalog-only: existing values keep their codec.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "063"
+down_revision: Union[str, None] = "062"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ("presentation_assets", "source_url"),
+    ("presentation_assets", "s3_key"),
+    ("presentation_exports", "s3_key"),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
@@ -0,0 +1,40 @@
+"""Store presentation asset checksums and export payload hashes as raw bytea.
+
+Revision ID: 064
+Revises: 063
+Create Date: 2026-04-01
+
+Both columns hold SHA-256 digests as 64-char hex. Raw 32-byte digests halve
+the key width in ix_passets_tenant_checksum and in the export cache lookup,
+as 043 did for web_cache.query_hash. The type change rewrites both tables
+and rebuilds their indexes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "064"
+down_revision: Union[str, None] = "063"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ("presentation_assets", "checksum"),
+    ("presentation_exports", "payload_hash"),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bytea USING decode({column}, 'hex')"
+        )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(64) "
+            f"USING encode({column}, 'hex')"
+        )
@@ -0,0 +1,33 @@
+"""Drop gen_random_uuid() defaults on the contact and presentation event logs.
+
+Revision ID: 065
+Revises: 064
+Create Date: 2026-04-02
+
+contact_updates and presentation_generation_runs ids now come from
+app.database.uuid7(), as 053 did for the agent tables, so inserts append
+to the right edge of each partition's primary-key index. The ids stay UUIDs
+rather than bigint like 045's telemetry tables: contact update ids are
+returned by the contact audit trail API.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "065"
+down_revision: Union[str, None] = "064"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("contact_updates", "presentation_generation_runs")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
@@ -0,0 +1,41 @@
+"""BRIN indexes on created_at for the contact and presentation event logs.
+
+Revision ID: 066
+Revises: 065
+Create Date: 2026-04-03
+
+contact_updates and presentation_generation_runs are append-only and, since
+060, partitioned by month like audit_logs and llm_traces. They get the same
+BRIN as 044 for cross-tenant time-range scans inside a partition; neither
+table has a plain B-tree on created_at left to drop (059 removed the
+contact_updates one). The created_at now() defaults are unchanged: now() is
+evaluated once per transaction, not per row.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "066"
+down_revision: Union[str, None] = "065"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Both are partitioned parents, so CONCURRENTLY is not available (037, 060)
+BRIN_TABLES = ("contact_updates", "presentation_generation_runs")
+
+
+def upgrade() -> None:
+    for table in BRIN_TABLES:
+        op.create_index(
+            f"ix_{table}_created_at_brin",
+            table,
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(BRIN_TABLES):
+        op.drop_index(f"ix_{table}_created_at_brin", table_name=table)
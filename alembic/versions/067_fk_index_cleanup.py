@@ -0,0 +1,52 @@
+"""Index uncovered foreign keys; drop the FK index duplicated by a unique constraint.
+
+Revision ID: 067
+Revises: 066
+Create Date: 2026-04-04
+
+- ix_contact_email_links_contact_id is a prefix of uq_contact_email_link
+  (contact_id, mail_message_id, link_type) and is dropped.
+- contact_email_links.tenant_id (ON DELETE CASCADE) had no index, so a
+  tenant delete scanned the table; the model already declared one.
+- presentation_assets.slide_id (ON DELETE SET NULL) had no index, so every
+  slide delete scanned all assets. Partial, like ix_genruns_slide: the
+  cascade's slide_id = $1 implies NOT NULL, so the predicate still matches.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "067"
+down_revision: Union[str, None] = "066"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contact_email_links_tenant_id",
+            "contact_email_links",
+            ["tenant_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_passets_slide",
+            "presentation_assets",
+            ["slide_id"],
+            postgresql_where=sa.text("slide_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_contact_email_links_contact_id",
+            table_name="contact_email_links",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_contact_email_links_contact_id", "contact_email_links", ["contact_id"])
+    op.drop_index("ix_passets_slide", table_name="presentation_assets")
+    op.drop_index("ix_contact_email_links_tenant_id", table_name="contact_email_links")
@@ -0,0 +1,51 @@
+"""Index mail_messages for per-tenant thread lookups; drop the bare tenant_id index.
+
+Revision ID: 068
+Revises: 067
+Create Date: 2026-04-05
+
+list_folder_items resolves email_thread items by matching the item id
+against provider_thread_id or provider_message_id and keeps the newest
+three messages per key. It runs one windowed branch per column, each
+served by a (tenant_id, key, date DESC) index.
+
+ix_mail_messages_tenant_id is a prefix of both and is dropped; the tenants
+ON DELETE CASCADE uses either composite.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "068"
+down_revision: Union[str, None] = "067"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_mail_messages_tenant_thread_date",
+            "mail_messages",
+            ["tenant_id", "provider_thread_id", sa.text("date DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_mail_messages_tenant_msgid_date",
+            "mail_messages",
+            ["tenant_id", "provider_message_id", sa.text("date DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_mail_messages_tenant_id",
+            table_name="mail_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_mail_messages_tenant_id", "mail_messages", ["tenant_id"])
+    op.drop_index("ix_mail_messages_tenant_msgid_date", table_name="mail_messages")
+    op.drop_index("ix_mail_messages_tenant_thread_date", table_name="mail_messages")
@@ -1,38 +1,73 @@
 """Agent-first chat endpoint — creates a run, enqueues to worker, streams via Redis."""
 
-import json
+from collections import deque
 from uuid import UUID, uuid4
 
-from arq.connections import create_pool
+import orjson
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, insert, or_, select
 
 from app.config import get_settings
 from app.core.budget import default_budget_for_profile
 from app.core.logging import get_logger
-from app.core.streams import AgentStreamConsumer, get_redis
-from app.database import async_session_maker
+from app.core.streams import (
+    EVENT_BLOCK,
+    EVENT_CITATIONS,
+    EVENT_DELTA,
+    EVENT_DONE,
+    EVENT_ERROR,
+    EVENT_HEARTBEAT,
+    EVENT_STATUS,
+    EVENT_TOOL,
+    SSE_EVENT_LINES,
+    AgentStreamConsumer,
+    format_sse,
+    get_redis,
+)
 from app.deps import CurrentUser, DbSession
+from app.integrations.nango.models import assistant_integrations
 from app.models.assistant import Assistant
+from app.models.collection import assistant_collections
 from app.models.message import Message, MessageRole
 from app.schemas.chat import ChatRequest
 from app.services.quota import quota_service
 from app.services.run import run_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+_SEEN_SEQS_WINDOW = 2048  # recent event seqs remembered for reconnect dedup
 
-async def _format_sse(event: str, data: str) -> str:
-    """Format SSE message with multi-line support."""
-    lines = data.split("\n")
-    data_lines = "\n".join(f"data: {line}" for line in lines)
-    return f"event: {event}\n{data_lines}\n\n"
+
+# Precomputed "event:" lines for every SSE event this endpoint emits
+_SSE_CONVERSATION_ID = b"event: conversation_id\n"
+_SSE_RUN_ID = b"event: run_id\n"
+_SSE_STATUS = SSE_EVENT_LINES[EVENT_STATUS]
+_SSE_TOKEN = SSE_EVENT_LINES[EVENT_DELTA]
+_SSE_BLOCK = SSE_EVENT_LINES[EVENT_BLOCK]
+_SSE_CITATIONS = SSE_EVENT_LINES[EVENT_CITATIONS]
+_SSE_TOOL = SSE_EVENT_LINES[EVENT_TOOL]
+_SSE_DONE = SSE_EVENT_LINES[EVENT_DONE]
+_SSE_ERROR = SSE_EVENT_LINES[EVENT_ERROR]
+_SSE_HEARTBEAT = b": heartbeat\n\n"  # comment frame, ignored by EventSource
+
+
+def _format_sse(prefix: bytes, data: str) -> bytes:
+    """Format an SSE frame from a precomputed event line and a str payload."""
+    return format_sse(prefix, data.encode())
+
+
+def _load_payload(data: str | bytes) -> dict:
+    """Parse a stream event payload, tolerating malformed data."""
+    try:
+        parsed = orjson.loads(data)
+    except (orjson.JSONDecodeError, TypeError):
+        return {"raw": data}
+    return parsed if isinstance(parsed, dict) else {"raw": parsed}
 
 
 @router.post("/{assistant_id}/agent-stream")
@@ -46,10 +81,9 @@ async def agent_stream(
 
     Flow:
     1. Validate request, load assistant
-    2. Save user message
-    3. Create agent_run in DB
-    4. Enqueue run_agent Arq job
-    5. Return SSE that reads from Redis Streams
+    2. Save user message and create agent_run in one transaction
+    3. Enqueue run_agent Arq job
+    4. Return SSE that reads from Redis Streams
     """
     tenant_id = user.tenant_id
     user_id = user.id
@@ -57,10 +91,6 @@ async def agent_stream(
     # ── Load assistant ───────────────────────────────────────────
     result = await db.execute(
         select(Assistant)
-        .options(
-            selectinload(Assistant.collections),
-            selectinload(Assistant.integrations),
-        )
         .where(Assistant.id == assistant_id)
         .where(Assistant.tenant_id == tenant_id)
     )
@@ -72,7 +102,18 @@ async def agent_stream(
             detail="Assistant not found",
         )
 
-    if not assistant.collections and not assistant.integrations:
+    # Only presence matters here (the worker loads the full lists), so probe
+    # the junction tables on their assistant_id-leading PKs instead of
+    # selectin-loading both relationships through a join back to assistants.
+    has_sources = await db.scalar(
+        select(
+            or_(
+                exists().where(assistant_collections.c.assistant_id == assistant_id),
+                exists().where(assistant_integrations.c.assistant_id == assistant_id),
+            )
+        )
+    )
+    if not has_sources:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="L'assistant n'a ni collections ni outils connectés.",
@@ -89,52 +130,49 @@ async def agent_stream(
 
     conversation_id = request.conversation_id or uuid4()
 
-    # ── Save user message ────────────────────────────────────────
-    async with async_session_maker() as save_db:
-        user_message = Message(
+    # ── Save user message + create agent run (one transaction) ─
+    # Committed before enqueueing so the worker always finds the run.
+    # Nothing reads the message back, so insert it with Core and skip the
+    # ORM instance / identity-map bookkeeping.
+    await db.execute(
+        insert(Message).values(
             assistant_id=assistant_id,
             conversation_id=conversation_id,
             role=MessageRole.USER.value,
             content=request.message,
             tokens_input=0,
         )
-        save_db.add(user_message)
-        await save_db.commit()
+    )
 
-    # ── Create agent run ─────────────────────────────────────────
     profile = assistant.agent_profile or "reactive"
 
-    async with async_session_maker() as run_db:
-        run = await run_service.create_run(
-            run_db,
-            tenant_id=tenant_id,
-            assistant_id=assistant_id,
-            conversation_id=conversation_id,
-            input_text=request.message,
-            profile=profile,
-            budget_tokens=default_budget_for_profile(profile),
-            metadata_={"user_id": str(user_id)},
-        )
-        run_id = run.id
-
-        await run_service.log_audit(
-            run_db,
-            action="run_created",
-            tenant_id=tenant_id,
-            run_id=run_id,
-            user_id=user_id,
-            entity_type="assistant",
-            entity_id=assistant_id,
-            detail={"profile": profile, "conversation_id": str(conversation_id)},
-        )
-        await run_db.commit()
+    run = await run_service.create_run(
+        db,
+        tenant_id=tenant_id,
+        assistant_id=assistant_id,
+        conversation_id=conversation_id,
+        input_text=request.message,
+        profile=profile,
+        budget_tokens=default_budget_for_profile(profile),
+        metadata_={"user_id": str(user_id)},
+    )
+    run_id = run.id
+
+    await run_service.log_audit(
+        db,
+        action="run_created",
+        tenant_id=tenant_id,
+        run_id=run_id,
+        user_id=user_id,
+        entity_type="assistant",
+        entity_id=assistant_id,
+        detail={"profile": profile, "conversation_id": str(conversation_id)},
+    )
+    await db.commit()
 
     # ── Enqueue worker job ───────────────────────────────────────
-    pool = await create_pool(redis_settings)
-    try:
-        await pool.enqueue_job("run_agent", str(run_id))
-    finally:
-        await pool.aclose()
+    pool = await get_arq_pool()
+    await pool.enqueue_job("run_agent", str(run_id))
 
     logger.info(
         "agent_run_enqueued",
@@ -148,57 +186,65 @@ async def agent_stream(
 
     async def event_generator():
         # Emit run metadata first
-        yield await _format_sse("conversation_id", str(conversation_id))
-        yield await _format_sse("run_id", str(run_id))
+        yield _format_sse(_SSE_CONVERSATION_ID, str(conversation_id))
+        yield _format_sse(_SSE_RUN_ID, str(run_id))
 
         consumer = AgentStreamConsumer(
             redis,
             run_id,
             heartbeat_interval=settings.agent_sse_heartbeat_interval,
             hard_timeout=settings.agent_sse_hard_timeout,
+            raw_data=True,
         )
 
+        # Bounded dedup: the set answers lookups, the deque evicts the oldest seq
         seen_seqs: set[str] = set()
+        seen_order: deque[str] = deque(maxlen=_SEEN_SEQS_WINDOW)
 
         async for raw_event in consumer:
-            seq = raw_event.get("seq", "")
             event_type = raw_event.get("type", "")
+            if event_type == EVENT_HEARTBEAT:
+                yield _SSE_HEARTBEAT
+                continue
+
+            seq = raw_event.get("seq", "")
 
             # Idempotence: skip already-seen events (reconnect scenario)
-            if seq in seen_seqs and seq != "-1":
-                continue
-            seen_seqs.add(seq)
+            if seq != "-1":
+                if seq in seen_seqs:
+                    continue
+                if len(seen_order) == seen_order.maxlen:
+                    seen_seqs.discard(seen_order[0])
+                seen_seqs.add(seq)
+                seen_order.append(seq)
 
-            # Parse data payload
-            data_str = raw_event.get("data", "{}")
-            try:
-                data = json.loads(data_str)
-            except (json.JSONDecodeError, TypeError):
-                data = {"raw": data_str}
+            # Payloads are JSON serialized by AgentStreamPublisher and arrive as
+            # raw bytes; forward them verbatim and only parse the ones we need
+            # to look inside
+            data = raw_event.get("data", b"{}")
 
-            # Map stream event types to SSE events
-            if event_type == "status":
-                yield await _format_sse("status", json.dumps(data))
+            if event_type == EVENT_DELTA:
+                yield _format_sse(_SSE_TOKEN, _load_payload(data).get("text", ""))
 
-            elif event_type == "delta":
-                text = data.get("text", "")
-                yield await _format_sse("token", text)
+            elif event_type == EVENT_STATUS:
+                yield format_sse(_SSE_STATUS, data)
 
-            elif event_type == "block":
-                yield await _format_sse("block", json.dumps(data))
+            elif event_type == EVENT_BLOCK:
+                yield format_sse(_SSE_BLOCK, data)
 
-            elif event_type == "citations":
-                yield await _format_sse("citations", json.dumps(data.get("citations", [])))
+            elif event_type == EVENT_CITATIONS:
+                citations = _load_payload(data).get("citations", [])
+                yield format_sse(_SSE_CITATIONS, orjson.dumps(citations))
 
-            elif event_type == "tool":
-                yield await _format_sse("tool", json.dumps(data))
+            elif event_type == EVENT_TOOL:
+                yield format_sse(_SSE_TOOL, data)
 
-            elif event_type == "done":
-                yield await _format_sse("done", json.dumps(data))
+            elif event_type == EVENT_DONE:
+                yield format_sse(_SSE_DONE, data)
                 return
 
-            elif event_type == "error":
-                yield await _format_sse("error", json.dumps(data))
+            elif event_type == EVENT_ERROR:
+                yield format_sse(_SSE_ERROR, data)
                 return
 
     return StreamingResponse(
@@ -186,3 +186,8 @@ async def delete_collection(
     # Delete from DB (cascades to documents and chunks)
     await db.delete(collection)
     await db.commit()
+
+    if collection.name == "__uploads__":
+        from app.api.v1.uploads import forget_uploads_collection
+
+        forget_uploads_collection(user.tenant_id)
@@ -4,7 +4,7 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from app.deps import CurrentUser, DbSession
 from app.models.contact import Company
@@ -34,7 +34,7 @@ router = APIRouter()
 async def list_contacts(
     user: CurrentUser,
     db: DbSession,
-    search: str | None = Query(None, description="Full-text search query"),
+    search: str | None = Query(None, description="Full-text or email substring search"),
     contact_type: str | None = Query(None, description="Filter by contact type"),
     source: str | None = Query(None, description="Filter by source"),
     limit: int = Query(50, le=100, description="Maximum results"),
@@ -44,7 +44,7 @@ async def list_contacts(
 
     Returns lightweight contact summaries with company name if available.
     """
-    contacts = await contact_service.list_contacts(
+    rows = await contact_service.list_contacts(
         db,
         user.tenant_id,
         search_query=search,
@@ -53,16 +53,7 @@ async def list_contacts(
         limit=limit,
         offset=offset,
     )
-
-    # Convert to brief format with company name
-    result = []
-    for c in contacts:
-        brief = ContactBrief.model_validate(c)
-        if c.company:
-            brief.company_name = c.company.company_name
-        result.append(brief)
-
-    return result
+    return [ContactBrief(**row) for row in rows]
 
 
 @router.get("/search", response_model=list[ContactSearchResult])
@@ -74,7 +65,7 @@ async def search_contacts(
 ):
     """Full-text search contacts with relevance ranking.
 
-    Uses PostgreSQL FTS with French stemming.
+    Uses PostgreSQL FTS with accent-insensitive French stemming.
     """
     results = await contact_service.search_contacts(db, user.tenant_id, q, limit)
 
@@ -230,18 +221,17 @@ async def import_contacts_from_email(
 async def list_companies(
     user: CurrentUser,
     db: DbSession,
+    q: str | None = Query(None, min_length=2, description="Company name substring"),
     limit: int = Query(50, le=100),
 ):
     """List companies for tenant.
 
     Note: This endpoint is deprecated. Companies are managed through contacts.
     """
-    stmt = (
-        select(Company)
-        .where(Company.tenant_id == user.tenant_id)
-        .order_by(Company.company_name)
-        .limit(limit)
-    )
+    stmt = select(Company).where(Company.tenant_id == user.tenant_id)
+    if q:
+        stmt = stmt.where(func.lower(Company.company_name).contains(q.lower(), autoescape=True))
+    stmt = stmt.order_by(Company.company_name).limit(limit)
     result = await db.execute(stmt)
     return list(result.scalars().all())
 
@@ -1,8 +1,8 @@
 """Document endpoints."""
 
+import time
 from uuid import UUID
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, UploadFile, status
 from sqlalchemy import select
 
@@ -13,16 +13,11 @@ from app.schemas.document import DocumentRead, DocumentUploadResponse
 from app.services.storage import storage_service
 from app.services.usage import usage_service
 from app.services.quota import quota_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 router = APIRouter()
 
 
-async def get_arq_pool() -> ArqRedis:
-    """Get Arq Redis connection pool."""
-    return await create_pool(redis_settings)
-
-
 @router.get("", response_model=list[DocumentRead])
 async def list_documents(
     user: CurrentUser,
@@ -174,8 +169,9 @@ async def upload_document(
     
     # Queue processing job
     pool = await get_arq_pool()
-    await pool.enqueue_job("process_document", str(document.id))
-    await pool.close()
+    await pool.enqueue_job(
+        "process_document", str(document.id), _job_id=f"process_document:{document.id}"
+    )
     
     await db.commit()
     
@@ -258,8 +254,11 @@ async def reprocess_document(
     
     # Queue processing job
     pool = await get_arq_pool()
-    await pool.enqueue_job("process_document", str(document.id))
-    await pool.close()
+    await pool.enqueue_job(
+        "process_document",
+        str(document.id),
+        _job_id=f"reprocess_document:{document.id}:{int(time.time())}",
+    )
     
     await db.commit()
     
@@ -9,7 +9,6 @@ import json
 import logging
 from uuid import UUID
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -37,7 +36,7 @@ from app.services.chat import chat_service
 from app.services.quota import quota_service
 from app.services.storage import storage_service
 from app.services.usage import usage_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +57,6 @@ async def require_feature_dossiers(
 router = APIRouter(dependencies=[Depends(require_feature_dossiers)])
 
 
-async def get_arq_pool() -> ArqRedis:
-    return await create_pool(redis_settings)
-
-
 def _ensure_owner(dossier: Dossier, user_id: UUID) -> None:
     """Hard ownership check — even admins cannot see other users' dossiers."""
     if dossier.user_id != user_id:
@@ -321,7 +316,6 @@ async def upload_dossier_document(
     # Queue processing job (same worker, different scope)
     pool = await get_arq_pool()
     await pool.enqueue_job("process_dossier_document", str(doc.id))
-    await pool.close()
 
     await db.commit()
 
@@ -457,7 +451,6 @@ async def import_document_to_dossier(
     # Queue processing
     pool = await get_arq_pool()
     await pool.enqueue_job("process_dossier_document", str(doc.id))
-    await pool.close()
 
     await db.commit()
 
@@ -1,12 +1,17 @@
 """Folder endpoints — CRUD for folders and folder items."""
 
+import contextlib
 from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Text, exists, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.database import uuid7
 from app.deps import CurrentUser, DbSession
 from app.models.assistant import Assistant
 from app.models.document import Document
@@ -26,12 +31,23 @@ from app.schemas.folder import (
 router = APIRouter()
 
 
-def _item_counts(items: list[FolderItem]) -> dict[str, int]:
-    """Count items by type."""
-    counts = {"conversation": 0, "document": 0, "email_thread": 0, "presentation": 0, "upload": 0}
-    for item in items:
-        if item.item_type in counts:
-            counts[item.item_type] += 1
+def _empty_counts() -> dict[str, int]:
+    return {"conversation": 0, "document": 0, "email_thread": 0, "presentation": 0, "upload": 0}
+
+
+async def _item_counts(db: AsyncSession, folder_ids: list[UUID]) -> dict[UUID, dict[str, int]]:
+    """Count items by type for each folder with one grouped query."""
+    counts = {folder_id: _empty_counts() for folder_id in folder_ids}
+    if not folder_ids:
+        return counts
+    result = await db.execute(
+        select(FolderItem.folder_id, FolderItem.item_type, func.count())
+        .where(FolderItem.folder_id.in_(folder_ids))
+        .group_by(FolderItem.folder_id, FolderItem.item_type)
+    )
+    for folder_id, item_type, n in result.all():
+        if item_type in counts[folder_id]:
+            counts[folder_id][item_type] = n
     return counts
 
 
@@ -46,19 +62,19 @@ async def list_folders(
     result = await db.execute(
         select(Folder)
         .where(Folder.tenant_id == user.tenant_id)
-        .options(selectinload(Folder.items))
         .order_by(Folder.updated_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    folders = list(result.scalars().unique().all())
+    folders = list(result.scalars().all())
+    counts = await _item_counts(db, [f.id for f in folders])
     return [
         FolderRead(
             id=f.id,
             name=f.name,
             description=f.description,
             color=f.color,
-            item_counts=_item_counts(f.items),
+            item_counts=counts[f.id],
             created_at=f.created_at,
             updated_at=f.updated_at,
         )
@@ -105,7 +121,7 @@ async def create_folder(
         name=folder.name,
         description=folder.description,
         color=folder.color,
-        item_counts={"conversation": 0, "document": 0, "email_thread": 0, "presentation": 0, "upload": 0},
+        item_counts=_empty_counts(),
         created_at=folder.created_at,
         updated_at=folder.updated_at,
     )
@@ -121,7 +137,6 @@ async def get_folder(
     result = await db.execute(
         select(Folder)
         .where(Folder.id == folder_id, Folder.tenant_id == user.tenant_id)
-        .options(selectinload(Folder.items))
     )
     folder = result.scalar_one_or_none()
     if not folder:
@@ -134,7 +149,7 @@ async def get_folder(
         name=folder.name,
         description=folder.description,
         color=folder.color,
-        item_counts=_item_counts(folder.items),
+        item_counts=(await _item_counts(db, [folder.id]))[folder.id],
         created_at=folder.created_at,
         updated_at=folder.updated_at,
     )
@@ -151,7 +166,6 @@ async def update_folder(
     result = await db.execute(
         select(Folder)
         .where(Folder.id == folder_id, Folder.tenant_id == user.tenant_id)
-        .options(selectinload(Folder.items))
     )
     folder = result.scalar_one_or_none()
     if not folder:
@@ -172,7 +186,7 @@ async def update_folder(
         name=folder.name,
         description=folder.description,
         color=folder.color,
-        item_counts=_item_counts(folder.items),
+        item_counts=(await _item_counts(db, [folder.id]))[folder.id],
         created_at=folder.created_at,
         updated_at=folder.updated_at,
     )
@@ -209,22 +223,154 @@ async def list_folder_items(
     item_type: str | None = None,
 ) -> list[FolderItemRead]:
     """List items in a folder with enriched metadata."""
-    result = await db.execute(
-        select(Folder)
-        .where(Folder.id == folder_id, Folder.tenant_id == user.tenant_id)
-        .options(selectinload(Folder.items))
+    folder_exists = await db.scalar(
+        select(
+            exists().where(Folder.id == folder_id, Folder.tenant_id == user.tenant_id)
+        )
     )
-    folder = result.scalar_one_or_none()
-    if not folder:
+    if not folder_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Dossier introuvable.",
         )
-    items = folder.items
+
+    # Filter in SQL (uq_folder_items_folder_type_id covers folder_id + item_type);
+    # the response is sorted by enriched date below, so no ORDER BY here.
+    items_stmt = select(FolderItem).where(FolderItem.folder_id == folder_id)
     if item_type:
-        items = [i for i in items if i.item_type == item_type]
+        items_stmt = items_stmt.where(FolderItem.item_type == item_type)
+    items = (await db.execute(items_stmt)).scalars().all()
+
+    # Bucket ids by type so each kind of target is loaded with one query
+    conv_ids: set[UUID] = set()
+    doc_ids: set[UUID] = set()
+    pres_ids: set[UUID] = set()
+    upload_ids: set[UUID] = set()
+    thread_ids: set[str] = set()
+    for fi in items:
+        if fi.item_type == "email_thread":
+            thread_ids.add(fi.item_id)
+            continue
+        bucket = {
+            "conversation": conv_ids,
+            "document": doc_ids,
+            "presentation": pres_ids,
+            "upload": upload_ids,
+        }.get(fi.item_type)
+        if bucket is not None:
+            with contextlib.suppress(ValueError):
+                bucket.add(UUID(fi.item_id))
+
+    # conversation_id -> (first message content, first message date, message count)
+    conv_summaries: dict[UUID, tuple[str | None, datetime, int]] = {}
+    if conv_ids:
+        ranked = (
+            select(
+                Message.conversation_id,
+                Message.content,
+                Message.created_at,
+                func.row_number()
+                .over(partition_by=Message.conversation_id, order_by=Message.created_at.asc())
+                .label("rn"),
+                func.count().over(partition_by=Message.conversation_id).label("message_count"),
+            )
+            .join(Assistant)
+            .where(
+                Message.conversation_id.in_(conv_ids),
+                Assistant.tenant_id == user.tenant_id,
+            )
+            .subquery()
+        )
+        conv_result = await db.execute(
+            select(
+                ranked.c.conversation_id,
+                ranked.c.content,
+                ranked.c.created_at,
+                ranked.c.message_count,
+            ).where(ranked.c.rn == 1)
+        )
+        conv_summaries = {row[0]: (row[1], row[2], row[3]) for row in conv_result.all()}
+
+    workspace_docs: dict[UUID, WorkspaceDocument] = {}
+    if doc_ids:
+        doc_result = await db.execute(
+            select(WorkspaceDocument)
+            .options(
+                load_only(
+                    WorkspaceDocument.title,
+                    WorkspaceDocument.doc_type,
+                    WorkspaceDocument.status,
+                    WorkspaceDocument.updated_at,
+                )
+            )
+            .where(
+                WorkspaceDocument.id.in_(doc_ids),
+                WorkspaceDocument.tenant_id == user.tenant_id,
+            )
+        )
+        workspace_docs = {doc.id: doc for doc in doc_result.scalars().all()}
+
+    # Uploads, plus "document" items that may be uploads stored with the old type
+    upload_docs: dict[UUID, Document] = {}
+    upload_lookup = upload_ids | (doc_ids - workspace_docs.keys())
+    if upload_lookup:
+        upload_result = await db.execute(
+            select(Document)
+            .options(
+                load_only(Document.filename, Document.content_type, Document.status, Document.updated_at)
+            )
+            .where(Document.id.in_(upload_lookup))
+        )
+        upload_docs = {doc.id: doc for doc in upload_result.scalars().all()}
+
+    presentations: dict[UUID, Presentation] = {}
+    if pres_ids:
+        pres_result = await db.execute(
+            select(Presentation)
+            .options(load_only(Presentation.title, Presentation.status, Presentation.updated_at))
+            .where(
+                Presentation.id.in_(pres_ids),
+                Presentation.tenant_id == user.tenant_id,
+            )
+        )
+        presentations = {pres.id: pres for pres in pres_result.scalars().all()}
+
+    # item_id -> up to 3 messages matching it as thread or message id, newest first
+    thread_messages: dict[str, list[MailMessage]] = {}
+    if thread_ids:
+        # One branch per key column so each can use its (tenant_id, key, date DESC)
+        # index, which an OR across both columns cannot
+        def _latest_by(key_col):
+            return select(
+                MailMessage.id,
+                key_col.label("thread_key"),
+                func.row_number()
+                .over(partition_by=key_col, order_by=MailMessage.date.desc())
+                .label("rn"),
+            ).where(
+                MailMessage.tenant_id == user.tenant_id,
+                key_col.in_(thread_ids),
+            )
+
+        latest = union_all(
+            _latest_by(MailMessage.provider_thread_id),
+            _latest_by(MailMessage.provider_message_id),
+        ).subquery()
+        thread_result = await db.execute(
+            select(MailMessage, latest.c.thread_key)
+            .options(load_only(MailMessage.subject, MailMessage.sender, MailMessage.date))
+            .join(latest, MailMessage.id == latest.c.id)
+            .where(latest.c.rn <= 3)
+            .order_by(MailMessage.date.desc())
+        )
+        for m, key in thread_result.all():
+            msgs = thread_messages.setdefault(key, [])
+            # A message can match a key through both columns
+            if len(msgs) < 3 and m not in msgs:
+                msgs.append(m)
 
     enriched: list[FolderItemRead] = []
+    retyped = False
     for fi in items:
         title = "Sans titre"
         subtitle: str | None = None
@@ -235,34 +381,12 @@ async def list_folder_items(
                 conv_id = UUID(fi.item_id)
             except ValueError:
                 continue
-            msg_result = await db.execute(
-                select(
-                    Message.content,
-                    Message.created_at,
-                    Message.assistant_id,
-                )
-                .join(Assistant)
-                .where(
-                    Message.conversation_id == conv_id,
-                    Assistant.tenant_id == user.tenant_id,
-                )
-                .order_by(Message.created_at.asc())
-            )
-            first_row = msg_result.first()
-            if first_row:
-                content = first_row[0] or ""
+            summary = conv_summaries.get(conv_id)
+            if summary:
+                content = summary[0] or ""
                 title = (content[:50] + "...") if len(content) > 50 else (content or "Conversation")
-                date_val = first_row[1]
-                msg_count_result = await db.execute(
-                    select(func.count(Message.id))
-                    .join(Assistant)
-                    .where(
-                        Message.conversation_id == conv_id,
-                        Assistant.tenant_id == user.tenant_id,
-                    )
-                )
-                count = msg_count_result.scalar() or 0
-                subtitle = f"{count} message(s)"
+                date_val = summary[1]
+                subtitle = f"{summary[2]} message(s)"
             else:
                 title = "Conversation"
                 subtitle = "Vide"
@@ -284,28 +408,18 @@ async def list_folder_items(
                     )
                 )
                 continue
-            doc_result = await db.execute(
-                select(WorkspaceDocument)
-                .where(
-                    WorkspaceDocument.id == doc_uuid,
-                    WorkspaceDocument.tenant_id == user.tenant_id,
-                )
-            )
-            doc = doc_result.scalar_one_or_none()
+            doc = workspace_docs.get(doc_uuid)
             if doc:
                 title = doc.title or "Sans titre"
                 subtitle = f"{doc.doc_type} · {doc.status}"
                 date_val = doc.updated_at
             else:
                 # Fallback: might be an upload stored with old "document" type
-                upload_fallback = await db.execute(
-                    select(Document).where(Document.id == doc_uuid)
-                )
-                upload_doc = upload_fallback.scalar_one_or_none()
+                upload_doc = upload_docs.get(doc_uuid)
                 if upload_doc:
                     # Auto-fix the item_type
                     fi.item_type = "upload"
-                    await db.flush()
+                    retyped = True
                     title = upload_doc.filename or "Sans titre"
                     subtitle = f"{upload_doc.content_type} · {upload_doc.status.value if hasattr(upload_doc.status, 'value') else upload_doc.status}"
                     date_val = upload_doc.updated_at
@@ -329,14 +443,7 @@ async def list_folder_items(
                     )
                 )
                 continue
-            pres_result = await db.execute(
-                select(Presentation)
-                .where(
-                    Presentation.id == pres_uuid,
-                    Presentation.tenant_id == user.tenant_id,
-                )
-            )
-            pres = pres_result.scalar_one_or_none()
+            pres = presentations.get(pres_uuid)
             if pres:
                 title = pres.title or "Sans titre"
                 subtitle = f"Présentation · {pres.status}"
@@ -361,13 +468,7 @@ async def list_folder_items(
                     )
                 )
                 continue
-            upload_result = await db.execute(
-                select(Document)
-                .where(
-                    Document.id == upload_uuid,
-                )
-            )
-            upload_doc = upload_result.scalar_one_or_none()
+            upload_doc = upload_docs.get(upload_uuid)
             if upload_doc:
                 title = upload_doc.filename or "Sans titre"
                 subtitle = f"{upload_doc.content_type} · {upload_doc.status.value if hasattr(upload_doc.status, 'value') else upload_doc.status}"
@@ -376,28 +477,17 @@ async def list_folder_items(
                 subtitle = "Supprimé"
 
         elif fi.item_type == "email_thread":
-            thread_result = await db.execute(
-                select(MailMessage)
-                .where(
-                    MailMessage.tenant_id == user.tenant_id,
-                    or_(
-                        MailMessage.provider_thread_id == fi.item_id,
-                        MailMessage.provider_message_id == fi.item_id,
-                    ),
-                )
-                .order_by(MailMessage.date.desc())
-            )
-            msgs = list(thread_result.scalars().all())
+            msgs = thread_messages.get(fi.item_id, [])
             if msgs:
                 title = msgs[0].subject or "(Sans objet)"
                 participants = []
                 for m in msgs[:3]:
                     s = m.sender
-                    if isinstance(s, dict) and s.get("email"):
-                        participants.append(s["email"])
-                    elif isinstance(s, dict) and s.get("name"):
-                        participants.append(s["name"])
-                subtitle = ", ".join(set(participants))[:80] if participants else None
+                    who = (s.get("email") or s.get("name")) if isinstance(s, dict) else None
+                    if who:
+                        participants.append(who)
+                # dict.fromkeys dedups while keeping newest-first order stable
+                subtitle = ", ".join(dict.fromkeys(participants))[:80] if participants else None
                 date_val = msgs[0].date or fi.added_at
             else:
                 subtitle = "Thread supprimé"
@@ -414,6 +504,9 @@ async def list_folder_items(
             )
         )
 
+    if retyped:
+        await db.flush()
+
     # Sort by date desc
     enriched.sort(key=lambda x: x.date, reverse=True)
     return enriched
@@ -427,48 +520,58 @@ async def add_folder_item(
     db: DbSession,
 ) -> FolderItemRead:
     """Add an item to a folder."""
-    result = await db.execute(
-        select(Folder).where(
-            Folder.id == folder_id,
-            Folder.tenant_id == user.tenant_id,
+    folder_exists = await db.scalar(
+        select(
+            exists().where(Folder.id == folder_id, Folder.tenant_id == user.tenant_id)
         )
     )
-    folder = result.scalar_one_or_none()
-    if not folder:
+    if not folder_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Dossier introuvable.",
         )
 
-    # Check if already in folder (by item_id only — UUIDs are globally unique)
-    existing_result = await db.execute(
-        select(FolderItem).where(
-            FolderItem.folder_id == folder_id,
-            FolderItem.item_id == data.item_id,
+    # Insert unless the item is already in the folder under any type (by item_id
+    # only — UUIDs are globally unique); the unique constraint covers races.
+    insert_stmt = (
+        pg_insert(FolderItem)
+        .from_select(
+            ["id", "folder_id", "item_type", "item_id"],
+            select(
+                literal(uuid7(), PGUUID(as_uuid=True)),
+                literal(folder_id, PGUUID(as_uuid=True)),
+                literal(data.item_type, Text),
+                literal(data.item_id, Text),
+            ).where(
+                ~exists().where(
+                    FolderItem.folder_id == folder_id,
+                    FolderItem.item_id == data.item_id,
+                )
+            ),
         )
+        .on_conflict_do_nothing(constraint="uq_folder_items_folder_type_id")
+        .returning(FolderItem.id, FolderItem.item_type, FolderItem.item_id, FolderItem.added_at)
     )
-    existing_fi = existing_result.scalar_one_or_none()
-    if existing_fi:
+    fi = (await db.execute(insert_stmt)).first()
+
+    if fi is None:
+        existing_result = await db.execute(
+            select(FolderItem).where(
+                FolderItem.folder_id == folder_id,
+                FolderItem.item_id == data.item_id,
+            )
+        )
+        existing_fi = existing_result.scalar_one_or_none()
         # If stored with a different type (e.g. "document" → "upload"), fix it silently
-        if existing_fi.item_type != data.item_type:
-            existing_fi.item_type = data.item_type
-            await db.flush()
-            await db.refresh(existing_fi)
-            fi = existing_fi
-        else:
+        if existing_fi is None or existing_fi.item_type == data.item_type:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cet élément est déjà dans ce dossier.",
             )
-    else:
-        fi = FolderItem(
-            folder_id=folder_id,
-            item_type=data.item_type,
-            item_id=data.item_id,
-        )
-        db.add(fi)
+        existing_fi.item_type = data.item_type
         await db.flush()
-        await db.refresh(fi)
+        await db.refresh(existing_fi)
+        fi = existing_fi
 
     # Enrich for response (simplified)
     return FolderItemRead(
@@ -9,7 +9,6 @@ All queries enforce multi-tenant isolation via ``user.tenant_id``.
 import logging
 from uuid import UUID, uuid4
 
-from arq import create_pool
 from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select, func as sa_func, case, literal_column
 from sqlalchemy.orm import selectinload
@@ -43,7 +42,7 @@ from app.schemas.mail import (
     ScheduledEmailCreate,
     ScheduledEmailRead,
 )
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 logger = logging.getLogger(__name__)
 
@@ -71,11 +70,6 @@ async def _get_account_for_tenant(
     return account
 
 
-async def _get_arq():
-    pool = await create_pool(redis_settings)
-    return pool
-
-
 # ── Accounts ─────────────────────────────────────────────────────────
 
 
@@ -341,9 +335,8 @@ async def finalize_mail_account(
 
     # Enqueue initial sync
     try:
-        pool = await _get_arq()
+        pool = await get_arq_pool()
         await pool.enqueue_job("sync_mail_account", str(account.id))
-        await pool.close()
     except Exception as e:
         logger.warning("Failed to enqueue initial sync: %s", e)
 
@@ -456,9 +449,8 @@ async def send_email(
 
     # Enqueue worker job
     try:
-        pool = await _get_arq()
+        pool = await get_arq_pool()
         await pool.enqueue_job("send_email", str(req.id))
-        await pool.close()
     except Exception as e:
         logger.error("Failed to enqueue send_email: %s", e)
         req.status = "failed"
@@ -837,9 +829,8 @@ async def trigger_sync(
     """Manually trigger a sync for a mail account."""
     await _get_account_for_tenant(db, account_id, user.tenant_id)
 
-    pool = await _get_arq()
+    pool = await get_arq_pool()
     await pool.enqueue_job("sync_mail_account", str(account_id))
-    await pool.close()
 
     return {"status": "sync_queued"}
 
@@ -933,7 +924,8 @@ async def list_scheduled_emails(
         .where(
             ScheduledEmail.tenant_id == tenant_id,
             ScheduledEmail.mail_account_id == account_id,
-            ScheduledEmail.status.in_(["pending"]),
+            # Inline literal so the planner can match the partial ix_scheduled_emails_due
+            ScheduledEmail.status == literal_column("'pending'"),
         )
         .order_by(ScheduledEmail.scheduled_at.asc())
     )
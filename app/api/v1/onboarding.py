@@ -146,13 +146,11 @@ async def complete_onboarding(
 
     # 7. Enqueue crawl jobs (after commit so IDs are stable)
     try:
-        from arq import ArqRedis, create_pool
-        from app.workers.settings import redis_settings
+        from app.workers.settings import get_arq_pool
 
-        redis: ArqRedis = await create_pool(redis_settings)
+        pool = await get_arq_pool()
         for ws_id in web_source_ids:
-            await redis.enqueue_job("crawl_website", ws_id)
-        await redis.close()
+            await pool.enqueue_job("crawl_website", ws_id)
     except Exception:
         logger.warning("Failed to enqueue crawl jobs — worker may not be running", exc_info=True)
 
@@ -9,7 +9,6 @@ import json
 import logging
 from uuid import UUID
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -23,7 +22,7 @@ from app.models.message import Message, MessageRole
 from app.services.chat import chat_service
 from app.services.usage import usage_service
 from app.services.quota import quota_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 logger = logging.getLogger(__name__)
 
@@ -187,14 +186,13 @@ async def _run_personal_global_llm_producer(
                     msg_count = msg_count_result.scalar_one() or 0
                     if msg_count > 0 and msg_count % MEMORY_EXTRACTION_INTERVAL == 0:
                         try:
-                            pool: ArqRedis = await create_pool(redis_settings)
+                            pool = await get_arq_pool()
                             await pool.enqueue_job(
                                 "extract_conversation_memory",
                                 str(conversation_ref_id),
                                 str(tenant_id),
                                 str(user_id),
                             )
-                            await pool.close()
                             logger.info("memory_extraction_enqueued", extra={
                                 "conversation_id": str(conversation_ref_id),
                                 "message_count": msg_count,
@@ -1,18 +1,22 @@
 """Presentation API endpoints — CRUD, AI generation, export, SSE."""
 
 import asyncio
-import json
 from uuid import UUID, uuid4
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, Request, UploadFile, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.core.rate_limit import limiter
 from sqlalchemy import select
 
 from app.deps import CurrentUser, DbSession
-from app.models.presentation import AssetKind, AssetStatus, PresentationAsset
+from app.models.presentation import (
+    AssetKind,
+    AssetStatus,
+    PresentationAsset,
+    PresentationStatus,
+)
 from app.schemas.presentation import (
     AssetReadWithUrl,
     AssetUrlResponse,
@@ -33,18 +37,21 @@ from app.schemas.presentation import (
     ThemeRead,
 )
 from app.services.presentation import presentation_service
+from app.services.presentation_events import TERMINAL_EVENTS, presentation_event_hub
 from app.services.storage import storage_service
+from app.workers.settings import get_arq_pool
 
 router = APIRouter()
 
+_TERMINAL_EVENT_LINES = frozenset(f"event: {t}".encode() for t in TERMINAL_EVENTS)
 
-# ── Helpers ──
+# List responses are validated in one call rather than once per row
+_LIST_ITEMS_TA = TypeAdapter(list[PresentationListItem])
+_EXPORTS_TA = TypeAdapter(list[ExportRead])
+_THEMES_TA = TypeAdapter(list[ThemeRead])
 
 
-async def _get_redis() -> ArqRedis:
-    """Get Arq Redis connection for enqueuing jobs."""
-    from app.workers.settings import redis_settings
-    return await create_pool(redis_settings)
+# ── Helpers ──
 
 
 def _ensure_found(obj, detail: str = "Ressource introuvable."):
@@ -54,11 +61,8 @@ def _ensure_found(obj, detail: str = "Ressource introuvable."):
 
 
 async def _to_read(db, user, pres) -> PresentationRead:
-    """Re-fetch with slides loaded to avoid lazy-load in async context."""
-    loaded = await presentation_service.get(
-        db, user.tenant_id, pres.id, with_slides=True
-    )
-    read = PresentationRead.model_validate(loaded)
+    """Serialize a presentation returned by a write with slides/theme loaded."""
+    read = PresentationRead.model_validate(pres)
     await _resolve_slide_asset_urls(db, user.tenant_id, read)
     return read
 
@@ -157,7 +161,7 @@ async def list_presentations(
     items = await presentation_service.list(
         db, user.tenant_id, status=status_filter, limit=limit, offset=offset
     )
-    return [PresentationListItem.model_validate(p) for p in items]
+    return _LIST_ITEMS_TA.validate_python(items, from_attributes=True)
 
 
 @router.post("", response_model=PresentationRead, status_code=status.HTTP_201_CREATED)
@@ -245,17 +249,19 @@ async def generate_outline(
     Internally, this now enqueues the direct generation job which splits
     the prompt and generates slides without a separate outline step.
     """
-    pres = _ensure_found(await presentation_service.get(db, user.tenant_id, pres_id))
-    pres.status = "generating_slides"
+    _ensure_found(
+        await presentation_service.set_status(
+            db, user.tenant_id, pres_id, PresentationStatus.GENERATING_SLIDES.value
+        )
+    )
     await db.commit()
-    redis = await _get_redis()
-    job = await redis.enqueue_job(
+    pool = await get_arq_pool()
+    job = await pool.enqueue_job(
         "generate_presentation_slides_direct",
         str(pres_id),
         str(user.tenant_id),
         request.model_dump(),
     )
-    await redis.close()
     return {"job_id": job.job_id, "status": "queued"}
 
 
@@ -288,17 +294,19 @@ async def generate_slides(
     db: DbSession,
 ) -> dict:
     """Enqueue slide generation job."""
-    pres = _ensure_found(await presentation_service.get(db, user.tenant_id, pres_id))
-    pres.status = "generating_slides"
+    _ensure_found(
+        await presentation_service.set_status(
+            db, user.tenant_id, pres_id, PresentationStatus.GENERATING_SLIDES.value
+        )
+    )
     await db.commit()
-    redis = await _get_redis()
-    job = await redis.enqueue_job(
+    pool = await get_arq_pool()
+    job = await pool.enqueue_job(
         "generate_presentation_slides",
         str(pres_id),
         str(user.tenant_id),
         request.model_dump(),
     )
-    await redis.close()
     return {"job_id": job.job_id, "status": "queued"}
 
 
@@ -311,12 +319,11 @@ async def regenerate_slide(
     db: DbSession,
 ) -> SlideRead:
     """Regenerate a single slide (synchronous, fast)."""
-    slide = _ensure_found(
+    return _ensure_found(
         await presentation_service.regenerate_slide(
             db, user.tenant_id, pres_id, slide_id, request
         )
     )
-    return SlideRead.model_validate(slide)
 
 
 @router.patch("/{pres_id}/slides/{slide_id}", response_model=SlideRead)
@@ -328,12 +335,11 @@ async def update_slide(
     db: DbSession,
 ) -> SlideRead:
     """Update a single slide (autosave)."""
-    slide = _ensure_found(
+    return _ensure_found(
         await presentation_service.update_slide(
             db, user.tenant_id, pres_id, slide_id, data
         )
     )
-    return SlideRead.model_validate(slide)
 
 
 @router.post("/{pres_id}/slides", response_model=SlideRead, status_code=status.HTTP_201_CREATED)
@@ -343,10 +349,9 @@ async def add_slide(
     db: DbSession,
 ) -> SlideRead:
     """Add a blank slide."""
-    slide = _ensure_found(
+    return _ensure_found(
         await presentation_service.add_slide(db, user.tenant_id, pres_id)
     )
-    return SlideRead.model_validate(slide)
 
 
 @router.delete("/{pres_id}/slides/{slide_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -406,13 +411,12 @@ async def export_presentation(
     if export.status == "done":
         return {"export_id": str(export.id), "status": "done", "cached": True}
 
-    redis = await _get_redis()
-    job = await redis.enqueue_job(
+    pool = await get_arq_pool()
+    job = await pool.enqueue_job(
         "export_presentation",
         str(export.id),
         str(user.tenant_id),
     )
-    await redis.close()
     return {"export_id": str(export.id), "job_id": job.job_id, "status": "queued"}
 
 
@@ -424,7 +428,7 @@ async def list_exports(
 ) -> list[ExportRead]:
     """List exports for a presentation."""
     exports = await presentation_service.list_exports(db, user.tenant_id, pres_id)
-    return [ExportRead.model_validate(e) for e in exports]
+    return _EXPORTS_TA.validate_python(exports, from_attributes=True)
 
 
 @router.get("/{pres_id}/exports/{export_id}/download")
@@ -469,7 +473,7 @@ async def list_themes(
 ) -> list[ThemeRead]:
     """List built-in + custom themes."""
     themes = await presentation_service.list_themes(db, user.tenant_id)
-    return [ThemeRead.model_validate(t) for t in themes]
+    return _THEMES_TA.validate_python(themes, from_attributes=True)
 
 
 @router.post("/themes", response_model=ThemeRead, status_code=status.HTTP_201_CREATED)
@@ -479,8 +483,7 @@ async def create_theme(
     db: DbSession,
 ) -> ThemeRead:
     """Create a custom theme."""
-    theme = await presentation_service.create_theme(db, user.tenant_id, data)
-    return ThemeRead.model_validate(theme)
+    return await presentation_service.create_theme(db, user.tenant_id, data)
 
 
 # ══════════════════════════════════════════════
@@ -495,54 +498,30 @@ async def presentation_events(
     db: DbSession,
 ) -> StreamingResponse:
     """SSE stream for generation progress. Supports reconnection via Last-Event-ID."""
-    _ensure_found(await presentation_service.get(db, user.tenant_id, pres_id))
+    _ensure_found(await presentation_service.exists(db, user.tenant_id, pres_id))
 
     async def event_stream():
-        import redis.asyncio as aioredis
-
-        from app.config import get_settings
-
-        settings = get_settings()
-        redis = aioredis.from_url(settings.redis_url, decode_responses=True)
-        pubsub = redis.pubsub()
-        channel = f"pres:{pres_id}:events"
-        await pubsub.subscribe(channel)
-
         heartbeat_interval = 15  # seconds
 
-        try:
+        async with presentation_event_hub.subscribe(pres_id) as queue:
             while True:
                 try:
-                    msg = await asyncio.wait_for(
-                        pubsub.get_message(ignore_subscribe_messages=True),
-                        timeout=heartbeat_interval,
-                    )
+                    frame = await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
                 except asyncio.TimeoutError:
-                    msg = None
-
-                if msg is None:
-                    yield ": heartbeat\n\n"
-                    continue
-
-                if msg["type"] != "message":
+                    yield b": heartbeat\n\n"
                     continue
 
-                event = json.loads(msg["data"])
-                event_type = event.get("type", "update")
-                payload = event.get("payload", {})
-                seq = event.get("seq", "")
+                # Client fell too far behind, or the subscriber connection
+                # dropped: end now so the EventSource reconnects
+                if frame is None:
+                    break
 
-                yield (
-                    f"id: {seq}\n"
-                    f"event: {event_type}\n"
-                    f"data: {json.dumps(payload)}\n\n"
-                )
+                # Frames come pre-rendered by PresentationEventPublisher: forward
+                # as-is, matching only the raw "event:" line to spot the terminal one
+                yield frame
 
-                if event_type in ("generation_complete", "export_ready", "error"):
+                if frame.split(b"\n", 2)[1] in _TERMINAL_EVENT_LINES:
                     break
-        finally:
-            await pubsub.unsubscribe(channel)
-            await redis.close()
 
     return StreamingResponse(
         event_stream(),
@@ -624,7 +603,7 @@ async def upload_asset(
         s3_key=s3_key,
         mime=content_type,
         byte_size=file_size,
-        checksum=content_hash,
+        checksum=bytes.fromhex(content_hash),
     )
     db.add(asset)
     await db.commit()
@@ -10,7 +10,6 @@ import json
 import logging
 from uuid import UUID, uuid4
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, UploadFile, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select, update
@@ -40,17 +39,13 @@ from app.services.chat import chat_service
 from app.services.storage import storage_service
 from app.services.usage import usage_service
 from app.services.quota import quota_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-async def get_arq_pool() -> ArqRedis:
-    return await create_pool(redis_settings)
-
-
 async def _get_project(
     project_id: UUID, user_id: UUID, tenant_id: UUID, db,
 ) -> Project:
@@ -311,7 +306,6 @@ async def upload_project_document(
     # Queue processing job
     pool = await get_arq_pool()
     await pool.enqueue_job("process_project_document", str(doc.id))
-    await pool.close()
 
     await db.commit()
 
@@ -756,7 +750,6 @@ async def summarize_project_conversation(
         str(project_id),
         str(request.conversation_id),
     )
-    await pool.close()
 
     return {"message": "Summarization queued", "conversation_id": str(request.conversation_id)}
 
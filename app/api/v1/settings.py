@@ -2,7 +2,8 @@
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import cast, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.deps import CurrentUser, DbSession
 from app.models.tenant import Tenant
@@ -26,11 +27,10 @@ class TenantSettingsUpdate(BaseModel):
 @router.get("", response_model=TenantSettingsRead)
 async def get_tenant_settings(user: CurrentUser, db: DbSession) -> TenantSettingsRead:
     """Get current user's tenant settings."""
-    result = await db.execute(select(Tenant).where(Tenant.id == user.tenant_id))
-    tenant = result.scalar_one_or_none()
-    if not tenant:
-        return TenantSettingsRead()
-    settings = tenant.settings or {}
+    result = await db.execute(
+        select(Tenant.settings).where(Tenant.id == user.tenant_id)
+    )
+    settings = result.scalar_one_or_none() or {}
     return TenantSettingsRead(
         mail_signature=settings.get("mail_signature", "") or "",
     )
@@ -43,19 +43,30 @@ async def update_tenant_settings(
     db: DbSession,
 ) -> TenantSettingsRead:
     """Update current user's tenant settings."""
-    result = await db.execute(select(Tenant).where(Tenant.id == user.tenant_id))
-    tenant = result.scalar_one_or_none()
-    if not tenant:
+    patch = data.model_dump(exclude_none=True)
+    if patch:
+        # Merge server-side (settings || patch) in a single round trip
+        stmt = (
+            update(Tenant)
+            .where(Tenant.id == user.tenant_id)
+            .values(
+                settings=func.coalesce(Tenant.settings, cast({}, JSONB)).op("||")(
+                    cast(patch, JSONB)
+                )
+            )
+            .returning(Tenant.settings)
+        )
+    else:
+        stmt = select(Tenant.settings).where(Tenant.id == user.tenant_id)
+
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Tenant not found")
+    if patch:
+        await db.commit()
 
-    settings = dict(tenant.settings or {})
-    if data.mail_signature is not None:
-        settings["mail_signature"] = data.mail_signature
-
-    tenant.settings = settings
-    await db.commit()
-    await db.refresh(tenant)
-
+    settings = row[0] or {}
     return TenantSettingsRead(
         mail_signature=settings.get("mail_signature", "") or "",
     )
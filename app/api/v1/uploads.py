@@ -1,18 +1,22 @@
 """Upload endpoints — dedicated section for document ingestion with OCR."""
 
+import asyncio
+import time
+from collections import OrderedDict
 from uuid import UUID
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, Request, UploadFile, status
 from fastapi.responses import RedirectResponse
 
+from app.config import get_settings
+from app.core.admission import TenantAdmission
 from app.core.rate_limit import limiter
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 from app.deps import CurrentUser, DbSession
 from app.models.collection import Collection
 from app.models.document import Document, DocumentStatus
-from app.models.document_page import DocumentPage
 from app.schemas.upload import (
     UploadDocumentDetail,
     UploadDocumentRead,
@@ -22,7 +26,7 @@ from app.schemas.upload import (
 from app.services.storage import storage_service
 from app.services.usage import usage_service
 from app.services.quota import quota_service
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 router = APIRouter()
 
@@ -30,16 +34,76 @@ router = APIRouter()
 UPLOADS_COLLECTION_NAME = "__uploads__"
 UPLOADS_COLLECTION_DESCRIPTION = "Documents importés via la section Uploads"
 
+_S3_UPLOAD_CONCURRENCY = 8  # parallel S3 PUTs per bulk upload request
 
-async def get_arq_pool() -> ArqRedis:
-    """Get Arq Redis connection pool."""
-    return await create_pool(redis_settings)
+upload_admission = TenantAdmission(get_settings().upload_max_concurrent_per_tenant)
+
+# tenant_id -> __uploads__ collection id. The row never changes once created,
+# so read paths skip the lookup entirely on a hit. A delete only clears the
+# cache of the process that served it, so reads that come back empty under a
+# cached id re-check it once (_recheck_uploads_collection_id).
+_UPLOADS_COLLECTION_CACHE_SIZE = 4096
+_uploads_collection_ids: OrderedDict[UUID, UUID] = OrderedDict()
+
+
+def _remember_uploads_collection(tenant_id: UUID, collection_id: UUID) -> None:
+    _uploads_collection_ids[tenant_id] = collection_id
+    _uploads_collection_ids.move_to_end(tenant_id)
+    if len(_uploads_collection_ids) > _UPLOADS_COLLECTION_CACHE_SIZE:
+        _uploads_collection_ids.popitem(last=False)
+
+
+def forget_uploads_collection(tenant_id: UUID) -> None:
+    """Drop the cached __uploads__ collection id (call when it is deleted)."""
+    _uploads_collection_ids.pop(tenant_id, None)
+
+
+async def _get_uploads_collection_id(
+    db, tenant_id: UUID, *, refresh: bool = False
+) -> UUID | None:
+    """Return the tenant's __uploads__ collection id, cached per process.
+
+    With refresh, the cache is bypassed and overwritten with what the DB says.
+    """
+    if not refresh:
+        collection_id = _uploads_collection_ids.get(tenant_id)
+        if collection_id is not None:
+            _uploads_collection_ids.move_to_end(tenant_id)
+            return collection_id
+
+    result = await db.execute(
+        select(Collection.id)
+        .where(Collection.tenant_id == tenant_id)
+        .where(Collection.name == UPLOADS_COLLECTION_NAME)
+    )
+    collection_id = result.scalar_one_or_none()
+    if collection_id is not None:
+        _remember_uploads_collection(tenant_id, collection_id)
+    else:
+        forget_uploads_collection(tenant_id)
+    return collection_id
+
+
+async def _recheck_uploads_collection_id(
+    db, tenant_id: UUID, collection_id: UUID
+) -> UUID | None:
+    """Re-resolve a cached __uploads__ id after a read under it found nothing.
+
+    forget_uploads_collection only clears the process that served the
+    delete, so another process may still hold the id of a collection that
+    has since been recreated. Returns the replacement id, or None when the
+    cached id was still current (or the collection is gone).
+    """
+    fresh_id = await _get_uploads_collection_id(db, tenant_id, refresh=True)
+    return fresh_id if fresh_id != collection_id else None
 
 
 async def _get_or_create_uploads_collection(
     db, tenant_id: UUID
 ) -> Collection:
     """Get or create the __uploads__ collection for a tenant."""
+    # Always hit the DB on the write path so a stale cache entry can never
+    # attach new documents to a deleted collection.
     result = await db.execute(
         select(Collection)
         .where(Collection.tenant_id == tenant_id)
@@ -48,6 +112,7 @@ async def _get_or_create_uploads_collection(
     collection = result.scalar_one_or_none()
 
     if collection:
+        _remember_uploads_collection(tenant_id, collection.id)
         return collection
 
     collection = Collection(
@@ -72,28 +137,31 @@ async def list_uploads(
     tenant_id = user.tenant_id
 
     # Find the uploads collection
-    col_result = await db.execute(
-        select(Collection)
-        .where(Collection.tenant_id == tenant_id)
-        .where(Collection.name == UPLOADS_COLLECTION_NAME)
-    )
-    collection = col_result.scalar_one_or_none()
+    cached = tenant_id in _uploads_collection_ids
+    collection_id = await _get_uploads_collection_id(db, tenant_id)
 
-    if not collection:
+    if not collection_id:
         return []
 
-    query = (
-        select(Document)
-        .where(Document.collection_id == collection.id)
-    )
+    async def fetch(collection_id: UUID) -> list[Document]:
+        query = (
+            select(Document)
+            .where(Document.collection_id == collection_id)
+        )
+
+        if status_filter:
+            query = query.where(Document.status == status_filter)
 
-    if status_filter:
-        query = query.where(Document.status == status_filter)
+        query = query.order_by(Document.created_at.desc()).limit(limit).offset(offset)
 
-    query = query.order_by(Document.created_at.desc()).limit(limit).offset(offset)
+        result = await db.execute(query)
+        return list(result.scalars().all())
 
-    result = await db.execute(query)
-    documents = list(result.scalars().all())
+    documents = await fetch(collection_id)
+    if not documents and cached:
+        fresh_id = await _recheck_uploads_collection_id(db, tenant_id, collection_id)
+        if fresh_id:
+            documents = await fetch(fresh_id)
 
     return [UploadDocumentRead.from_document(doc) for doc in documents]
 
@@ -120,16 +188,10 @@ async def get_upload(
     db: DbSession,
 ) -> UploadDocumentDetail:
     """Get a specific uploaded document with its pages."""
-    doc = await _get_upload_document(document_id, user.tenant_id, db)
+    doc = await _get_upload_document(document_id, user.tenant_id, db, load_pages=True)
 
-    # Get pages
-    pages_result = await db.execute(
-        select(DocumentPage)
-        .where(DocumentPage.document_id == document_id)
-        .order_by(DocumentPage.page_number)
-    )
     pages = []
-    for p in pages_result.scalars().all():
+    for p in doc.pages:
         resolved_text = await _resolve_page_images(p.text, p.meta)
         pages.append(UploadPageRead(
             page_number=p.page_number,
@@ -151,16 +213,10 @@ async def get_upload_pages(
     db: DbSession,
 ) -> list[UploadPageRead]:
     """Get extracted pages/text for a document (reader view)."""
-    await _get_upload_document(document_id, user.tenant_id, db)
-
-    result = await db.execute(
-        select(DocumentPage)
-        .where(DocumentPage.document_id == document_id)
-        .order_by(DocumentPage.page_number)
-    )
+    doc = await _get_upload_document(document_id, user.tenant_id, db, load_pages=True)
 
     pages = []
-    for p in result.scalars().all():
+    for p in doc.pages:
         resolved_text = await _resolve_page_images(p.text, p.meta)
         pages.append(UploadPageRead(
             page_number=p.page_number,
@@ -218,29 +274,49 @@ async def upload_documents(
     """
     tenant_id = user.tenant_id
 
-    # Check file limit for free tier
-    allowed, error = await quota_service.check_upload_allowed(db, user)
-    if not allowed:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=error,
-        )
+    # Cap concurrent bulk uploads per tenant so one burst can't hold the
+    # whole DB pool; extra requests wait for a slot. Auth already queried
+    # this session, so end that transaction first: a queued request must not
+    # keep a pooled connection checked out while it waits (expire_on_commit
+    # is off, so ``user`` stays usable).
+    await db.commit()
+    async with upload_admission(tenant_id):
+        # Check file limit for free tier
+        allowed, error = await quota_service.check_upload_allowed(db, user)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=error,
+            )
 
-    # Get or create the uploads collection
-    collection = await _get_or_create_uploads_collection(db, tenant_id)
+        # Get or create the uploads collection
+        collection = await _get_or_create_uploads_collection(db, tenant_id)
 
-    results: list[UploadDocumentRead] = []
-    pool = await get_arq_pool()
+        # The session can't be shared across tasks, so reads, quota and dedupe
+        # checks and inserts stay sequential; only the S3 PUTs run concurrently.
+        results: list[UploadDocumentRead | None] = []
+        to_store: list[tuple[int, UploadFile, bytes, str]] = []
+        batch_hashes: dict[str, int] = {}  # content_hash -> slot of its first upload
+        aliases: list[tuple[int, int]] = []  # (slot, slot it duplicates)
+        pending_bytes = 0
 
-    try:
         for file in files:
-            content = await file.read()
+            # Read and hash in one worker-thread pass, off the event loop
+            content, content_hash = await asyncio.to_thread(
+                storage_service.read_and_hash, file.file
+            )
             if not content:
                 continue
 
-            # Check storage quota
+            # Same file twice in one request: reuse the first upload
+            if content_hash in batch_hashes:
+                aliases.append((len(results), batch_hashes[content_hash]))
+                results.append(None)
+                continue
+
+            # Check storage quota, counting files accepted earlier in this batch
             allowed, error = await usage_service.check_storage_quota(
-                db, tenant_id, len(content)
+                db, tenant_id, pending_bytes + len(content)
             )
             if not allowed:
                 raise HTTPException(
@@ -249,35 +325,49 @@ async def upload_documents(
                 )
 
             # Check for duplicate
-            content_hash = storage_service.compute_hash(content)
-            dup_result = await db.execute(
-                select(Document)
+            # Probe for the id only; the full row is loaded just on a hit
+            dup_id = (await db.execute(
+                select(Document.id)
                 .where(Document.collection_id == collection.id)
                 .where(Document.content_hash == content_hash)
-            )
-            existing = dup_result.scalar_one_or_none()
+                .limit(1)
+            )).scalar()
 
-            if existing:
+            if dup_id:
+                existing = await db.get(Document, dup_id)
                 results.append(UploadDocumentRead.from_document(existing))
                 continue
 
-            # Upload to S3
-            filename = file.filename or "unnamed"
-            content_type = file.content_type or "application/octet-stream"
+            batch_hashes[content_hash] = len(results)
+            to_store.append((len(results), file, content, content_hash))
+            results.append(None)
+            pending_bytes += len(content)
+
+        # Upload to S3 concurrently
+        upload_sem = asyncio.Semaphore(_S3_UPLOAD_CONCURRENCY)
+
+        async def _store(file: UploadFile, content: bytes, content_hash: str):
+            async with upload_sem:
+                return await storage_service.upload_file(
+                    tenant_id=tenant_id,
+                    collection_id=collection.id,
+                    filename=file.filename or "unnamed",
+                    content=content,
+                    content_type=file.content_type or "application/octet-stream",
+                    content_hash=content_hash,
+                )
 
-            s3_key, _, file_size = await storage_service.upload_file(
-                tenant_id=tenant_id,
-                collection_id=collection.id,
-                filename=filename,
-                content=content,
-                content_type=content_type,
-            )
+        stored = await asyncio.gather(
+            *(_store(file, content, content_hash) for _, file, content, content_hash in to_store)
+        )
 
+        document_ids: list[str] = []
+        for (slot, file, _, content_hash), (s3_key, _, file_size) in zip(to_store, stored, strict=True):
             # Create document record with rich metadata
             document = Document(
                 collection_id=collection.id,
-                filename=filename,
-                content_type=content_type,
+                filename=file.filename or "unnamed",
+                content_type=file.content_type or "application/octet-stream",
                 s3_key=s3_key,
                 content_hash=content_hash,
                 file_size=file_size,
@@ -298,15 +388,26 @@ async def upload_documents(
                 db, tenant_id, tokens=0, file_size=file_size
             )
 
-            # Queue processing job
-            await pool.enqueue_job("process_document", str(document.id))
-
-            results.append(UploadDocumentRead.from_document(document))
-    finally:
-        await pool.close()
-
-    await db.commit()
-    return results
+            document_ids.append(str(document.id))
+            results[slot] = UploadDocumentRead.from_document(document)
+
+        for slot, source in aliases:
+            results[slot] = results[source]
+
+        # Commit before enqueueing so the worker always finds the documents, then
+        # enqueue all processing jobs concurrently instead of one RTT chain per file
+        await db.commit()
+        if document_ids:
+            pool = await get_arq_pool()
+            await asyncio.gather(
+                *(
+                    pool.enqueue_job(
+                        "process_document", doc_id, _job_id=f"process_document:{doc_id}"
+                    )
+                    for doc_id in document_ids
+                )
+            )
+        return results
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -315,7 +416,7 @@ async def delete_upload(
     user: CurrentUser,
     db: DbSession,
 ) -> None:
-    """Delete an uploaded document (ordered: status → vectors → S3 → DB)."""
+    """Delete an uploaded document (ordered: status → vectors + S3 → DB)."""
     from app.core.vector_store import vector_store
 
     doc = await _get_upload_document(document_id, user.tenant_id, db)
@@ -324,16 +425,16 @@ async def delete_upload(
     doc.status = "deleting"
     await db.flush()
 
-    # 2. Delete from vector store
-    await vector_store.delete_by_document(document_id, user.tenant_id)
-
-    # 3. Delete from S3
-    await storage_service.delete_file(doc.s3_key)
+    # 2. Delete from vector store and S3 (independent, run concurrently)
+    await asyncio.gather(
+        vector_store.delete_by_document(document_id, user.tenant_id),
+        storage_service.delete_file(doc.s3_key),
+    )
 
-    # 4. Reduce storage usage
+    # 3. Reduce storage usage
     await usage_service.reduce_storage(db, user.tenant_id, doc.file_size)
 
-    # 5. Delete from DB (cascades to chunks + pages)
+    # 4. Delete from DB (cascades to chunks + pages)
     await db.delete(doc)
     await db.commit()
 
@@ -357,26 +458,46 @@ async def reprocess_upload(
     doc.error_message = None
 
     # Queue processing job
+    # Per-second job id: a double-submitted reprocess collapses into one job,
+    # while a later reprocess isn't dropped against the kept previous result
     pool = await get_arq_pool()
-    await pool.enqueue_job("process_document", str(doc.id))
-    await pool.close()
+    await pool.enqueue_job(
+        "process_document",
+        str(doc.id),
+        _job_id=f"reprocess_document:{doc.id}:{int(time.time())}",
+    )
 
     await db.commit()
     return UploadDocumentRead.from_document(doc)
 
 
 async def _get_upload_document(
-    document_id: UUID, tenant_id: UUID, db
+    document_id: UUID, tenant_id: UUID, db, *, load_pages: bool = False
 ) -> Document:
-    """Get an uploaded document, verifying tenant ownership."""
-    result = await db.execute(
-        select(Document)
-        .join(Collection)
-        .where(Document.id == document_id)
-        .where(Collection.tenant_id == tenant_id)
-        .where(Collection.name == UPLOADS_COLLECTION_NAME)
-    )
-    document = result.scalar_one_or_none()
+    """Get an uploaded document, verifying tenant ownership.
+
+    With load_pages, the pages are joined into the same query.
+    """
+    async def fetch(collection_id: UUID) -> Document | None:
+        query = (
+            select(Document)
+            .where(Document.id == document_id)
+            .where(Document.collection_id == collection_id)
+        )
+        if load_pages:
+            query = query.options(joinedload(Document.pages))
+        result = await db.execute(query)
+        return result.unique().scalar_one_or_none()
+
+    cached = tenant_id in _uploads_collection_ids
+    collection_id = await _get_uploads_collection_id(db, tenant_id)
+    document = None
+    if collection_id:
+        document = await fetch(collection_id)
+        if not document and cached:
+            fresh_id = await _recheck_uploads_collection_id(db, tenant_id, collection_id)
+            if fresh_id:
+                document = await fetch(fresh_id)
 
     if not document:
         raise HTTPException(
@@ -3,11 +3,10 @@
 import logging
 from uuid import UUID
 
-from arq import ArqRedis, create_pool
 from fastapi import APIRouter, HTTPException, status
 
 from app.deps import CurrentUser, DbSession
-from app.workers.settings import redis_settings
+from app.workers.settings import get_arq_pool
 
 logger = logging.getLogger(__name__)
 from app.schemas.workspace_document import (
@@ -109,9 +108,8 @@ async def patch_content(
 
     # Enqueue RAG indexing (fire-and-forget)
     try:
-        pool: ArqRedis = await create_pool(redis_settings)
+        pool = await get_arq_pool()
         await pool.enqueue_job("index_workspace_document_task", str(doc_id))
-        await pool.close()
     except Exception as e:
         logger.warning("Failed to enqueue workspace document indexing: %s", e)
 
@@ -0,0 +1,55 @@
+"""Per-tenant admission control for expensive endpoints.
+
+Caps how many requests a single tenant can have in flight on a given
+endpoint so one tenant's burst cannot exhaust the DB pool for everyone.
+Excess requests wait (in-process) for a slot rather than failing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+
+
+class TenantAdmission:
+    """Concurrency cap keyed by tenant, backed by an asyncio.Condition.
+
+    Usage::
+
+        upload_admission = TenantAdmission(limit=4)
+
+        async with upload_admission(tenant_id):
+            ...
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._active: defaultdict[Hashable, int] = defaultdict(int)
+        self._cv = asyncio.Condition()
+
+    def active(self, tenant_id: Hashable) -> int:
+        return self._active.get(tenant_id, 0)
+
+    async def acquire(self, tenant_id: Hashable) -> None:
+        async with self._cv:
+            await self._cv.wait_for(lambda: self.active(tenant_id) < self._limit)
+            self._active[tenant_id] += 1
+
+    async def release(self, tenant_id: Hashable) -> None:
+        async with self._cv:
+            self._active[tenant_id] -= 1
+            if self._active[tenant_id] <= 0:
+                del self._active[tenant_id]
+            # Waiters of every tenant share the condition: wake them all so
+            # the one whose tenant just freed a slot is never left sleeping
+            self._cv.notify_all()
+
+    @asynccontextmanager
+    async def __call__(self, tenant_id: Hashable) -> AsyncIterator[None]:
+        await self.acquire(tenant_id)
+        try:
+            yield
+        finally:
+            await self.release(tenant_id)
@@ -14,11 +14,12 @@ The reactive profile continues to use chat_service.chat_stream() directly.
 
 from __future__ import annotations
 
-import json
+import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from uuid import UUID
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.config import get_settings
@@ -27,15 +28,41 @@ from app.core.logging import get_logger
 from app.core.planner import AgentPlan, PlanStepStatus, max_tool_rounds
 from app.core.tool_registry import ToolCategory, ToolDefinition, tool_registry
 from app.core.tools.executor import execute_tool_call
+from app.core.tools.retrieval_tool import format_chunks_for_llm
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+MISTRAL_BASE_URL = "https://api.mistral.ai/v1"
+
+
+# ── LLM client cache ────────────────────────────────────────────────
+
+# One client per (api_key, base_url): runs share its httpx pool, so
+# keep-alive connections and TLS sessions survive across runs.
+_llm_clients: dict[tuple[str, str], AsyncOpenAI] = {}
+
+
+def _get_mistral_client(api_key: str, base_url: str = MISTRAL_BASE_URL) -> AsyncOpenAI:
+    client = _llm_clients.get((api_key, base_url))
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        _llm_clients[(api_key, base_url)] = client
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Close the cached LLM clients (call on worker shutdown)."""
+    clients = list(_llm_clients.values())
+    _llm_clients.clear()
+    for client in clients:
+        await client.close()
+
 
 # ── Events emitted by the agent loop ────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """Event emitted by the agent loop to the caller."""
 
@@ -46,7 +73,7 @@ class AgentEvent:
 # ── Agent loop context ──────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """All state needed for the agent loop."""
 
@@ -73,10 +100,7 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
 
     Yields AgentEvent objects that the worker publishes to Redis Streams.
     """
-    client = AsyncOpenAI(
-        api_key=settings.mistral_api_key,
-        base_url="https://api.mistral.ai/v1",
-    )
+    client = _get_mistral_client(settings.mistral_api_key)
 
     budget = ctx.budget or BudgetManager(total=30_000)
     max_rounds = max_tool_rounds(ctx.profile)
@@ -126,12 +150,26 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
 
         # ── Accumulate streamed response ────────────────────────
         streamed_content = ""
-        tool_calls_acc: dict[int, dict] = {}
+        # Indexed by tc.index; arguments are kept as fragments and joined once
+        tool_calls_acc: list[dict | None] = []
         round_tokens_in = 0
         round_tokens_out = 0
+        # Tokens are coalesced over agent_delta_batch_ms windows so the
+        # caller gets a few larger token events instead of one per chunk
+        token_buf: list[str] = []
+        batch_window = settings.agent_delta_batch_ms / 1000
+        last_flush = time.monotonic()
 
         try:
             async for chunk in stream:
+                # Usage info (last chunk); SDK chunks always carry .usage,
+                # None until the end. Read before the choices check since
+                # the usage-only chunk may come with no choices.
+                usage = chunk.usage
+                if usage is not None:
+                    round_tokens_in = usage.prompt_tokens or 0
+                    round_tokens_out = usage.completion_tokens or 0
+
                 choice = chunk.choices[0] if chunk.choices else None
                 if not choice:
                     continue
@@ -142,37 +180,52 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
                 if delta.content:
                     streamed_content += delta.content
                     full_response += delta.content
-                    yield AgentEvent(event="token", data=delta.content)
+                    token_buf.append(delta.content)
+                    now = time.monotonic()
+                    if now - last_flush >= batch_window:
+                        yield AgentEvent(event="token", data="".join(token_buf))
+                        token_buf.clear()
+                        last_flush = now
 
                 # Tool calls (incremental accumulation)
                 if delta.tool_calls:
+                    if token_buf:
+                        yield AgentEvent(event="token", data="".join(token_buf))
+                        token_buf.clear()
+                        last_flush = time.monotonic()
                     for tc in delta.tool_calls:
-                        idx = tc.index
-                        if idx not in tool_calls_acc:
-                            tool_calls_acc[idx] = {"id": "", "name": "", "arguments": ""}
+                        idx = tc.index or 0
+                        if idx >= len(tool_calls_acc):
+                            tool_calls_acc.extend([None] * (idx + 1 - len(tool_calls_acc)))
+                        entry = tool_calls_acc[idx]
+                        if entry is None:
+                            entry = tool_calls_acc[idx] = {"id": "", "name": "", "arguments": []}
                         if tc.id:
-                            tool_calls_acc[idx]["id"] = tc.id
+                            entry["id"] = tc.id
                         if tc.function and tc.function.name:
-                            tool_calls_acc[idx]["name"] = tc.function.name
+                            entry["name"] = tc.function.name
                         if tc.function and tc.function.arguments:
-                            tool_calls_acc[idx]["arguments"] += tc.function.arguments
-
-                # Usage info (last chunk)
-                if hasattr(chunk, "usage") and chunk.usage:
-                    round_tokens_in = chunk.usage.prompt_tokens or 0
-                    round_tokens_out = chunk.usage.completion_tokens or 0
+                            entry["arguments"].append(tc.function.arguments)
 
         except Exception as e:
+            if token_buf:
+                yield AgentEvent(event="token", data="".join(token_buf))
             yield AgentEvent(event="error", data=f"Stream error: {e}")
             return
 
+        if token_buf:
+            yield AgentEvent(event="token", data="".join(token_buf))
+
         total_tokens_in += round_tokens_in
         total_tokens_out += round_tokens_out
         budget.consume_safe(round_tokens_in + round_tokens_out)
 
         # ── No tool calls → done ────────────────────────────────
-        if not tool_calls_acc:
+        tool_calls = [tc_data for tc_data in tool_calls_acc if tc_data is not None]
+        if not tool_calls:
             break
+        for tc_data in tool_calls:
+            tc_data["arguments"] = "".join(tc_data["arguments"])
 
         # ── Process tool calls ──────────────────────────────────
         # Build assistant message with tool_calls for message history
@@ -185,7 +238,7 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
                     "arguments": tc_data["arguments"],
                 },
             }
-            for tc_data in tool_calls_acc.values()
+            for tc_data in tool_calls
         ]
         messages.append({
             "role": "assistant",
@@ -195,11 +248,11 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
 
         has_continuation_tools = False
 
-        for tc_data in tool_calls_acc.values():
+        for tc_data in tool_calls:
             tool_name = tc_data["name"]
             try:
-                args = json.loads(tc_data["arguments"])
-            except json.JSONDecodeError:
+                args = orjson.loads(tc_data["arguments"])
+            except orjson.JSONDecodeError:
                 args = {}
 
             yield AgentEvent(
@@ -246,7 +299,6 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
             if definition and definition.category == ToolCategory.RETRIEVAL and result.success:
                 # Internal RAG: result is list[RetrievedChunk]
                 if isinstance(result.result, list):
-                    from app.core.tools.retrieval_tool import format_chunks_for_llm
                     tool_content = format_chunks_for_llm(result.result)
                     for chunk in result.result:
                         all_citations.append({
@@ -296,9 +348,9 @@ async def run_agent_loop(ctx: AgentContext) -> AsyncIterator[AgentEvent]:
                     and result.success and isinstance(result.result, dict)):
                 cal_result = result.result
                 if cal_result.get("type") == "error":
-                    tool_content = json.dumps({"error": cal_result.get("message", "Calendar error")})
+                    tool_content = orjson.dumps({"error": cal_result.get("message", "Calendar error")}).decode()
                 else:
-                    tool_content = json.dumps(cal_result, ensure_ascii=False)
+                    tool_content = orjson.dumps(cal_result, option=orjson.OPT_NON_STR_KEYS).decode()
 
             messages.append({
                 "role": "tool",
@@ -56,13 +56,16 @@ class ReservationError(Exception):
 # ── Reservation envelope ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class Reservation:
     """A carved-out sub-budget for delegation or tool execution."""
 
     label: str
     allocated: int
     consumed: int = 0
+    # Set while held by a BudgetManager so consumption keeps its reserved
+    # total in sync
+    _owner: BudgetManager | None = field(default=None, repr=False, compare=False)
 
     @property
     def remaining(self) -> int:
@@ -72,12 +75,14 @@ class Reservation:
         if tokens > self.remaining:
             raise BudgetExhausted(requested=tokens, remaining=self.remaining)
         self.consumed += tokens
+        if self._owner is not None:
+            self._owner._reserved_remaining -= tokens
 
 
 # ── Budget manager ──────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetManager:
     """In-memory budget tracker for a single agent run.
 
@@ -97,14 +102,15 @@ class BudgetManager:
     total: int
     consumed: int = 0
     _reservations: dict[str, Reservation] = field(default_factory=dict)
+    # Sum of remaining tokens across active reservations, kept incrementally
+    _reserved_remaining: int = field(default=0, init=False, repr=False)
 
     # ── Core budget ─────────────────────────────────────────────
 
     @property
     def remaining(self) -> int:
         """Tokens available (minus active reservations)."""
-        reserved = sum(r.remaining for r in self._reservations.values())
-        return self.total - self.consumed - reserved
+        return self.total - self.consumed - self._reserved_remaining
 
     @property
     def hard_remaining(self) -> int:
@@ -144,8 +150,9 @@ class BudgetManager:
         if tokens > self.remaining:
             raise BudgetExhausted(requested=tokens, remaining=self.remaining)
 
-        reservation = Reservation(label=label, allocated=tokens)
+        reservation = Reservation(label=label, allocated=tokens, _owner=self)
         self._reservations[label] = reservation
+        self._reserved_remaining += tokens
         return reservation
 
     def release(self, reservation: Reservation) -> int:
@@ -161,8 +168,10 @@ class BudgetManager:
         # The consumed part of the reservation becomes consumed in global budget
         self.consumed += reservation.consumed
         returned = reservation.remaining
+        self._reserved_remaining -= returned
 
         del self._reservations[reservation.label]
+        reservation._owner = None
 
         logger.debug(
             "budget_reservation_released",
@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationEntry:
     """A single citation with provenance tracking."""
 
@@ -25,9 +25,13 @@ class CitationEntry:
     @property
     def dedup_key(self) -> str:
         """Key for deduplication: document + page (or chunk_id for unique chunks)."""
-        if self.page_number is not None:
-            return f"{self.document_id}:p{self.page_number}"
-        return f"{self.document_id}:{self.chunk_id}"
+        return _dedup_key(self.document_id, self.chunk_id, self.page_number)
+
+
+def _dedup_key(document_id: str, chunk_id: str, page_number: int | None) -> str:
+    if page_number is not None:
+        return f"{document_id}:p{page_number}"
+    return f"{document_id}:{chunk_id}"
 
 
 class CitationRegistry:
@@ -53,17 +57,29 @@ class CitationRegistry:
 
     def add_from_dict(self, citation: dict, source_assistant_id: str | None = None) -> bool:
         """Add a citation from a dict (as used in agent_loop citations)."""
+        # Duplicates are the common case across delegations: settle them
+        # from the key and score before building an entry
+        chunk_id = str(citation.get("chunk_id", ""))
+        document_id = str(citation.get("document_id", ""))
+        page_number = citation.get("page_number")
+        key = _dedup_key(document_id, chunk_id, page_number)
+        score = float(citation.get("score", 0.0))
+        existing = self._entries.get(key)
+        if existing is not None and score <= existing.score:
+            return False
+
         entry = CitationEntry(
-            chunk_id=str(citation.get("chunk_id", "")),
-            document_id=str(citation.get("document_id", "")),
+            chunk_id=chunk_id,
+            document_id=document_id,
             document_filename=str(citation.get("document_filename", "")),
-            page_number=citation.get("page_number"),
+            page_number=page_number,
             excerpt=str(citation.get("excerpt", "")),
-            score=float(citation.get("score", 0.0)),
+            score=score,
             url=citation.get("url"),
             source_assistant_id=source_assistant_id,
         )
-        return self.add(entry)
+        self._entries[key] = entry
+        return existing is None
 
     def merge(self, citations: list[dict], source_assistant_id: str | None = None) -> list[dict]:
         """Merge a list of citation dicts, returning only the new ones."""
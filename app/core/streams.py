@@ -7,10 +7,11 @@ for client-side idempotence.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import time
 from uuid import UUID
 
+import orjson
 import redis.asyncio as aioredis
 
 from app.config import get_settings
@@ -24,12 +25,38 @@ EVENT_BLOCK = "block"            # generative UI block
 EVENT_CITATIONS = "citations"    # source citations
 EVENT_DONE = "done"              # run completed
 EVENT_ERROR = "error"            # run failed
+EVENT_HEARTBEAT = "heartbeat"    # consumer-side keepalive, never published
+
+
+# SSE "event:" line each stream event type is forwarded under (deltas as "token")
+SSE_EVENT_LINES: dict[str, bytes] = {
+    EVENT_STATUS: b"event: status\n",
+    EVENT_DELTA: b"event: token\n",
+    EVENT_TOOL: b"event: tool\n",
+    EVENT_BLOCK: b"event: block\n",
+    EVENT_CITATIONS: b"event: citations\n",
+    EVENT_DONE: b"event: done\n",
+    EVENT_ERROR: b"event: error\n",
+}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a payload; default=str keeps the old fallback for odd types."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
 
 
 def _stream_key(run_id: UUID | str) -> str:
     return f"agent:{run_id}"
 
 
+def format_sse(prefix: bytes, data: bytes) -> bytes:
+    """Format an SSE frame from a precomputed event line, with multi-line support."""
+    if b"\n" not in data:
+        return prefix + b"data: " + data + b"\n\n"
+    data_lines = b"".join(b"data: " + line + b"\n" for line in data.split(b"\n"))
+    return prefix + data_lines + b"\n"
+
+
 class AgentStreamPublisher:
     """Publishes events to a Redis Stream for a single agent run.
 
@@ -46,6 +73,10 @@ class AgentStreamPublisher:
         self._redis = redis
         self._key = _stream_key(run_id)
         self._seq = 0
+        # Defaults keep every XADD capped even when setup() is skipped
+        # (e.g. failing a run from the watchdog)
+        self._ttl = 600
+        self._maxlen = 2000
 
     async def setup(self, ttl: int = 600, maxlen: int = 2000) -> None:
         """Set TTL on the stream key and configure trim policy."""
@@ -61,7 +92,7 @@ class AgentStreamPublisher:
             "seq": str(self._seq),
             "type": event_type,
             "ts": str(time.time()),
-            "data": json.dumps(payload, default=str),
+            "data": _dumps(payload),
         }
         msg_id = await self._redis.xadd(
             self._key,
@@ -111,15 +142,23 @@ class AgentStreamPublisher:
         return await self._emit(EVENT_ERROR, {"code": code, "message": message})
 
 
+
+# Shared keepalive event; consumers must treat it as read-only
+_HEARTBEAT_EVENT = {"seq": "-1", "type": EVENT_HEARTBEAT}
+
+
 class AgentStreamConsumer:
     """Async generator that reads events from an agent stream.
 
     Usage::
 
         async for event in AgentStreamConsumer(redis, run_id):
-            # event = {"seq": "1", "type": "delta", "ts": "...", "data": {...}}
+            # event = {"seq": "1", "type": "delta", "ts": "...", "data": "{...}"}
             if event["type"] == "done":
                 break
+
+    With ``raw_data=True`` the ``data`` field is yielded as the undecoded JSON
+    bytes stored by the publisher, for callers that forward it verbatim.
     """
 
     def __init__(
@@ -131,6 +170,8 @@ class AgentStreamConsumer:
         block_ms: int = 500,
         heartbeat_interval: float = 15.0,
         hard_timeout: float = 180.0,
+        yield_every: int = 16,
+        raw_data: bool = False,
     ) -> None:
         self._redis = redis
         self._key = _stream_key(run_id)
@@ -138,10 +179,24 @@ class AgentStreamConsumer:
         self._block_ms = block_ms
         self._heartbeat_interval = heartbeat_interval
         self._hard_timeout = hard_timeout
+        # XREAD returns up to 50 events at once; hand control back to the
+        # event loop every N buffered events so a burst can't starve other streams
+        self._yield_every = yield_every
+        self._raw_data = raw_data
 
     def __aiter__(self):
         return self._consume()
 
+    def _synthetic(self, event_type: str, payload: dict) -> dict:
+        """Build a locally generated event (timeout, heartbeat)."""
+        data = _dumps(payload)
+        return {
+            "seq": "-1",
+            "type": event_type,
+            "ts": str(time.time()),
+            "data": data if self._raw_data else data.decode(),
+        }
+
     async def _consume(self):
         start_time = time.time()
         last_event_time = start_time
@@ -149,12 +204,9 @@ class AgentStreamConsumer:
         while True:
             elapsed = time.time() - start_time
             if elapsed > self._hard_timeout:
-                yield {
-                    "seq": "-1",
-                    "type": EVENT_ERROR,
-                    "ts": str(time.time()),
-                    "data": json.dumps({"code": "hard_timeout", "message": "Stream timeout"}),
-                }
+                yield self._synthetic(
+                    EVENT_ERROR, {"code": "hard_timeout", "message": "Stream timeout"}
+                )
                 return
 
             result = await self._redis.xread(
@@ -167,26 +219,24 @@ class AgentStreamConsumer:
                 # No events — check heartbeat
                 since_last = time.time() - last_event_time
                 if since_last >= self._heartbeat_interval:
-                    yield {
-                        "seq": "-1",
-                        "type": EVENT_STATUS,
-                        "ts": str(time.time()),
-                        "data": json.dumps({"status": "heartbeat"}),
-                    }
+                    yield _HEARTBEAT_EVENT
                     last_event_time = time.time()
                 continue
 
             for _stream_name, messages in result:
-                for msg_id, fields in messages:
+                for i, (msg_id, fields) in enumerate(messages, 1):
+                    if i % self._yield_every == 0:
+                        await asyncio.sleep(0)
                     self._last_id = msg_id
                     last_event_time = time.time()
 
-                    # Decode bytes → str
+                    # Decode bytes → str (payload fields stay bytes in raw mode)
                     decoded = {}
                     for k, v in fields.items():
                         key = k.decode() if isinstance(k, bytes) else k
-                        val = v.decode() if isinstance(v, bytes) else v
-                        decoded[key] = val
+                        if isinstance(v, bytes) and not (self._raw_data and key == "data"):
+                            v = v.decode()
+                        decoded[key] = v
 
                     yield decoded
 
@@ -201,20 +251,28 @@ _redis_pool: aioredis.Redis | None = None
 
 
 async def get_redis() -> aioredis.Redis:
-    """Get or create the shared async Redis connection pool."""
+    """Get or create the shared async Redis client.
+
+    Backed by one blocking connection pool, so a burst of SSE clients waits
+    for a free connection instead of failing or opening unbounded sockets.
+    """
     global _redis_pool
     if _redis_pool is None:
         settings = get_settings()
-        _redis_pool = aioredis.from_url(
+        pool = aioredis.BlockingConnectionPool.from_url(
             settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            health_check_interval=30,
             decode_responses=False,  # We handle decoding in consumer
         )
+        _redis_pool = aioredis.Redis(connection_pool=pool)
     return _redis_pool
 
 
 async def close_redis() -> None:
-    """Close the Redis connection pool (call on shutdown)."""
+    """Close the Redis client and its connection pool (call on shutdown)."""
     global _redis_pool
     if _redis_pool is not None:
         await _redis_pool.aclose()
+        await _redis_pool.connection_pool.disconnect()
         _redis_pool = None
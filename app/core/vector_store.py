@@ -1,5 +1,6 @@
 """Qdrant vector store client."""
 
+import contextlib
 import logging
 from typing import Any
 from uuid import UUID
@@ -10,6 +11,9 @@ from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    KeywordIndexType,
     MatchAny,
     MatchValue,
     PointStruct,
@@ -21,6 +25,27 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Keyword payload indices used by search/delete filters.
+PAYLOAD_INDEX_FIELDS = (
+    "tenant_id", "collection_id", "document_id",
+    "scope", "user_id", "dossier_id", "dossier_document_id",
+    "project_id", "project_document_id",
+    "source_type", "source_id",
+)
+
+# Every search and delete is tenant-filtered (invariant #8), so the HNSW graph
+# is built per tenant_id value (payload_m) instead of across the whole
+# collection (m=0). Tenants never traverse each other's neighbours and the
+# tenant_id index co-locates each tenant's points on disk.
+TENANT_HNSW_CONFIG = HnswConfigDiff(m=0, payload_m=16)
+
+
+def _payload_schema(field: str) -> KeywordIndexParams:
+    return KeywordIndexParams(
+        type=KeywordIndexType.KEYWORD,
+        is_tenant=field == "tenant_id",
+    )
+
 
 class VectorStore:
     """Async Qdrant vector store client."""
@@ -45,42 +70,41 @@ class VectorStore:
                     size=self.vector_size,
                     distance=Distance.COSINE,
                 ),
+                hnsw_config=TENANT_HNSW_CONFIG,
             )
 
             # Create payload indices for filtering
-            for field in (
-                "tenant_id", "collection_id", "document_id",
-                "scope", "user_id", "dossier_id", "dossier_document_id",
-                "project_id", "project_document_id",
-                "source_type", "source_id",
-            ):
+            for field in PAYLOAD_INDEX_FIELDS:
                 await self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field,
-                    field_schema="keyword",
+                    field_schema=_payload_schema(field),
                 )
 
     async def ensure_payload_indices(self) -> None:
         """Ensure all required payload indices exist (idempotent).
 
         Safe to call on an existing collection — Qdrant ignores
-        create_payload_index if the index already exists.
+        create_payload_index if the index already exists. Collections created
+        before per-tenant HNSW are switched over here; Qdrant rebuilds the
+        graph in the background and keeps serving searches meanwhile.
         """
-        for field in (
-            "tenant_id", "collection_id", "document_id",
-            "scope", "user_id", "dossier_id", "dossier_document_id",
-            "project_id", "project_document_id",
-            "source_type", "source_id",
-        ):
+        for field in PAYLOAD_INDEX_FIELDS:
             try:
                 await self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field,
-                    field_schema="keyword",
+                    field_schema=_payload_schema(field),
                 )
             except UnexpectedResponse:
                 pass  # Index already exists or collection missing
 
+        with contextlib.suppress(UnexpectedResponse):  # Collection missing
+            await self.client.update_collection(
+                collection_name=self.collection_name,
+                hnsw_config=TENANT_HNSW_CONFIG,
+            )
+
     async def upsert_chunks(
         self,
         chunks: list[dict[str, Any]],
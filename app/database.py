@@ -1,6 +1,9 @@
 """Database configuration and session management."""
 
+import secrets
+import time
 from collections.abc import AsyncGenerator
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -36,6 +39,22 @@ class Base(DeclarativeBase):
     pass
 
 
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit Unix millisecond timestamp followed by 74 random bits. Successive
+    ids sort by creation time, so primary-key inserts append to the right
+    edge of the B-tree instead of splitting random leaf pages like uuid4.
+    """
+    rand = secrets.randbits(74)
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 62) << 64  # rand_a (12 bits)
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)  # rand_b (62 bits)
+    return UUID(int=value)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session."""
     async with async_session_maker() as session:
@@ -63,7 +63,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     from app.core.streams import close_redis
+    from app.services.presentation_events import presentation_event_hub
+    from app.workers.settings import close_arq_pool
+    await presentation_event_hub.aclose()
     await close_redis()
+    await close_arq_pool()
     await engine.dispose()
 
 
@@ -2,14 +2,14 @@
 
 from datetime import datetime
 from enum import StrEnum
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, uuid7
 
 
 class AgentProfile(StrEnum):
@@ -36,17 +36,38 @@ class AgentRun(Base):
     """Single agent execution with budget tracking and status lifecycle."""
 
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed', 'aborted', 'timeout')",
+            name="ck_agent_runs_status",
+        ),
+        Index(
+            "ix_agent_runs_status", "tenant_id", "status", text("created_at DESC"),
+            postgresql_include=[
+                "assistant_id", "conversation_id", "tokens_input", "tokens_output", "started_at",
+            ],
+        ),
+        # Only pending/running rows — used by the stuck-run watchdog
+        Index(
+            "ix_agent_runs_in_flight", "started_at",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        Index("ix_agent_runs_tenant_created", "tenant_id", text("created_at DESC")),
+        Index(
+            "ix_agent_runs_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     assistant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -61,15 +82,14 @@ class AgentRun(Base):
     )
 
     profile: Mapped[str] = mapped_column(
-        String(20),
+        Text,
         default=AgentProfile.REACTIVE.value,
         nullable=False,
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        Text,
         default=AgentRunStatus.PENDING.value,
         nullable=False,
-        index=True,
     )
 
     input_text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -83,7 +103,7 @@ class AgentRun(Base):
     budget_tokens_remaining: Mapped[int | None] = mapped_column(Integer)
 
     # Error tracking
-    error_code: Mapped[str | None] = mapped_column(String(50))
+    error_code: Mapped[str | None] = mapped_column(Text)
     error_message: Mapped[str | None] = mapped_column(Text)
 
     # Flexible metadata (plan JSON, tool results summary, etc.)
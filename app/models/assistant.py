@@ -38,7 +38,7 @@ class Assistant(Base):
     system_prompt: Mapped[str | None] = mapped_column(Text)
     model: Mapped[str] = mapped_column(String(100), default="mistral-medium-latest")
     agent_profile: Mapped[str] = mapped_column(
-        String(20), default="reactive", nullable=False,
+        Text, default="reactive", nullable=False,
     )
     settings: Mapped[dict | None] = mapped_column(JSONB, default=dict)
     
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -24,6 +24,12 @@ class AssistantMemory(Base):
             "tenant_id", "assistant_id",
             name="uq_assistant_memory_tenant_assistant",
         ),
+        Index(
+            "ix_assistant_memories_raw_gin", "tenant_id", "raw_json",
+            postgresql_using="gin", postgresql_ops={"raw_json": "jsonb_path_ops"},
+        ),
+        # Page headroom so in-place updates stay HOT (migration 054)
+        {"postgresql_with": {"fillfactor": 70}},
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -35,13 +41,11 @@ class AssistantMemory(Base):
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     assistant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("assistants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     raw_json: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
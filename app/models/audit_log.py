@@ -1,9 +1,9 @@
 """Audit log model — immutable event log for agent actions."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Index, Sequence, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -15,29 +15,37 @@ class AuditLog(Base):
     """Immutable audit trail for agent actions, tool calls, and system events.
 
     No FK on tenant_id/run_id for flexibility (system-level events may lack them).
+    Partitioned by month on created_at (see migration 037).
     """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        CheckConstraint("level IN ('debug', 'info', 'warn', 'error')", name="ck_audit_logs_level"),
+        Index("ix_audit_logs_tenant_created", "tenant_id", text("created_at DESC")),
+        Index(
+            "ix_audit_logs_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+    # Sequential bigint: inserts append to the right-most PK leaf
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Sequence("audit_logs_id_seq"),
         primary_key=True,
-        default=uuid4,
-    )
-    tenant_id: Mapped[UUID | None] = mapped_column(
-        PGUUID(as_uuid=True),
-        index=True,
     )
+    tenant_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True))
     run_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
         index=True,
     )
     user_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True))
 
-    action: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    action: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     # e.g. "tool_called", "delegation_started", "memory_updated", "run_completed"
 
-    entity_type: Mapped[str | None] = mapped_column(String(50))
+    entity_type: Mapped[str | None] = mapped_column(Text)
     # e.g. "assistant", "document", "collection"
 
     entity_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True))
@@ -45,13 +53,14 @@ class AuditLog(Base):
     detail: Mapped[dict | None] = mapped_column(JSONB)
     # Flexible payload: tool name, error info, before/after, etc.
 
-    level: Mapped[str] = mapped_column(String(10), default="info")
+    level: Mapped[str] = mapped_column(Text, default="info")
     # info | warn | error
 
     message: Mapped[str | None] = mapped_column(Text)
 
+    # Partition key (monthly RANGE partitions) — part of the primary key
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
-        index=True,
     )
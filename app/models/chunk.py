@@ -91,7 +91,7 @@ class Chunk(Base):
     )
 
     # Multi-source support (document, email, conversation_summary, etc.)
-    source_type: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    source_type: Mapped[str | None] = mapped_column(Text, nullable=True)
     source_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True), nullable=True)
 
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
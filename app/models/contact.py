@@ -17,7 +17,6 @@ from uuid import UUID, uuid4
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
-    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -26,11 +25,12 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
 
 if TYPE_CHECKING:
     from app.models.mail import MailMessage
@@ -77,7 +77,6 @@ class Contact(Base):
 
     __tablename__ = "contacts"
     __table_args__ = (
-        UniqueConstraint("tenant_id", "primary_email", name="uq_contacts_tenant_email"),
         CheckConstraint(
             "contact_type IN ('client', 'prospect', 'partenaire', 'fournisseur', 'candidat', 'interne', 'autre')",
             name="ck_contact_type",
@@ -121,7 +120,7 @@ class Contact(Base):
 
     # Metadata
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    tags: Mapped[list | None] = mapped_column(JSONB, nullable=True, default=list)
+    tags: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True, default=list)
     source: Mapped[str] = mapped_column(String(50), nullable=False, default="manual")
     confidence_score: Mapped[Decimal] = mapped_column(
         Numeric(3, 2), nullable=False, default=Decimal("1.0")
@@ -135,29 +134,93 @@ class Contact(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # Full-text search (generated column, read-only)
-    search_vector: Mapped[str | None] = mapped_column(
-        TSVECTOR, Computed("", persisted=True), nullable=True
-    )
-
     # Relationships
     tenant: Mapped["Tenant"] = relationship("Tenant")
     company: Mapped["Company | None"] = relationship("Company", back_populates="contacts")
     updates: Mapped[list["ContactUpdate"]] = relationship(
-        "ContactUpdate", back_populates="contact", cascade="all, delete-orphan"
+        "ContactUpdate",
+        back_populates="contact",
+        cascade="all, delete-orphan",
+        order_by="ContactUpdate.created_at.desc()",
     )
     email_links: Mapped[list["ContactEmailLink"]] = relationship(
         "ContactEmailLink", back_populates="contact", cascade="all, delete-orphan"
     )
 
 
+def _weighted_tsvector(config: str, column, weight: str):
+    # Constants are rendered inline: the planner only uses ix_contacts_search
+    # when the query expression is identical to the indexed one.
+    return func.setweight(
+        func.to_tsvector(
+            text(f"'{config}'::regconfig"),
+            func.coalesce(column, text("''")),
+        ),
+        text(f"'{weight}'"),
+    )
+
+
+# French stemming with accents folded first (migration 057); use it for tsqueries too
+CONTACT_SEARCH_CONFIG = "french_unaccent"
+
+# Full-text document for contacts, backed by the ix_contacts_search expression index
+contact_search_vector = (
+    _weighted_tsvector(CONTACT_SEARCH_CONFIG, Contact.first_name, "A")
+    .op("||")(_weighted_tsvector(CONTACT_SEARCH_CONFIG, Contact.last_name, "A"))
+    .op("||")(_weighted_tsvector("simple", Contact.primary_email, "B"))
+    .op("||")(_weighted_tsvector(CONTACT_SEARCH_CONFIG, Contact.notes, "C"))
+)
+
+Index("ix_contacts_search", contact_search_vector, postgresql_using="gin")
+
+# Case-insensitive uniqueness: lookups must compare LOWER(column) to hit these
+Index(
+    "uq_contacts_tenant_email",
+    Contact.tenant_id,
+    func.lower(Contact.primary_email),
+    unique=True,
+)
+Index(
+    "uq_companies_tenant_name",
+    Company.tenant_id,
+    func.lower(Company.company_name),
+    unique=True,
+)
+
+# Trigram indexes for substring (typeahead) search, which tsvector tokens cannot serve
+Index(
+    "ix_contacts_email_trgm",
+    func.lower(Contact.primary_email).label("primary_email_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"primary_email_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_companies_name_trgm",
+    func.lower(Company.company_name).label("company_name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"company_name_lower": "gin_trgm_ops"},
+)
+
+
 class ContactUpdate(Base):
-    """Audit trail for contact enrichment and modifications."""
+    """Audit trail for contact enrichment and modifications.
+
+    Partitioned by month on created_at (see migration 060).
+    """
 
     __tablename__ = "contact_updates"
+    __table_args__ = (
+        # Audit trail for one contact, newest first
+        Index("ix_contact_updates_contact_created", "contact_id", text("created_at DESC")),
+        Index(
+            "ix_contact_updates_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -169,7 +232,6 @@ class ContactUpdate(Base):
         PG_UUID(as_uuid=True),
         ForeignKey("contacts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     update_type: Mapped[str] = mapped_column(
@@ -193,8 +255,9 @@ class ContactUpdate(Base):
         nullable=True,
     )
 
+    # Partition key (monthly RANGE partitions) — part of the primary key
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
 
     # Relationships
@@ -206,9 +269,11 @@ class ContactEmailLink(Base):
 
     __tablename__ = "contact_email_links"
     __table_args__ = (
+        # Also serves contact_id lookups (leading column)
         UniqueConstraint(
             "contact_id", "mail_message_id", "link_type", name="uq_contact_email_link"
         ),
+        Index("ix_contact_email_links_message_id", "mail_message_id"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -224,13 +289,11 @@ class ContactEmailLink(Base):
         PG_UUID(as_uuid=True),
         ForeignKey("contacts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     mail_message_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("mail_messages.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     link_type: Mapped[str] = mapped_column(
         String(20), nullable=False, comment="sender | recipient"
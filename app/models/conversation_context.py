@@ -3,13 +3,34 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
+STRUCTURED_FIELDS = ("constraints", "decisions", "open_questions", "facts")
+
+
+def empty_structured() -> dict:
+    return {field: [] for field in STRUCTURED_FIELDS}
+
+
+def _structured_field(name: str) -> property:
+    """Expose one key of ``structured`` as a list attribute.
+
+    The setter assigns a new dict so the JSONB column is flagged dirty.
+    """
+
+    def getter(self: "ConversationContext") -> list:
+        return (self.structured or {}).get(name) or []
+
+    def setter(self: "ConversationContext", value: list | None) -> None:
+        self.structured = {**(self.structured or empty_structured()), name: value or []}
+
+    return property(getter, setter)
+
 
 class ConversationContext(Base):
     """Hot memory for a conversation: structured summary, constraints, decisions, facts.
@@ -24,6 +45,12 @@ class ConversationContext(Base):
             "tenant_id", "conversation_id",
             name="uq_conv_ctx_tenant_conversation",
         ),
+        Index(
+            "ix_conversation_contexts_structured_gin", "tenant_id", "structured",
+            postgresql_using="gin", postgresql_ops={"structured": "jsonb_path_ops"},
+        ),
+        # Page headroom so in-place updates stay HOT (migration 054)
+        {"postgresql_with": {"fillfactor": 70}},
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -35,7 +62,6 @@ class ConversationContext(Base):
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     conversation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -46,25 +72,27 @@ class ConversationContext(Base):
         PGUUID(as_uuid=True),
         ForeignKey("assistants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Narrative summary (max ~500 tokens)
     summary_text: Mapped[str | None] = mapped_column(Text)
 
-    # Structured extracted fields (append-only + dedupe)
-    constraints: Mapped[list | None] = mapped_column(JSONB, default=list)
-    # Structure: ["Le budget ne doit pas dépasser 50k€", ...]  (max 15)
-
-    decisions: Mapped[list | None] = mapped_column(JSONB, default=list)
-    # Structure: ["On utilise Next.js", ...]  (max 20)
-
-    open_questions: Mapped[list | None] = mapped_column(JSONB, default=list)
-    # Structure: ["Quel hébergeur choisir ?", ...]  (max 10)
+    # Structured extracted fields (append-only + dedupe), stored as one document:
+    #   constraints:    ["Le budget ne doit pas dépasser 50k€", ...]  (max 15)
+    #   decisions:      ["On utilise Next.js", ...]  (max 20)
+    #   open_questions: ["Quel hébergeur choisir ?", ...]  (max 10)
+    #   facts:          [{"key": "...", "value": "...", "source": "user|rag|inferred",
+    #                     "confidence": 0.9, "last_seen_at": "2026-02-20T..."}]  (max 20)
+    structured: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=empty_structured,
+    )
 
-    facts: Mapped[list | None] = mapped_column(JSONB, default=list)
-    # Structure: [{"key": "...", "value": "...", "source": "user|rag|inferred",
-    #              "confidence": 0.9, "last_seen_at": "2026-02-20T..."}]  (max 20)
+    constraints = _structured_field("constraints")
+    decisions = _structured_field("decisions")
+    open_questions = _structured_field("open_questions")
+    facts = _structured_field("facts")
 
     # Track interaction count for summarization triggers
     message_count: Mapped[int] = mapped_column(Integer, default=0)
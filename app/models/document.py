@@ -15,6 +15,7 @@ from app.database import Base
 if TYPE_CHECKING:
     from app.models.collection import Collection
     from app.models.chunk import Chunk
+    from app.models.document_page import DocumentPage
 
 
 class DocumentStatus(str, Enum):
@@ -79,4 +80,11 @@ class Document(Base):
         "Chunk",
         back_populates="document",
         cascade="all, delete-orphan",
+        passive_deletes=True,  # chunks.document_id is ON DELETE CASCADE
+    )
+    # Read-only: pages are written by the worker and removed by ON DELETE CASCADE
+    pages: Mapped[list["DocumentPage"]] = relationship(
+        "DocumentPage",
+        order_by="DocumentPage.page_number",
+        viewonly=True,
     )
@@ -2,13 +2,23 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
 
 if TYPE_CHECKING:
     from app.models.tenant import Tenant
@@ -16,19 +26,21 @@ if TYPE_CHECKING:
 
 class Folder(Base):
     __tablename__ = "folders"
+    __table_args__ = (
+        Index("ix_folders_tenant_updated", "tenant_id", text("updated_at DESC")),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     color: Mapped[str | None] = mapped_column(String(7), nullable=True)
 
@@ -55,21 +67,26 @@ class FolderItem(Base):
 
     __table_args__ = (
         UniqueConstraint("folder_id", "item_type", "item_id", name="uq_folder_items_folder_type_id"),
+        CheckConstraint(
+            "item_type IN ('conversation', 'document', 'email_thread', 'presentation', 'upload')",
+            name="ck_folder_items_item_type",
+        ),
+        # Reverse lookup: which folders contain this item
+        Index("ix_folder_items_item", "item_id", "item_type"),
     )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     folder_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("folders.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    item_type: Mapped[str] = mapped_column(String(20), nullable=False)
-    item_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    item_type: Mapped[str] = mapped_column(Text, nullable=False)
+    item_id: Mapped[str] = mapped_column(Text, nullable=False)
     added_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -1,9 +1,9 @@
 """LLM trace model — per-call telemetry for LLM invocations."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Index, Integer, Sequence, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -16,26 +16,33 @@ class LLMTrace(Base):
 
     Linked to an agent run when available, but also captures standalone calls
     (e.g. memory compression, embedding).
+    Partitioned by month on created_at (see migration 037).
     """
 
     __tablename__ = "llm_traces"
+    __table_args__ = (
+        Index("ix_llm_traces_tenant_created", "tenant_id", text("created_at DESC")),
+        Index(
+            "ix_llm_traces_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+    # Sequential bigint: inserts append to the right-most PK leaf
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Sequence("llm_traces_id_seq"),
         primary_key=True,
-        default=uuid4,
-    )
-    tenant_id: Mapped[UUID | None] = mapped_column(
-        PGUUID(as_uuid=True),
-        index=True,
     )
+    tenant_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True))
     run_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
         index=True,
     )
 
-    model: Mapped[str] = mapped_column(String(100), nullable=False)
-    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    provider: Mapped[str] = mapped_column(Text, nullable=False)
     # e.g. "mistral", "openai", "hf_endpoint"
 
     prompt_tokens: Mapped[int] = mapped_column(Integer, default=0)
@@ -43,7 +50,7 @@ class LLMTrace(Base):
     total_tokens: Mapped[int] = mapped_column(Integer, default=0)
     latency_ms: Mapped[int | None] = mapped_column(Integer)
 
-    status: Mapped[str] = mapped_column(String(20), default="success")
+    status: Mapped[str] = mapped_column(Text, default="success")
     # success | error
 
     error_message: Mapped[str | None] = mapped_column(Text)
@@ -51,8 +58,9 @@ class LLMTrace(Base):
     # Flexible: temperature, tools, stop_reason, etc.
     request_metadata: Mapped[dict | None] = mapped_column(JSONB)
 
+    # Partition key (monthly RANGE partitions) — part of the primary key
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
-        index=True,
     )
@@ -17,6 +17,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     DateTime,
     ForeignKey,
     Index,
@@ -24,11 +25,12 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, uuid7
 
 if TYPE_CHECKING:
     from app.integrations.nango.models import NangoConnection
@@ -123,6 +125,26 @@ class MailMessage(Base):
         ),
         Index("ix_mail_messages_thread", "mail_account_id", "provider_thread_id"),
         Index("ix_mail_messages_date", "mail_account_id", "date"),
+        # Folder thread lookups match an item id against either key column
+        Index(
+            "ix_mail_messages_tenant_thread_date",
+            "tenant_id",
+            "provider_thread_id",
+            text("date DESC"),
+        ),
+        Index(
+            "ix_mail_messages_tenant_msgid_date",
+            "tenant_id",
+            "provider_message_id",
+            text("date DESC"),
+        ),
+        # RAG indexing backlog (see index_unindexed_emails)
+        Index(
+            "ix_mail_messages_pending_rag",
+            "mail_account_id",
+            text("date DESC"),
+            postgresql_where=text("is_indexed = false AND is_draft = false"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -132,7 +154,6 @@ class MailMessage(Base):
         PG_UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     mail_account_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -192,26 +213,32 @@ class MailDraft(Base):
     """Local draft from the email composer. Visible in the mail list."""
 
     __tablename__ = "mail_drafts"
+    __table_args__ = (
+        Index("ix_mail_drafts_tenant_updated", "tenant_id", text("updated_at DESC")),
+        Index("ix_mail_drafts_account_updated", "mail_account_id", text("updated_at DESC")),
+        Index(
+            "ix_mail_drafts_recipients_gin", "tenant_id", "to_recipients",
+            postgresql_using="gin", postgresql_ops={"to_recipients": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     mail_account_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("mail_accounts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     to_recipients: Mapped[list] = mapped_column(
         JSONB, nullable=False, default=list
     )  # [{"name": "", "email": "..."}]
-    subject: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    subject: Mapped[str | None] = mapped_column(Text, nullable=True)
     body_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     instruction: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -346,23 +373,30 @@ class EmailDraftBundle(Base):
     """
 
     __tablename__ = "email_draft_bundles"
+    __table_args__ = (
+        Index(
+            "ix_email_draft_bundles_conversation",
+            "tenant_id",
+            "conversation_id",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     conversation_id: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True), nullable=True
     )
-    subject: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    subject: Mapped[str | None] = mapped_column(Text, nullable=True)
     body_draft: Mapped[str | None] = mapped_column(Text, nullable=True)
     tone: Mapped[str | None] = mapped_column(
-        String(50), nullable=True, comment="formal | friendly | neutral"
+        Text, nullable=True, comment="formal | friendly | neutral"
     )
     reason: Mapped[str | None] = mapped_column(
         Text, nullable=True, comment="Why the email was suggested"
@@ -378,7 +412,16 @@ class ScheduledEmail(Base):
 
     __tablename__ = "scheduled_emails"
     __table_args__ = (
-        Index("ix_scheduled_emails_scheduled_at_status", "scheduled_at", "status"),
+        CheckConstraint(
+            "status IN ('pending', 'sent', 'failed', 'cancelled')",
+            name="ck_scheduled_emails_status",
+        ),
+        # Dispatcher hot path: only pending rows (sent/failed/cancelled pile up)
+        Index(
+            "ix_scheduled_emails_due",
+            "scheduled_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -414,7 +457,7 @@ class ScheduledEmail(Base):
         String(255), nullable=True, comment="Provider-specific thread ID"
     )
     scheduled_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True,
+        DateTime(timezone=True), nullable=False,
         comment="When to send this email"
     )
     status: Mapped[str] = mapped_column(
@@ -5,12 +5,24 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Boolean, func, text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
 
-from app.database import Base
+from app.database import Base, uuid7
 
 if TYPE_CHECKING:
     from app.models.tenant import Tenant
@@ -56,6 +68,13 @@ class RunPurpose(str, Enum):
 
 class Presentation(Base):
     __tablename__ = "presentations"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('draft', 'generating_outline', 'outline_ready', 'generating_slides', "
+            "'ready', 'exporting', 'error')",
+            name="ck_presentations_status",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4,
@@ -144,7 +163,9 @@ class PresentationSlide(Base):
     )
 
     __table_args__ = (
-        # Composite index for ordered slide retrieval
+        # Composite index for ordered slide retrieval. No INCLUDE columns: every
+        # reader loads content_json too, so an index-only scan is never possible.
+        Index("ix_pslides_pres_pos", "presentation_id", "position"),
         {"comment": "Individual slides for a presentation"},
     )
 
@@ -172,6 +193,22 @@ class PresentationTheme(Base):
 
 class PresentationAsset(Base):
     __tablename__ = "presentation_assets"
+    __table_args__ = (
+        CheckConstraint("kind IN ('image', 'svg', 'font', 'bg')", name="ck_presentation_assets_kind"),
+        CheckConstraint(
+            "status IN ('pending', 'ready', 'error')", name="ck_presentation_assets_status"
+        ),
+        Index("ix_passets_pres", "presentation_id"),
+        Index("ix_passets_tenant_kind", "tenant_id", "kind"),
+        # slide_id is ON DELETE SET NULL; keeps slide deletes off a full scan
+        Index("ix_passets_slide", "slide_id", postgresql_where=text("slide_id IS NOT NULL")),
+        # Not unique: assets are owned per presentation, so the same file may
+        # legitimately appear once in each deck that uses it.
+        Index(
+            "ix_passets_tenant_checksum", "tenant_id", "checksum",
+            postgresql_where=text("checksum IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4,
@@ -180,7 +217,6 @@ class PresentationAsset(Base):
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     presentation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -202,7 +238,8 @@ class PresentationAsset(Base):
     width: Mapped[int | None] = mapped_column(Integer, nullable=True)
     height: Mapped[int | None] = mapped_column(Integer, nullable=True)
     byte_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    checksum: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Raw SHA-256 digest of the file content (32 bytes)
+    checksum: Mapped[bytes | None] = mapped_column(LargeBinary(32), nullable=True)
     error_message: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -236,7 +273,8 @@ class PresentationExport(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     # Snapshot for traceability
     presentation_version: Mapped[int] = mapped_column(Integer, nullable=False)
-    payload_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Raw SHA-256 digest of the resolved slides payload (32 bytes)
+    payload_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     slide_count: Mapped[int] = mapped_column(Integer, nullable=False)
     theme_snapshot: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -253,13 +291,28 @@ class PresentationExport(Base):
 
 
 class PresentationGenerationRun(Base):
+    """LLM call log for presentation generation.
+
+    Partitioned by month on created_at (see migration 060).
+    """
+
     __tablename__ = "presentation_generation_runs"
+    __table_args__ = (
+        Index("ix_genruns_pres", "presentation_id"),
+        Index("ix_genruns_tenant_created", "tenant_id", "created_at"),
+        Index("ix_genruns_slide", "slide_id", postgresql_where=text("slide_id IS NOT NULL")),
+        Index(
+            "ix_presentation_generation_runs_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 16, "autosummarize": "on"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4,
+        PGUUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     tenant_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), nullable=False, index=True,
+        PGUUID(as_uuid=True), nullable=False,
     )
     presentation_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -283,6 +336,7 @@ class PresentationGenerationRun(Base):
     repair_attempts: Mapped[int] = mapped_column(Integer, default=0)
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Partition key (monthly RANGE partitions) — part of the primary key
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(),
+        DateTime(timezone=True), primary_key=True, server_default=func.now(),
     )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -21,6 +21,12 @@ class UserMemory(Base):
     __tablename__ = "user_memories"
     __table_args__ = (
         UniqueConstraint("tenant_id", "user_id", name="uq_user_memory_tenant_user"),
+        Index(
+            "ix_user_memories_raw_gin", "tenant_id", "raw_json",
+            postgresql_using="gin", postgresql_ops={"raw_json": "jsonb_path_ops"},
+        ),
+        # Page headroom so in-place updates stay HOT (migration 054)
+        {"postgresql_with": {"fillfactor": 70}},
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -32,7 +38,6 @@ class UserMemory(Base):
         PGUUID(as_uuid=True),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -1,29 +1,42 @@
 """Web cache model — caches web search results with TTL."""
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import CheckConstraint, DateTime, Index, Integer, LargeBinary, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, uuid7
+
+# Number of HASH (query_hash) partitions: web_cache_p0 .. web_cache_p15 (migration 039)
+WEB_CACHE_PARTITIONS = 16
 
 
 class WebCache(Base):
-    """Cached web search results keyed by query hash + provider."""
+    """Cached web search results keyed by query hash + provider.
+
+    Hash-partitioned on query_hash, so query_hash is part of the primary key.
+    """
 
     __tablename__ = "web_cache"
+    __table_args__ = (
+        CheckConstraint("provider IN ('brave', 'serper', 'tavily')", name="ck_web_cache_provider"),
+        Index("ix_web_cache_lookup", "query_hash", "provider", unique=True),
+        Index("ix_web_cache_expires_at", "expires_at"),
+        {"postgresql_partition_by": "HASH (query_hash)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
-    query_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Raw SHA-256 digest of the normalized query (32 bytes)
+    query_hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
     query: Mapped[str] = mapped_column(Text, nullable=False)
-    provider: Mapped[str] = mapped_column(String(32), nullable=False)
+    provider: Mapped[str] = mapped_column(Text, nullable=False)
     results_json: Mapped[dict] = mapped_column(JSONB, nullable=False)
     result_count: Mapped[int] = mapped_column(Integer, default=0)
     fetched_at: Mapped[datetime] = mapped_column(
@@ -22,7 +22,7 @@ class AuditLogCreate(BaseModel):
 class AuditLogRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     tenant_id: UUID | None = None
     run_id: UUID | None = None
     user_id: UUID | None = None
@@ -54,7 +54,7 @@ class LLMTraceCreate(BaseModel):
 class LLMTraceRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     tenant_id: UUID | None = None
     run_id: UUID | None = None
     model: str
@@ -4,11 +4,17 @@ import logging
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import RowMapping, select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.contact import Contact, Company, ContactUpdate
+from app.models.contact import (
+    CONTACT_SEARCH_CONFIG,
+    Company,
+    Contact,
+    ContactUpdate,
+    contact_search_vector,
+)
 from app.schemas.contact import ContactCreate, ContactUpdate as ContactUpdateSchema
 
 logger = logging.getLogger(__name__)
@@ -28,33 +34,45 @@ class ContactService:
         source: str | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Contact]:
-        """List contacts with filtering and pagination.
+    ) -> list[RowMapping]:
+        """List contact summaries with filtering and pagination.
 
         Args:
             db: Database session
             tenant_id: Tenant ID for isolation
-            search_query: Full-text search query
+            search_query: Full-text query, also matched as an email substring
             contact_type: Filter by contact type
-            tags: Filter by tags (JSONB contains)
+            tags: Filter by tags (array contains)
             source: Filter by source
             limit: Maximum results
             offset: Pagination offset
 
         Returns:
-            List of contacts with company loaded
+            Rows with the ContactBrief fields, company name joined in
         """
         stmt = (
-            select(Contact)
+            select(
+                Contact.id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.primary_email,
+                Contact.contact_type,
+                Company.company_name,
+            )
+            .outerjoin(Company, Contact.company_id == Company.id)
             .where(Contact.tenant_id == tenant_id)
-            .options(selectinload(Contact.company))
         )
 
-        # Full-text search
+        # Full-text search, plus email substring match (tsvector splits on "@" and ".")
         if search_query:
             stmt = stmt.where(
-                Contact.search_vector.op("@@")(
-                    func.plainto_tsquery("french", search_query)
+                or_(
+                    contact_search_vector.op("@@")(
+                        func.plainto_tsquery(CONTACT_SEARCH_CONFIG, search_query)
+                    ),
+                    func.lower(Contact.primary_email).contains(
+                        search_query.lower(), autoescape=True
+                    ),
                 )
             )
 
@@ -63,8 +81,7 @@ class ContactService:
             stmt = stmt.where(Contact.contact_type == contact_type)
 
         if tags:
-            # JSONB array contains
-            stmt = stmt.where(Contact.tags.op("@>")(tags))
+            stmt = stmt.where(Contact.tags.contains(tags))
 
         if source:
             stmt = stmt.where(Contact.source == source)
@@ -74,7 +91,7 @@ class ContactService:
         )
 
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.mappings().all())
 
     async def search_contacts(
         self,
@@ -95,15 +112,15 @@ class ContactService:
             List of (contact, relevance_score) tuples
         """
         rank_expr = func.ts_rank(
-            Contact.search_vector, func.plainto_tsquery("french", query)
+            contact_search_vector, func.plainto_tsquery(CONTACT_SEARCH_CONFIG, query)
         ).label("rank")
 
         stmt = (
             select(Contact, rank_expr)
             .where(
                 Contact.tenant_id == tenant_id,
-                Contact.search_vector.op("@@")(
-                    func.plainto_tsquery("french", query)
+                contact_search_vector.op("@@")(
+                    func.plainto_tsquery(CONTACT_SEARCH_CONFIG, query)
                 ),
             )
             .options(selectinload(Contact.company))
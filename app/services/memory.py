@@ -181,14 +181,21 @@ class MemoryService:
 
         if summary_text is not None:
             ctx.summary_text = summary_text
-        if constraints is not None:
-            ctx.constraints = constraints
-        if decisions is not None:
-            ctx.decisions = decisions
-        if open_questions is not None:
-            ctx.open_questions = open_questions
-        if facts is not None:
-            ctx.facts = facts
+
+        # Merge into the single structured document (one JSONB write)
+        structured_updates = {
+            key: value
+            for key, value in (
+                ("constraints", constraints),
+                ("decisions", decisions),
+                ("open_questions", open_questions),
+                ("facts", facts),
+            )
+            if value is not None
+        }
+        if structured_updates:
+            ctx.structured = {**(ctx.structured or {}), **structured_updates}
+
         if increment_message_count:
             ctx.message_count += 1
 
@@ -230,10 +237,10 @@ class MemoryService:
             "assistant_memory": assistant_mem.compressed_text if assistant_mem else None,
             "user_memory": user_mem.compressed_text if user_mem else None,
             "conversation_summary": conv_ctx.summary_text if conv_ctx else None,
-            "constraints": (conv_ctx.constraints or []) if conv_ctx else [],
-            "decisions": (conv_ctx.decisions or []) if conv_ctx else [],
-            "open_questions": (conv_ctx.open_questions or []) if conv_ctx else [],
-            "facts": (conv_ctx.facts or []) if conv_ctx else [],
+            "constraints": conv_ctx.constraints if conv_ctx else [],
+            "decisions": conv_ctx.decisions if conv_ctx else [],
+            "open_questions": conv_ctx.open_questions if conv_ctx else [],
+            "facts": conv_ctx.facts if conv_ctx else [],
         }
         return result
 
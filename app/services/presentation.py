@@ -7,10 +7,10 @@ import json
 import logging
 import time
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from openai import AsyncOpenAI
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -78,10 +78,11 @@ class PresentationService:
             prompt=data.prompt,
             settings=data.settings,
             theme_id=data.theme_id,
+            slides=[],
         )
         db.add(pres)
         await db.flush()
-        await db.refresh(pres, attribute_names=["id", "tenant_id", "title", "prompt", "status", "outline", "settings", "slide_order", "version", "theme_id", "error_message", "created_at", "updated_at"])
+        await db.refresh(pres, attribute_names=["id", "tenant_id", "title", "prompt", "status", "outline", "settings", "slide_order", "version", "theme_id", "theme", "error_message", "created_at", "updated_at"])
         return pres
 
     async def get(
@@ -104,6 +105,42 @@ class PresentationService:
         result = await db.execute(q)
         return result.scalar_one_or_none()
 
+    async def exists(
+        self,
+        db: AsyncSession,
+        tenant_id: UUID,
+        pres_id: UUID,
+    ) -> bool:
+        """Check the presentation exists for the tenant without loading it."""
+        result = await db.execute(
+            select(
+                exists().where(
+                    Presentation.id == pres_id,
+                    Presentation.tenant_id == tenant_id,
+                )
+            )
+        )
+        return bool(result.scalar())
+
+    async def set_status(
+        self,
+        db: AsyncSession,
+        tenant_id: UUID,
+        pres_id: UUID,
+        status: str,
+    ) -> bool:
+        """Set the status in a single UPDATE; False when nothing matched."""
+        result = await db.execute(
+            update(Presentation)
+            .where(
+                Presentation.id == pres_id,
+                Presentation.tenant_id == tenant_id,
+            )
+            .values(status=status)
+            .returning(Presentation.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def list(
         self,
         db: AsyncSession,
@@ -131,7 +168,7 @@ class PresentationService:
         pres_id: UUID,
         data: PresentationUpdate,
     ) -> Presentation | None:
-        pres = await self.get(db, tenant_id, pres_id)
+        pres = await self.get(db, tenant_id, pres_id, with_slides=True)
         if not pres:
             return None
 
@@ -140,7 +177,12 @@ class PresentationService:
             setattr(pres, key, value)
 
         await db.flush()
-        await db.refresh(pres)
+        # Only the server-side onupdate column (and the theme, if it moved)
+        # is stale; slides stay loaded from the initial select.
+        refresh = ["updated_at"]
+        if "theme_id" in update_data:
+            refresh.append("theme")
+        await db.refresh(pres, attribute_names=refresh)
         return pres
 
     async def delete(
@@ -166,36 +208,34 @@ class PresentationService:
         if not source:
             return None
 
+        # Slide ids are assigned up front so slide_order is known before the
+        # single flush; INSERT ... RETURNING fills in the server defaults.
+        new_slides = [
+            PresentationSlide(
+                id=uuid4(),
+                position=slide.position,
+                layout_type=slide.layout_type,
+                content_json=slide.content_json,
+                root_image=slide.root_image,
+                bg_color=slide.bg_color,
+                speaker_notes=slide.speaker_notes,
+            )
+            for slide in source.slides
+        ]
         new_pres = Presentation(
             tenant_id=tenant_id,
             title=f"{source.title} (copie)",
             prompt=source.prompt,
             status=PresentationStatus.READY.value,
             theme_id=source.theme_id,
+            theme=source.theme,
             outline=source.outline,
             settings=source.settings,
+            slide_order=[str(s.id) for s in new_slides],
+            slides=new_slides,
         )
         db.add(new_pres)
         await db.flush()
-
-        slide_ids = []
-        for slide in source.slides:
-            new_slide = PresentationSlide(
-                presentation_id=new_pres.id,
-                position=slide.position,
-                layout_type=slide.layout_type,
-                content_json=slide.content_json,
-                root_image=slide.root_image,
-                bg_color=slide.bg_color,
-                speaker_notes=slide.speaker_notes,
-            )
-            db.add(new_slide)
-            await db.flush()
-            slide_ids.append(str(new_slide.id))
-
-        new_pres.slide_order = slide_ids
-        await db.flush()
-        await db.refresh(new_pres)
         return new_pres
 
     # ══════════════════════════════════════════════
@@ -304,26 +344,23 @@ class PresentationService:
         pres_id: UUID,
         slide_ids: list[UUID],
     ) -> Presentation | None:
-        pres = await self.get(db, tenant_id, pres_id)
+        pres = await self.get(db, tenant_id, pres_id, with_slides=True)
         if not pres:
             return None
 
         pres.slide_order = [str(sid) for sid in slide_ids]
         # Update positions to match
+        slides_by_id = {s.id: s for s in pres.slides}
         for i, sid in enumerate(slide_ids):
-            result = await db.execute(
-                select(PresentationSlide).where(
-                    PresentationSlide.id == sid,
-                    PresentationSlide.presentation_id == pres_id,
-                )
-            )
-            slide = result.scalar_one_or_none()
+            slide = slides_by_id.get(sid)
             if slide:
                 slide.position = i
 
         pres.version = pres.version + 1
         await db.flush()
-        await db.refresh(pres)
+        # Reloading the collection re-sorts it by position and repopulates
+        # the slides' expired updated_at in the same select.
+        await db.refresh(pres, attribute_names=["updated_at", "slides"])
         return pres
 
     # ══════════════════════════════════════════════
@@ -372,14 +409,14 @@ class PresentationService:
         pres_id: UUID,
         outline: list[OutlineItem],
     ) -> Presentation | None:
-        pres = await self.get(db, tenant_id, pres_id)
+        pres = await self.get(db, tenant_id, pres_id, with_slides=True)
         if not pres:
             return None
         pres.outline = [item.model_dump() for item in outline]
         pres.status = PresentationStatus.OUTLINE_READY.value
         pres.version = pres.version + 1
         await db.flush()
-        await db.refresh(pres)
+        await db.refresh(pres, attribute_names=["updated_at"])
         return pres
 
     # ══════════════════════════════════════════════
@@ -690,7 +727,7 @@ class PresentationService:
                 "content_json": slide.content_json,
             })
         payload_json = json.dumps(slides_data, sort_keys=True, default=str)
-        payload_hash = hashlib.sha256(payload_json.encode()).hexdigest()
+        payload_hash = hashlib.sha256(payload_json.encode()).digest()
 
         # Get renderer version for cache key
         renderer_version = await self._get_renderer_version()
@@ -709,7 +746,7 @@ class PresentationService:
         cached = existing.scalar_one_or_none()
         if cached:
             logger.info("Export cache hit: %s (hash=%s, format=%s, renderer=%s)",
-                        cached.id, payload_hash[:8], request.format, renderer_version)
+                        cached.id, payload_hash.hex()[:8], request.format, renderer_version)
             return cached
 
         # Get theme snapshot
@@ -804,8 +841,6 @@ class PresentationService:
             },
             status="running",
         )
-        db.add(run)
-        await db.flush()
 
         logger.info(
             "LLM call: model=%s, purpose=%s, prompt_len=%d+%d",
@@ -841,6 +876,8 @@ class PresentationService:
             run.duration_ms = int((time.monotonic() - t0) * 1000)
             raise
         finally:
+            # Single INSERT once the outcome is known, rather than INSERT + UPDATE
+            db.add(run)
             await db.flush()
 
     # ══════════════════════════════════════════════
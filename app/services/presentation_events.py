@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
 
+import orjson
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
+# Events after which the /events stream closes
+TERMINAL_EVENTS = ("generation_complete", "export_ready", "error")
+
+_CHANNEL_PATTERN = "pres:*:events"
+
+
+def _channel(pres_id: UUID) -> str:
+    return f"pres:{pres_id}:events"
+
+
 class PresentationEventPublisher:
-    """Publishes idempotent SSE events to Redis pub/sub."""
+    """Publishes idempotent SSE events to Redis pub/sub.
+
+    Messages are complete SSE frames, framed once here so the /events
+    endpoint forwards them to every subscriber without re-serializing.
+    """
 
     def __init__(self, redis) -> None:
         self.redis = redis
@@ -26,23 +47,19 @@ class PresentationEventPublisher:
         slide_index: int | None = None,
         run_id: UUID | None = None,
     ) -> None:
-        """Publish a single SSE event with idempotent ID."""
-        channel = f"pres:{pres_id}:events"
+        """Publish a single SSE event with an idempotent, per-presentation seq ID."""
+        channel = _channel(pres_id)
         seq = await self.redis.incr(f"pres:{pres_id}:seq")
 
-        event = {
-            "event_id": f"{pres_id}:{event_type}:{seq}",
-            "seq": seq,
-            "type": event_type,
-            "payload": {
-                **(payload or {}),
-                **({"slide_id": str(slide_id)} if slide_id else {}),
-                **({"slide_index": slide_index} if slide_index is not None else {}),
-                **({"run_id": str(run_id)} if run_id else {}),
-            },
+        data = {
+            **(payload or {}),
+            **({"slide_id": str(slide_id)} if slide_id else {}),
+            **({"slide_index": slide_index} if slide_index is not None else {}),
+            **({"run_id": str(run_id)} if run_id else {}),
         }
 
-        await self.redis.publish(channel, json.dumps(event))
+        frame = f"id: {seq}\nevent: {event_type}\ndata: ".encode() + orjson.dumps(data) + b"\n\n"
+        await self.redis.publish(channel, frame)
 
     # ── Convenience methods ──
 
@@ -97,3 +114,93 @@ class PresentationEventPublisher:
 
     async def error(self, pres_id: UUID, message: str) -> None:
         await self.publish(pres_id, event_type="error", payload={"message": message})
+
+
+class PresentationEventHub:
+    """Fans presentation events out to /events clients over one connection.
+
+    One pattern subscription per process replaces a pub/sub connection per
+    SSE client, on a Redis client of its own so open streams never hold
+    connections from the shared get_redis() pool. Each client reads a
+    bounded queue; ``None`` in it ends the stream (client too far behind, or
+    the subscriber connection dropped) and its EventSource reconnects.
+    """
+
+    def __init__(self, queue_maxsize: int = 256) -> None:
+        self._queue_maxsize = queue_maxsize
+        self._queues: dict[bytes, set[asyncio.Queue[bytes | None]]] = {}
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, pres_id: UUID) -> AsyncIterator[asyncio.Queue[bytes | None]]:
+        """Yield a queue of raw SSE frames published for ``pres_id``."""
+        await self._ensure_running()
+        channel = _channel(pres_id).encode()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self._queue_maxsize)
+        self._queues.setdefault(channel, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            listeners = self._queues.get(channel)
+            if listeners is not None:
+                listeners.discard(queue)
+                if not listeners:
+                    del self._queues[channel]
+
+    async def aclose(self) -> None:
+        """Stop the subscriber and end every open stream (call on shutdown)."""
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+
+    async def _ensure_running(self) -> None:
+        async with self._lock:
+            if self._reader is not None:
+                return
+            redis = aioredis.Redis.from_url(
+                get_settings().redis_url,
+                health_check_interval=30,
+                decode_responses=False,
+            )
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(_CHANNEL_PATTERN)
+            except BaseException:
+                await pubsub.aclose()
+                await redis.aclose()
+                raise
+            self._reader = asyncio.create_task(self._run(redis, pubsub))
+
+    async def _run(self, redis: aioredis.Redis, pubsub) -> None:
+        try:
+            async for msg in pubsub.listen():
+                for queue in tuple(self._queues.get(msg["channel"], ())):
+                    try:
+                        queue.put_nowait(msg["data"])
+                    except asyncio.QueueFull:
+                        self._queues[msg["channel"]].discard(queue)
+                        _end_stream(queue)
+        except Exception:
+            logger.exception("presentation_events_subscriber_failed")
+        finally:
+            # Synchronously, before any await: the next subscribe() starts a
+            # fresh reader, and no stream is left silent waiting on this one
+            self._reader = None
+            for listeners in self._queues.values():
+                for queue in listeners:
+                    _end_stream(queue)
+            self._queues.clear()
+            await pubsub.aclose()
+            await redis.aclose()
+
+
+def _end_stream(queue: asyncio.Queue[bytes | None]) -> None:
+    """Enqueue the end-of-stream marker, dropping the oldest frame if full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(None)
+
+
+presentation_event_hub = PresentationEventHub()
@@ -3,15 +3,38 @@
 from datetime import date
 from uuid import UUID, uuid4
 
+from redis.exceptions import RedisError
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
+from app.core.logging import get_logger
+from app.core.streams import get_redis
 from app.models.daily_usage import DailyUsage
 from app.models.document import Document
 from app.models.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
 from app.models.user import User
 
+logger = get_logger(__name__)
+
+_PLAN_CACHE_TTL = 60  # seconds a cached plan tier is trusted
+
+
+def _plan_cache_key(tenant_id: UUID) -> str:
+    return f"quota:plan:{tenant_id}"
+
+
+async def invalidate_plan_cache(tenant_id: UUID | None) -> None:
+    """Drop the cached plan tier for a tenant (call after a plan change)."""
+    if tenant_id is None:
+        return
+    try:
+        redis = await get_redis()
+        await redis.delete(_plan_cache_key(tenant_id))
+    except RedisError as e:
+        logger.warning("plan_cache_invalidate_failed", tenant_id=str(tenant_id), error=str(e))
+
 
 class QuotaService:
     """Service for checking and tracking usage quotas."""
@@ -96,6 +119,38 @@ class QuotaService:
             or await self.get_subscription(db, user.id)
         )
 
+    async def _cached_is_pro(self, db: AsyncSession, user: User) -> bool | None:
+        """Resolve whether the user's org is Pro, or None without a subscription.
+
+        Checked on every chat request, so the tenant's tier is cached in Redis
+        for a short TTL. Redis errors fall back to the database.
+        """
+        key = _plan_cache_key(user.tenant_id)
+        redis = None
+        try:
+            redis = await get_redis()
+            cached = await redis.get(key)
+            if cached is not None:
+                return cached == b"pro"
+        except RedisError as e:
+            logger.warning("plan_cache_read_failed", tenant_id=str(user.tenant_id), error=str(e))
+            redis = None
+
+        subscription = await self.get_subscription_for_tenant(db, user.tenant_id)
+        if subscription is None:
+            # Legacy user-scoped subscription: not cached under the tenant key
+            subscription = await self.get_subscription(db, user.id)
+            return subscription.is_pro if subscription else None
+
+        if redis is not None:
+            try:
+                await redis.set(
+                    key, b"pro" if subscription.is_pro else b"free", ex=_PLAN_CACHE_TTL
+                )
+            except RedisError as e:
+                logger.warning("plan_cache_write_failed", tenant_id=str(user.tenant_id), error=str(e))
+        return subscription.is_pro
+
     async def check_chat_allowed(
         self, db: AsyncSession, user: User
     ) -> tuple[bool, str | None]:
@@ -104,22 +159,27 @@ class QuotaService:
         Returns:
             tuple of (allowed, error_message)
         """
-        subscription = await self._resolve_subscription(db, user)
+        is_pro = await self._cached_is_pro(db, user)
 
-        if subscription is None:
+        if is_pro is None:
             return False, "Aucun abonnement trouvé"
 
         # Pro orgs have unlimited access
-        if subscription.is_pro:
+        if is_pro:
             return True, None
 
-        # Free tier: check daily limit
-        daily_usage = await self.get_daily_usage(db, user.id)
+        # Free tier: check daily limit (a missing row means no request yet)
+        chat_requests = await db.scalar(
+            select(DailyUsage.chat_requests).where(
+                DailyUsage.user_id == user.id,
+                DailyUsage.date == date.today(),
+            )
+        ) or 0
 
-        if daily_usage.chat_requests >= self.settings.free_daily_chat_limit:
+        if chat_requests >= self.settings.free_daily_chat_limit:
             return (
                 False,
-                f"Limite quotidienne atteinte ({daily_usage.chat_requests}/{self.settings.free_daily_chat_limit}). "
+                f"Limite quotidienne atteinte ({chat_requests}/{self.settings.free_daily_chat_limit}). "
                 "Passez en Pro pour un accès illimité.",
             )
 
@@ -156,9 +216,21 @@ class QuotaService:
         return True, None
 
     async def record_chat_request(self, db: AsyncSession, user_id: UUID) -> None:
-        """Increment today's chat request counter."""
-        daily_usage = await self.get_daily_usage(db, user_id)
-        daily_usage.chat_requests += 1
+        """Increment today's chat request counter in a single upsert."""
+        stmt = pg_insert(DailyUsage).values(
+            id=uuid4(),
+            user_id=user_id,
+            date=date.today(),
+            chat_requests=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_daily_usage_user_date",
+            set_={
+                "chat_requests": DailyUsage.chat_requests + 1,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
         await db.commit()
 
     async def check_feature_allowed(
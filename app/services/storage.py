@@ -46,6 +46,25 @@ class StorageService:
         """Compute SHA256 hash of content."""
         return hashlib.sha256(content).hexdigest()
 
+    @staticmethod
+    def read_and_hash(
+        fileobj: BinaryIO, chunk_size: int = 1 << 20
+    ) -> tuple[bytes, str]:
+        """Read a file object in chunks, hashing as it goes.
+
+        Blocking: run via asyncio.to_thread so neither the reads nor the
+        SHA256 work stall the event loop.
+
+        Returns:
+            Tuple of (content, content_hash)
+        """
+        hasher = hashlib.sha256()
+        chunks: list[bytes] = []
+        while chunk := fileobj.read(chunk_size):
+            hasher.update(chunk)
+            chunks.append(chunk)
+        return b"".join(chunks), hasher.hexdigest()
+
     async def upload_file(
         self,
         tenant_id: UUID,
@@ -53,15 +72,20 @@ class StorageService:
         filename: str,
         content: bytes,
         content_type: str,
+        content_hash: str | None = None,
     ) -> tuple[str, str, int]:
         """
         Upload file to S3.
-        
+
+        Pass content_hash when the caller already computed it to skip
+        hashing the content a second time.
+
         Returns:
             Tuple of (s3_key, content_hash, file_size)
         """
         s3_key = self._build_key(tenant_id, collection_id, filename)
-        content_hash = self.compute_hash(content)
+        if content_hash is None:
+            content_hash = self.compute_hash(content)
         file_size = len(content)
 
         async with self._get_client() as client:
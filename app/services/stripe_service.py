@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
 from app.models.subscription import Subscription, SubscriptionPlan, SubscriptionStatus
 from app.models.user import User
+from app.services.quota import invalidate_plan_cache
 
 
 class StripeService:
@@ -214,6 +215,8 @@ class StripeService:
             subscription.max_org_documents = 999_999  # unlimited
 
         await db.commit()
+        if subscription:
+            await invalidate_plan_cache(subscription.tenant_id)
 
     async def handle_subscription_updated(
         self,
@@ -258,6 +261,7 @@ class StripeService:
         subscription.cancel_at_period_end = stripe_subscription.cancel_at_period_end
 
         await db.commit()
+        await invalidate_plan_cache(subscription.tenant_id)
 
     async def handle_subscription_deleted(
         self,
@@ -296,6 +300,7 @@ class StripeService:
         subscription.max_org_documents = 10
 
         await db.commit()
+        await invalidate_plan_cache(subscription.tenant_id)
 
     async def handle_payment_failed(
         self,
@@ -322,6 +327,7 @@ class StripeService:
         if subscription:
             subscription.status = SubscriptionStatus.PAST_DUE.value
             await db.commit()
+            await invalidate_plan_cache(subscription.tenant_id)
 
 
 # Global instance
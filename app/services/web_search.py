@@ -54,10 +54,10 @@ class WebSearchResponse:
 # ── Cache helpers ─────────────────────────────────────────────────
 
 
-def _query_hash(query: str) -> str:
-    """Deterministic hash for cache lookup."""
+def _query_hash(query: str) -> bytes:
+    """Deterministic hash for cache lookup (raw 32-byte SHA-256 digest)."""
     normalized = query.strip().lower()
-    return hashlib.sha256(normalized.encode()).hexdigest()
+    return hashlib.sha256(normalized.encode()).digest()
 
 
 async def _get_cached(
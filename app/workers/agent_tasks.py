@@ -340,21 +340,16 @@ async def _run_orchestrated(
     blocks_for_db: list = []
     tokens_input = 0
     tokens_output = 0
-    delta_buffer = ""
-    last_flush_time = time.time()
 
     async for event in run_agent_loop(agent_ctx):
         if event.event == "status":
             await pub.emit_status(event.data)
 
         elif event.event == "token":
+            # Already coalesced over agent_delta_batch_ms by run_agent_loop;
+            # buffering again here would hold each batch for a second window
             full_response += event.data
-            delta_buffer += event.data
-            now = time.time()
-            if (now - last_flush_time) * 1000 >= settings.agent_delta_batch_ms:
-                await pub.emit_delta(delta_buffer)
-                delta_buffer = ""
-                last_flush_time = now
+            await pub.emit_delta(event.data)
 
         elif event.event == "block":
             blocks_for_db.append(event.data)
@@ -378,10 +373,6 @@ async def _run_orchestrated(
         elif event.event == "error":
             await pub.emit_error("agent_loop_error", str(event.data))
 
-    # Flush remaining deltas
-    if delta_buffer:
-        await pub.emit_delta(delta_buffer)
-
     # ── Source coverage (explicit step for balanced/pro/exec) ──
     coverage = analyze_source_coverage(full_response, citations_for_db)
     if coverage.needs_disclaimer and coverage.disclaimer:
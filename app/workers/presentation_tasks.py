@@ -42,8 +42,15 @@ async def _get_db() -> AsyncSession:
     return async_session_maker()
 
 
-async def _get_redis():
-    return aioredis.from_url(settings.redis_url, decode_responses=True)
+async def _get_redis(ctx: dict) -> aioredis.Redis:
+    """Get or create the worker's pub/sub client, shared across jobs."""
+    if "pres_redis" not in ctx:
+        ctx["pres_redis"] = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            health_check_interval=30,
+        )
+    return ctx["pres_redis"]
 
 
 # ══════════════════════════════════════════════
@@ -77,7 +84,7 @@ async def generate_presentation_slides_direct(
     pres_uuid = UUID(presentation_id)
     tenant_uuid = UUID(tenant_id)
     db = await _get_db()
-    redis = await _get_redis()
+    redis = await _get_redis(ctx)
     publisher = PresentationEventPublisher(redis)
 
     try:
@@ -146,7 +153,6 @@ async def generate_presentation_slides_direct(
 
     finally:
         await db.close()
-        await redis.close()
 
 
 # ══════════════════════════════════════════════
@@ -176,7 +182,7 @@ async def generate_presentation_slides(
     pres_uuid = UUID(presentation_id)
     tenant_uuid = UUID(tenant_id)
     db = await _get_db()
-    redis = await _get_redis()
+    redis = await _get_redis(ctx)
     publisher = PresentationEventPublisher(redis)
 
     try:
@@ -217,7 +223,6 @@ async def generate_presentation_slides(
 
     finally:
         await db.close()
-        await redis.close()
 
 
 # ══════════════════════════════════════════════
@@ -338,7 +343,7 @@ async def export_presentation(
     export_uuid = UUID(export_id)
     tenant_uuid = UUID(tenant_id)
     db = await _get_db()
-    redis = await _get_redis()
+    redis = await _get_redis(ctx)
     publisher = PresentationEventPublisher(redis)
 
     try:
@@ -530,4 +535,3 @@ async def export_presentation(
 
     finally:
         await db.close()
-        await redis.close()
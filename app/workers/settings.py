@@ -1,6 +1,8 @@
 """Arq worker settings."""
 
-from arq.connections import RedisSettings
+import asyncio
+
+from arq.connections import ArqRedis, RedisSettings, create_pool
 
 from app.config import get_settings
 
@@ -33,3 +35,25 @@ def parse_redis_url(url: str) -> RedisSettings:
 
 
 redis_settings = parse_redis_url(settings.redis_url)
+
+
+_arq_pool: ArqRedis | None = None
+_arq_pool_lock = asyncio.Lock()
+
+
+async def get_arq_pool() -> ArqRedis:
+    """Get or create the shared Arq pool used to enqueue jobs from the API."""
+    global _arq_pool
+    if _arq_pool is None:
+        async with _arq_pool_lock:
+            if _arq_pool is None:
+                _arq_pool = await create_pool(redis_settings)
+    return _arq_pool
+
+
+async def close_arq_pool() -> None:
+    """Close the shared Arq pool (call on shutdown)."""
+    global _arq_pool
+    if _arq_pool is not None:
+        await _arq_pool.aclose()
+        _arq_pool = None
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from arq import ArqRedis, cron
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import select, func as sa_func, literal_column, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.config import get_settings
@@ -1316,6 +1316,64 @@ async def sync_all_mail_accounts(ctx: dict) -> dict:
         await db.close()
 
 
+# ── Partition maintenance ──────────────────────────────────────────
+
+# Tables partitioned by month on created_at (migrations 037 and 060)
+MONTHLY_PARTITIONED_TABLES = (
+    "audit_logs",
+    "llm_traces",
+    "contact_updates",
+    "presentation_generation_runs",
+)
+PARTITION_MONTHS_AHEAD = 3
+
+
+async def ensure_log_partitions(ctx: dict) -> dict:
+    """Cron job: make sure upcoming monthly partitions exist for the event log tables."""
+    db = await get_db()
+    try:
+        for table in MONTHLY_PARTITIONED_TABLES:
+            await db.execute(
+                text("SELECT ensure_monthly_partitions(:parent, :months_ahead)"),
+                {"parent": table, "months_ahead": PARTITION_MONTHS_AHEAD},
+            )
+        await db.commit()
+        return {"tables": list(MONTHLY_PARTITIONED_TABLES)}
+
+    except Exception as e:
+        logger.exception("Partition maintenance failed")
+        return {"error": str(e)}
+    finally:
+        await db.close()
+
+
+async def purge_expired_web_cache(ctx: dict) -> dict:
+    """Cron job: delete expired web_cache rows, one hash partition at a time.
+
+    Committing per partition keeps each DELETE's locks and WAL burst small.
+    """
+    from app.models.web_cache import WEB_CACHE_PARTITIONS
+
+    db = await get_db()
+    try:
+        deleted = 0
+        for remainder in range(WEB_CACHE_PARTITIONS):
+            result = await db.execute(
+                text(f"DELETE FROM web_cache_p{remainder} WHERE expires_at < now()")
+            )
+            await db.commit()
+            deleted += result.rowcount or 0
+
+        logger.info("Cron: purged %d expired web_cache rows", deleted)
+        return {"deleted": deleted}
+
+    except Exception as e:
+        logger.exception("web_cache purge failed")
+        return {"error": str(e)}
+    finally:
+        await db.close()
+
+
 # ── Lifecycle ───────────────────────────────────────────────────────
 
 
@@ -1338,6 +1396,12 @@ async def shutdown(ctx: dict) -> None:
     stream_redis = ctx.get("stream_redis")
     if stream_redis:
         await stream_redis.aclose()
+    # Close the presentation pub/sub client shared across jobs
+    pres_redis = ctx.get("pres_redis")
+    if pres_redis:
+        await pres_redis.aclose()
+    from app.core.agent_loop import close_llm_clients
+    await close_llm_clients()
     await engine.dispose()
 
 
@@ -1353,7 +1417,8 @@ async def send_scheduled_emails(ctx: dict) -> dict:
         result = await db.execute(
             select(ScheduledEmail)
             .where(
-                ScheduledEmail.status == "pending",
+                # Inline literal so the planner can match the partial ix_scheduled_emails_due
+                ScheduledEmail.status == literal_column("'pending'"),
                 ScheduledEmail.scheduled_at <= now,
             )
             .order_by(ScheduledEmail.scheduled_at.asc())
@@ -1844,6 +1909,15 @@ class WorkerSettings:
             send_scheduled_emails,
             minute=None,  # Run every minute
         ),
+        cron(
+            ensure_log_partitions,
+            hour={3},
+            minute={15},
+        ),
+        cron(
+            purge_expired_web_cache,
+            minute={30},  # Hourly
+        ),
     ]
     on_startup = startup
     on_shutdown = shutdown
@@ -1851,3 +1925,6 @@ class WorkerSettings:
     max_jobs = 10
     job_timeout = 600  # 10 minutes max per job
     keep_result = 3600  # Keep results for 1 hour
+    # Idle workers poll the queue every poll_delay; a short delay keeps
+    # enqueue-to-pickup latency of run_agent well below a chat's first token.
+    poll_delay = settings.worker_poll_delay
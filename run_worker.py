@@ -21,6 +21,7 @@ async def main():
         max_jobs=WorkerSettings.max_jobs,
         job_timeout=WorkerSettings.job_timeout,
         keep_result=WorkerSettings.keep_result,
+        poll_delay=WorkerSettings.poll_delay,
     )
     await worker.main()
 
@@ -116,3 +116,15 @@ def mock_db() -> AsyncMock:
     session.delete = AsyncMock()
     session.refresh = AsyncMock()
     return session
+
+
+# ── LLM client cache ───────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def _reset_llm_clients():
+    """Drop cached agent-loop LLM clients so patched AsyncOpenAI is used."""
+    from app.core import agent_loop
+
+    agent_loop._llm_clients.clear()
+    yield
+    agent_loop._llm_clients.clear()
@@ -0,0 +1,73 @@
+"""Tests for per-tenant admission control (app.core.admission)."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.admission import TenantAdmission
+
+
+class TestTenantAdmission:
+    async def test_caps_concurrency_per_tenant(self):
+        admission = TenantAdmission(limit=2)
+        tenant = uuid4()
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with admission(tenant):
+                peak = max(peak, admission.active(tenant))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+        assert admission.active(tenant) == 0
+
+    async def test_tenants_do_not_block_each_other(self):
+        admission = TenantAdmission(limit=1)
+        busy, other = uuid4(), uuid4()
+
+        async with admission(busy):
+            await asyncio.wait_for(admission.acquire(other), timeout=0.1)
+            await admission.release(other)
+
+    async def test_cancelled_waiter_leaves_no_slot(self):
+        admission = TenantAdmission(limit=1)
+        tenant = uuid4()
+
+        async with admission(tenant):
+            waiter = asyncio.create_task(admission.acquire(tenant))
+            await asyncio.sleep(0)
+            waiter.cancel()
+        assert admission.active(tenant) == 0
+
+
+class TestUploadAdmission:
+    async def test_queued_upload_holds_no_db_connection(self):
+        """A request waiting for a slot must have released its pooled connection."""
+        from app.api.v1 import uploads
+        from tests.conftest import fake_user, mock_db
+
+        user = fake_user()
+        db = mock_db()
+        admission = TenantAdmission(limit=1)
+        endpoint = uploads.upload_documents.__wrapped__  # skip the rate limiter
+
+        with patch.object(uploads, "upload_admission", admission):
+            async with admission(user.tenant_id):
+                queued = asyncio.create_task(
+                    endpoint(request=MagicMock(), user=user, db=db, files=[])
+                )
+                await asyncio.sleep(0.01)
+
+                assert not queued.done()
+                # The auth transaction was committed before waiting, and
+                # nothing has touched the session since
+                db.commit.assert_awaited_once()
+                db.execute.assert_not_awaited()
+
+                queued.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await queued
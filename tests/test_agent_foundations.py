@@ -395,6 +395,18 @@ class TestModelInstantiation:
         assert ctx.message_count == 10
         assert ctx.constraints == ["budget < 50k"]
 
+    def test_conversation_context_structured_document(self):
+        from app.models.conversation_context import ConversationContext
+
+        ctx = ConversationContext(constraints=["budget < 50k"], decisions=["Use Next.js"])
+        assert ctx.structured == {
+            "constraints": ["budget < 50k"],
+            "decisions": ["Use Next.js"],
+            "open_questions": [],
+            "facts": [],
+        }
+        assert ctx.facts == []
+
     def test_audit_log_fields(self):
         from app.models.audit_log import AuditLog
 
@@ -414,3 +426,31 @@ class TestModelInstantiation:
             status="success",
         )
         assert trace.total_tokens == 150
+
+
+# ─── Primary Key Generation ─────────────────────────────────────────
+
+
+class TestUUID7:
+    def test_version_and_variant(self):
+        from app.database import uuid7
+
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_sorts_by_creation_time(self):
+        import time
+
+        from app.database import uuid7
+
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_agent_run_id_default(self):
+        from app.database import uuid7
+        from app.models.agent_run import AgentRun
+
+        assert AgentRun.__table__.c.id.default.arg.__name__ == uuid7.__name__
@@ -129,6 +129,12 @@ class TestAgentStreamPublisher:
         data = json.loads(fields["data"])
         assert data["code"] == "worker_exception"
 
+    async def test_emit_capped_without_setup(self, pub):
+        publisher, redis = pub
+        await publisher.emit_error("watchdog_timeout")
+        assert redis.xadd.call_args[1]["maxlen"] == 2000
+        assert redis.xadd.call_args[1]["approximate"] is True
+
     async def test_seq_increments(self, pub):
         publisher, redis = pub
         await publisher.setup()
@@ -204,6 +210,55 @@ class TestAgentStreamConsumer:
         assert len(events) == 1
         assert events[0]["type"] == "error"
 
+    async def test_yields_to_loop_during_burst(self, monkeypatch):
+        """A large XREAD batch should periodically hand control back to the loop."""
+        redis = AsyncMock()
+        run_id = uuid4()
+
+        messages = [
+            (f"1-{i}".encode(), {b"seq": str(i).encode(), b"type": b"delta", b"ts": b"1.0",
+                                 b"data": json.dumps({"text": "x"}).encode()})
+            for i in range(1, 50)
+        ]
+        messages.append((b"1-50", {b"seq": b"50", b"type": b"done", b"ts": b"1.0",
+                                   b"data": b"{}"}))
+        redis.xread = AsyncMock(return_value=[(b"agent:" + str(run_id).encode(), messages)])
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(delay)
+
+        monkeypatch.setattr("app.core.streams.asyncio.sleep", fake_sleep)
+
+        consumer = AgentStreamConsumer(redis, run_id, block_ms=10, hard_timeout=5.0)
+        events = [event async for event in consumer]
+
+        assert len(events) == 50
+        assert sleeps == [0, 0, 0]
+
+    async def test_raw_data_keeps_payload_bytes(self):
+        """With raw_data=True the data field is yielded undecoded."""
+        redis = AsyncMock()
+        run_id = uuid4()
+        payload = json.dumps({"status": "searching"}).encode()
+
+        redis.xread = AsyncMock(return_value=[
+            (b"agent:" + str(run_id).encode(), [
+                (b"1-1", {b"seq": b"1", b"type": b"status", b"ts": b"1.0", b"data": payload}),
+                (b"1-2", {b"seq": b"2", b"type": b"done", b"ts": b"1.0", b"data": b"{}"}),
+            ]),
+        ])
+
+        consumer = AgentStreamConsumer(redis, run_id, block_ms=10, hard_timeout=5.0, raw_data=True)
+        events = [event async for event in consumer]
+
+        assert events[0]["type"] == "status"
+        assert events[0]["data"] == payload
+        assert events[1]["data"] == b"{}"
+
     async def test_heartbeat_on_idle(self):
         """Consumer should emit heartbeat status when no events for a while."""
         redis = AsyncMock()
@@ -215,6 +270,8 @@ class TestAgentStreamConsumer:
             nonlocal call_count
             call_count += 1
             if call_count <= 3:
+                # Idle poll: take real time so heartbeat_interval elapses
+                await asyncio.sleep(0.002)
                 return []  # No events → triggers heartbeat check
             # Then done
             return [(b"agent:" + str(run_id).encode(), [
@@ -236,6 +293,7 @@ class TestAgentStreamConsumer:
 
         # Should have heartbeat(s) + done
         types = [e["type"] for e in events]
+        assert "heartbeat" in types
         assert "done" in types
 
 
@@ -243,27 +301,66 @@ class TestAgentStreamConsumer:
 
 
 class TestSSEFormat:
-    async def test_format_sse_simple(self):
-        from app.api.v1.agent_chat import _format_sse
+    def test_format_sse_simple(self):
+        from app.api.v1.agent_chat import _SSE_TOKEN, _format_sse
 
-        result = await _format_sse("token", "hello")
-        assert result == "event: token\ndata: hello\n\n"
+        result = _format_sse(_SSE_TOKEN, "hello")
+        assert result == b"event: token\ndata: hello\n\n"
 
-    async def test_format_sse_multiline(self):
-        from app.api.v1.agent_chat import _format_sse
+    def test_format_sse_multiline(self):
+        from app.api.v1.agent_chat import _SSE_BLOCK, _format_sse
 
-        result = await _format_sse("block", '{"a": 1}\n{"b": 2}')
-        assert "event: block\n" in result
-        assert "data: {\"a\": 1}\n" in result
-        assert "data: {\"b\": 2}\n" in result
+        result = _format_sse(_SSE_BLOCK, '{"a": 1}\n{"b": 2}')
+        assert result == b'event: block\ndata: {"a": 1}\ndata: {"b": 2}\n\n'
 
-    async def test_format_sse_json(self):
-        from app.api.v1.agent_chat import _format_sse
+    def test_format_sse_json(self):
+        from app.api.v1.agent_chat import _SSE_DONE, _format_sse
 
         data = json.dumps({"tokens_input": 100, "tokens_output": 200})
-        result = await _format_sse("done", data)
-        assert "event: done\n" in result
-        assert "tokens_input" in result
+        result = _format_sse(_SSE_DONE, data)
+        assert result.startswith(b"event: done\n")
+        assert b"tokens_input" in result
+
+    def test_format_sse_encodes_utf8(self):
+        from app.api.v1.agent_chat import _SSE_TOKEN, _format_sse
+
+        assert _format_sse(_SSE_TOKEN, "été") == "event: token\ndata: été\n\n".encode()
+
+
+    def test_format_sse_forwards_bytes(self):
+        from app.core.streams import SSE_EVENT_LINES, format_sse
+
+        result = format_sse(SSE_EVENT_LINES[EVENT_STATUS], b'{"status": "searching"}')
+        assert result == b'event: status\ndata: {"status": "searching"}\n\n'
+
+    def test_format_sse_bytes_multiline(self):
+        from app.core.streams import format_sse
+
+        result = format_sse(b"event: block\n", b'{"a": 1}\n{"b": 2}')
+        assert result == b'event: block\ndata: {"a": 1}\ndata: {"b": 2}\n\n'
+
+
+# ─── Shared Arq Pool Tests ───────────────────────────────────────────
+
+
+class TestArqPool:
+    async def test_pool_created_once_and_closed(self, monkeypatch):
+        from app.workers import settings as worker_settings
+
+        pool = AsyncMock()
+        create_pool = AsyncMock(return_value=pool)
+        monkeypatch.setattr(worker_settings, "create_pool", create_pool)
+        monkeypatch.setattr(worker_settings, "_arq_pool", None)
+
+        first, second = await asyncio.gather(
+            worker_settings.get_arq_pool(), worker_settings.get_arq_pool()
+        )
+        assert first is second is pool
+        create_pool.assert_awaited_once()
+
+        await worker_settings.close_arq_pool()
+        pool.aclose.assert_awaited_once()
+        assert worker_settings._arq_pool is None
 
 
 # ─── Worker Logic Tests (mocked) ────────────────────────────────────
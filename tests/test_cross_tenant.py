@@ -202,6 +202,29 @@ class TestVectorSearchCrossTenant:
         tenant_filter = query_filter.must[0]
         assert tenant_filter.match.value == str(TENANT_B_ID)
 
+    @pytest.mark.asyncio
+    async def test_collection_builds_per_tenant_hnsw(self):
+        """New collections index vectors per tenant, never across tenants."""
+        from app.core.vector_store import VectorStore
+
+        vs = VectorStore.__new__(VectorStore)
+        vs.client = AsyncMock()
+        vs.collection_name = "test"
+        vs.vector_size = 10
+        vs.client.get_collections.return_value = MagicMock(collections=[])
+
+        await vs.ensure_collection()
+
+        hnsw = vs.client.create_collection.call_args.kwargs["hnsw_config"]
+        assert hnsw.m == 0
+        assert hnsw.payload_m > 0
+        schemas = {
+            c.kwargs["field_name"]: c.kwargs["field_schema"]
+            for c in vs.client.create_payload_index.call_args_list
+        }
+        assert schemas["tenant_id"].is_tenant is True
+        assert schemas["document_id"].is_tenant is False
+
 
 # ── Deletion Level: Cross-Tenant Vector Deletion ─────────────────
 
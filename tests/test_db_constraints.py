@@ -122,3 +122,82 @@ class TestChunkScopeConstraint:
         """scope='personal' must require collection_id IS NULL."""
         sql = _get_check_sql(Chunk, self.CONSTRAINT_NAME)
         assert re.search(r"collection_id\s+IS\s+NULL", sql, re.IGNORECASE)
+
+
+# ── Closed-set columns ────────────────────────────────────────────
+
+
+class TestClosedSetConstraints:
+    """Enumerated TEXT columns carry an IN (...) CHECK matching the app's values."""
+
+    def test_agent_run_status_matches_enum(self):
+        from app.models.agent_run import AgentRun, AgentRunStatus
+
+        sql = _get_check_sql(AgentRun, "ck_agent_runs_status")
+        for status in AgentRunStatus:
+            assert f"'{status.value}'" in sql
+
+    def test_folder_item_type_matches_schema(self):
+        from typing import get_args
+
+        from app.models.folder import FolderItem
+        from app.schemas.folder import FolderItemAdd
+
+        sql = _get_check_sql(FolderItem, "ck_folder_items_item_type")
+        for item_type in get_args(FolderItemAdd.model_fields["item_type"].annotation):
+            assert f"'{item_type}'" in sql
+
+    def test_audit_log_level(self):
+        from app.models.audit_log import AuditLog
+
+        sql = _get_check_sql(AuditLog, "ck_audit_logs_level")
+        assert "'info'" in sql
+
+    def test_presentation_status_matches_enum(self):
+        from app.models.presentation import Presentation, PresentationStatus
+
+        sql = _get_check_sql(Presentation, "ck_presentations_status")
+        for status in PresentationStatus:
+            assert f"'{status.value}'" in sql
+
+    def test_presentation_asset_kind_and_status_match_enums(self):
+        from app.models.presentation import AssetKind, AssetStatus, PresentationAsset
+
+        kind_sql = _get_check_sql(PresentationAsset, "ck_presentation_assets_kind")
+        status_sql = _get_check_sql(PresentationAsset, "ck_presentation_assets_status")
+        assert all(f"'{kind.value}'" in kind_sql for kind in AssetKind)
+        assert all(f"'{status.value}'" in status_sql for status in AssetStatus)
+
+    def test_web_cache_provider_matches_providers(self):
+        from app.models.web_cache import WebCache
+        from app.services.web_search import _PROVIDERS
+
+        sql = _get_check_sql(WebCache, "ck_web_cache_provider")
+        for provider in _PROVIDERS:
+            assert f"'{provider}'" in sql
+
+
+class TestContactSearchIndex:
+    """Contact full-text search must hit the ix_contacts_search expression index."""
+
+    def test_index_covers_search_expression(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.contact import Contact, contact_search_vector
+
+        dialect = postgresql.dialect()
+        index = next(i for i in Contact.__table__.indexes if i.name == "ix_contacts_search")
+        assert str(index.expressions[0].compile(dialect=dialect)) == str(
+            contact_search_vector.compile(dialect=dialect)
+        )
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+
+    def test_search_expression_has_no_bound_parameters(self):
+        """Bound config/weight parameters would stop the planner matching the index."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.contact import CONTACT_SEARCH_CONFIG, contact_search_vector
+
+        compiled = contact_search_vector.compile(dialect=postgresql.dialect())
+        assert compiled.params == {}
+        assert f"'{CONTACT_SEARCH_CONFIG}'::regconfig" in str(compiled)
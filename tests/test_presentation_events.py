@@ -0,0 +1,84 @@
+"""Tests for the presentation /events fan-out (app.services.presentation_events)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services import presentation_events
+from app.services.presentation_events import PresentationEventHub
+
+
+class _FakePubSub:
+    """Pub/sub stand-in: messages are fed in by the test; an exception kills it."""
+
+    def __init__(self) -> None:
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.psubscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        while True:
+            item = await self.inbox.get()
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def publish(self, pres_id, data: bytes) -> None:
+        self.inbox.put_nowait(
+            {"channel": f"pres:{pres_id}:events".encode(), "data": data}
+        )
+
+
+@pytest.fixture
+def pubsub():
+    fake = _FakePubSub()
+    redis = MagicMock()
+    redis.pubsub.return_value = fake
+    redis.aclose = AsyncMock()
+    with patch.object(presentation_events.aioredis.Redis, "from_url", return_value=redis):
+        yield fake
+
+
+class TestPresentationEventHub:
+    async def test_fans_out_on_one_subscription(self, pubsub):
+        hub = PresentationEventHub()
+        pres_id, other_id = uuid4(), uuid4()
+
+        async with hub.subscribe(pres_id) as a, hub.subscribe(pres_id) as b, \
+                hub.subscribe(other_id) as c:
+            pubsub.publish(pres_id, b"frame")
+            assert await asyncio.wait_for(a.get(), 1) == b"frame"
+            assert await asyncio.wait_for(b.get(), 1) == b"frame"
+            assert c.empty()
+
+        pubsub.psubscribe.assert_awaited_once()
+        await hub.aclose()
+
+    async def test_subscriber_failure_ends_streams_and_restarts(self, pubsub):
+        hub = PresentationEventHub()
+        pres_id = uuid4()
+
+        async with hub.subscribe(pres_id) as queue:
+            pubsub.inbox.put_nowait(ConnectionError("reset by peer"))
+            # The stream is told right away instead of waiting for a heartbeat
+            assert await asyncio.wait_for(queue.get(), 1) is None
+
+        async with hub.subscribe(pres_id):
+            assert pubsub.psubscribe.await_count == 2
+        await hub.aclose()
+
+    async def test_slow_client_is_dropped(self, pubsub):
+        hub = PresentationEventHub(queue_maxsize=2)
+        pres_id = uuid4()
+
+        async with hub.subscribe(pres_id) as queue:
+            for i in range(3):
+                pubsub.publish(pres_id, b"%d" % i)
+            await asyncio.sleep(0.01)
+
+            frames = [queue.get_nowait() for _ in range(queue.qsize())]
+            assert frames[-1] is None
+
+        await hub.aclose()
@@ -0,0 +1,62 @@
+"""Tests for the uploads section (app.api.v1.uploads)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1 import uploads
+from tests.conftest import TENANT_A_ID, mock_db
+
+
+def _doc_result(document):
+    result = MagicMock()
+    result.unique.return_value.scalar_one_or_none.return_value = document
+    return result
+
+
+def _id_result(collection_id):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = collection_id
+    return result
+
+
+@pytest.fixture(autouse=True)
+def _clear_uploads_collection_cache():
+    uploads._uploads_collection_ids.clear()
+    yield
+    uploads._uploads_collection_ids.clear()
+
+
+class TestUploadsCollectionCache:
+    async def test_stale_cached_id_is_rechecked_once(self):
+        """Another process recreated __uploads__: the dead cached id must not 404."""
+        stale_id, fresh_id = uuid4(), uuid4()
+        document = SimpleNamespace(id=uuid4(), collection_id=fresh_id)
+        uploads._remember_uploads_collection(TENANT_A_ID, stale_id)
+
+        db = mock_db()
+        db.execute.side_effect = [
+            _doc_result(None),       # lookup under the stale id
+            _id_result(fresh_id),    # re-resolve __uploads__
+            _doc_result(document),   # lookup under the fresh id
+        ]
+
+        found = await uploads._get_upload_document(document.id, TENANT_A_ID, db)
+
+        assert found is document
+        assert uploads._uploads_collection_ids[TENANT_A_ID] == fresh_id
+
+    async def test_missing_document_under_current_id_is_404(self):
+        collection_id = uuid4()
+        uploads._remember_uploads_collection(TENANT_A_ID, collection_id)
+
+        db = mock_db()
+        db.execute.side_effect = [_doc_result(None), _id_result(collection_id)]
+
+        with pytest.raises(uploads.HTTPException) as exc_info:
+            await uploads._get_upload_document(uuid4(), TENANT_A_ID, db)
+
+        assert exc_info.value.status_code == 404
+        assert db.execute.await_count == 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -78,10 +79,11 @@ class TestQueryHash:
         h2 = _query_hash("test query")
         assert h1 == h2
 
-    def test_is_sha256(self):
+    def test_is_sha256_digest(self):
         h = _query_hash("hello")
-        assert len(h) == 64
-        assert all(c in "0123456789abcdef" for c in h)
+        assert isinstance(h, bytes)
+        assert len(h) == 32
+        assert h == hashlib.sha256(b"hello").digest()
 
 
 # ── RRF merge with web results ───────────────────────────────────